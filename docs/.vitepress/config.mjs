@@ -103,6 +103,7 @@ export default defineConfig({
           items: [
             { text: 'Queuing', link: '/api/queuing' },
             { text: 'Staffing', link: '/api/staffing' },
+            { text: 'Simulation', link: '/api/simulation' },
             { text: 'Scheduling', link: '/api/scheduling' },
             { text: 'Rostering', link: '/api/rostering' },
             { text: 'Shifts', link: '/api/shifts' },
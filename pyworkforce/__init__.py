@@ -1,6 +1,6 @@
 from ._version import __version__
 from .breaks import BreakScheduler
-from .queuing import ErlangA, ErlangB, ErlangC, MultiErlangA, MultiErlangB, MultiErlangC
+from .queuing import ErlangA, ErlangB, ErlangC, ErlangX, MultiErlangA, MultiErlangB, MultiErlangC
 from .rostering import MinHoursRoster
 from .scheduling import MinAbsDifference, MinRequiredResources
 from .staffing import MultiSkillStaffing
@@ -9,6 +9,7 @@ __all__ = [
     "ErlangC",
     "ErlangA",
     "ErlangB",
+    "ErlangX",
     "MultiErlangC",
     "MultiErlangA",
     "MultiErlangB",
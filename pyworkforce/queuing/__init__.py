@@ -1,5 +1,9 @@
 from pyworkforce.queuing.abandonment import ErlangA, MultiErlangA
 from pyworkforce.queuing.erlang import ErlangC, MultiErlangC
 from pyworkforce.queuing.erlang_b import ErlangB, MultiErlangB
+from pyworkforce.queuing.erlang_x import ErlangX
+from pyworkforce.queuing.profile import StaffingProfile
+from pyworkforce.queuing.tables import ErlangTable
 
-__all__ = ["ErlangC", "MultiErlangC", "ErlangA", "MultiErlangA", "ErlangB", "MultiErlangB"]
+__all__ = ["ErlangC", "MultiErlangC", "ErlangA", "MultiErlangA", "ErlangB", "MultiErlangB", "ErlangX",
+           "ErlangTable", "StaffingProfile"]
@@ -0,0 +1,209 @@
+"""Vectorized NumPy kernels shared by the queuing estimators.
+
+The scalar estimators (:class:`~pyworkforce.queuing.ErlangC`,
+:class:`~pyworkforce.queuing.ErlangB`) evaluate one scenario at a time. The
+functions in this module evaluate the same formulas over whole arrays of
+scenarios in a single pass: the Erlang B recursion is advanced one position at
+a time for every scenario simultaneously, so the interpreter overhead is paid
+once per position instead of once per position *and* scenario.
+
+All functions broadcast their inputs against each other and return arrays of
+the broadcast shape. Inputs are assumed to be validated by the caller.
+"""
+
+from math import erfc, lgamma
+
+import numpy as np
+
+_erfc = np.vectorize(erfc, otypes=[float])
+_lgamma = np.vectorize(lgamma, otypes=[float])
+
+
+def erlang_b(intensity, positions):
+    """Erlang B blocking probability ``B(positions, intensity)``.
+
+    Uses the numerically stable recursion
+    ``B(n, A) = A * B(n-1, A) / (n + A * B(n-1, A))`` with ``B(0, A) = 1``.
+
+    Parameters
+    ----------
+    intensity : array-like of float
+        Offered traffic in Erlangs.
+    positions : array-like of int
+        Number of servers, ``>= 0``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Blocking probabilities, with the broadcast shape of the inputs.
+    """
+    intensity, positions = np.broadcast_arrays(np.asarray(intensity, dtype=float),
+                                               np.asarray(positions, dtype=np.int64))
+    shape = intensity.shape
+    intensity = intensity.ravel()
+    positions = positions.ravel()
+
+    # Sort by positions so the scenarios still recursing always form a suffix.
+    order = np.argsort(positions, kind="stable")
+    sorted_positions = positions[order]
+    sorted_intensity = intensity[order]
+    blocking = np.ones(len(positions))
+
+    max_positions = int(sorted_positions[-1]) if len(sorted_positions) else 0
+    for n in range(1, max_positions + 1):
+        start = np.searchsorted(sorted_positions, n, side="left")
+        a = sorted_intensity[start:]
+        b = blocking[start:]
+        blocking[start:] = a * b / (n + a * b)
+
+    result = np.empty(len(positions))
+    result[order] = blocking
+    return result.reshape(shape)
+
+
+def erlang_b_max_intensity(positions, max_blocking, tolerance=1e-10, max_iter=100):
+    """Largest offered traffic ``A`` with ``B(positions, A) <= max_blocking``.
+
+    Solves ``log B(c, A) = log(max_blocking)`` in ``log A`` with Newton's
+    method. The derivative comes for free with the recursion value,
+    ``d log B / d log A = c - A * (1 - B)``, so each iteration costs one
+    Erlang B pass over the scenarios that have not converged yet. Steps are
+    safeguarded by the bracket
+
+    ``(max_blocking * c!) ** (1 / c) <= A <= c / (1 - max_blocking)``
+
+    (from ``B <= A**c / c!`` and ``A * (1 - B) <= c``), falling back to
+    bisection when a step leaves it. The starting point inverts the
+    Halfin-Whitt approximation ``B ~ phi(beta) / (sqrt(A) * Phi(beta))``, which
+    is cheap and usually leaves two or three exact iterations.
+
+    Parameters
+    ----------
+    positions : array-like of int
+        Number of servers, ``>= 1``.
+    max_blocking : array-like of float
+        Blocking target, in ``(0, 1)``.
+
+    Returns
+    -------
+    numpy.ndarray
+        Offered traffic in Erlangs, with the broadcast shape of the inputs.
+    """
+    positions, max_blocking = np.broadcast_arrays(np.asarray(positions, dtype=np.int64),
+                                                  np.asarray(max_blocking, dtype=float))
+    shape = positions.shape
+    servers = positions.ravel().astype(float)
+    log_target = np.log(max_blocking.ravel())
+
+    low = (log_target + _lgamma(servers + 1)) / servers
+    high = np.log(servers / (1 - max_blocking.ravel()))
+
+    # Starting point: bisect the Halfin-Whitt approximation inside the bracket.
+    guess_low, guess_high = low.copy(), high.copy()
+    for _ in range(30):
+        middle = 0.5 * (guess_low + guess_high)
+        intensity = np.exp(middle)
+        beta = (servers - intensity) / np.sqrt(intensity)
+        with np.errstate(divide="ignore"):  # Phi(beta) underflows for heavy overload
+            log_b = (-beta ** 2 / 2 - 0.5 * np.log(2 * np.pi * intensity)
+                     - np.log(0.5 * _erfc(-beta / np.sqrt(2))))
+        above = log_b > log_target
+        guess_high = np.where(above, middle, guess_high)
+        guess_low = np.where(above, guess_low, middle)
+    log_intensity = 0.5 * (guess_low + guess_high)
+
+    result = np.empty(len(servers))
+    active = np.arange(len(servers))
+    for _ in range(max_iter):
+        if not len(active):
+            break
+        x = log_intensity[active]
+        c = servers[active]
+        intensity = np.exp(x)
+        blocking = erlang_b(intensity, c.astype(np.int64))
+        residual = np.log(blocking) - log_target[active]
+
+        above = residual > 0
+        high[active] = np.where(above, x, high[active])
+        low[active] = np.where(above, low[active], x)
+
+        done = (np.abs(residual) < tolerance) | (high[active] - low[active] < 1e-15)
+        result[active[done]] = intensity[done]
+
+        step = x - residual / (c - intensity * (1 - blocking))
+        inside = (step > low[active]) & (step < high[active])
+        log_intensity[active] = np.where(inside, step, 0.5 * (low[active] + high[active]))
+        active = active[~done]
+
+    result[active] = np.exp(log_intensity[active])  # pragma: no cover - max_iter safety guard
+    return result.reshape(shape)
+
+
+def erlang_c_from_b(intensity, positions, blocking):
+    """Erlang C waiting probability from the Erlang B value at the same point."""
+    return positions * blocking / (positions - intensity * (1 - blocking))
+
+
+def erlang_c_service_level(intensity, positions, waiting_probability, asa_aht):
+    """Erlang C service level given the waiting probability and ``asa / aht``."""
+    return np.maximum(0, 1 - waiting_probability * np.exp(-(positions - intensity) * asa_aht))
+
+
+def erlang_c(intensity, positions):
+    """Erlang C waiting probability for stable systems (``positions > intensity``)."""
+    intensity = np.asarray(intensity, dtype=float)
+    positions = np.asarray(positions, dtype=np.int64)
+    return erlang_c_from_b(intensity, positions, erlang_b(intensity, positions))
+
+
+def erlang_c_required_positions(intensity, asa_aht, service_level, max_occupancy, shrinkage):
+    """Vectorized counterpart of :meth:`ErlangC.required_positions`.
+
+    Every scenario starts its search at ``round(intensity + 1)`` and stops at
+    the first position whose service level meets the target. The Erlang B
+    recursion is carried forward for all scenarios at once, so the total cost
+    is proportional to the largest number of positions found.
+
+    Returns
+    -------
+    dict of numpy.ndarray
+        ``raw_positions``, ``positions``, ``service_level``, ``occupancy`` and
+        ``waiting_probability``, one entry per scenario.
+    """
+    intensity, asa_aht, service_level, max_occupancy, shrinkage = (
+        arr.ravel().astype(float) for arr in np.broadcast_arrays(
+            intensity, asa_aht, service_level, max_occupancy, shrinkage))
+    size = len(intensity)
+
+    start = np.round(intensity + 1).astype(np.int64)
+    found = np.zeros(size, dtype=np.int64)
+    pending = np.ones(size, dtype=bool)
+    blocking = np.ones(size)
+
+    n = 0
+    while pending.any():
+        n += 1
+        blocking = np.where(pending, intensity * blocking / (n + intensity * blocking), blocking)
+        candidates = pending & (n >= start)
+        if not candidates.any():
+            continue
+        a = intensity[candidates]
+        wait = erlang_c_from_b(a, n, blocking[candidates])
+        achieved = erlang_c_service_level(a, n, wait, asa_aht[candidates])
+        met = np.zeros(size, dtype=bool)
+        met[candidates] = achieved >= service_level[candidates]
+        found[met] = n
+        pending &= ~met
+
+    raw_positions = found
+    over_occupied = intensity / raw_positions > max_occupancy
+    raw_positions = np.where(over_occupied, np.ceil(intensity / max_occupancy), raw_positions).astype(np.int64)
+
+    waiting_probability = erlang_c(intensity, raw_positions)
+    return {
+        "raw_positions": raw_positions,
+        "positions": np.ceil(raw_positions / (1 - shrinkage)).astype(np.int64),
+        "service_level": erlang_c_service_level(intensity, raw_positions, waiting_probability, asa_aht),
+        "occupancy": intensity / raw_positions,
+        "waiting_probability": waiting_probability,
+    }
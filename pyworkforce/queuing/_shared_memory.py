@@ -0,0 +1,194 @@
+"""Shared-memory evaluation of ``Multi*`` grids on a single machine.
+
+The joblib backend pickles every block of parameter dictionaries on the way to
+the workers and every block of results on the way back. With
+``backend="shared_memory"`` the scenario table is instead written once into a
+:mod:`multiprocessing.shared_memory` segment as a float64 array, and the
+results are written by the workers straight into a second, preallocated
+segment. Each joblib task only carries the segment names and a range of
+combination indices.
+
+Parameters that are not numbers (such as ``ErlangC(method=...)``) are stored
+as category codes. Results must be numbers, or dictionaries of numbers with
+the same keys for every combination.
+"""
+
+import sys
+from multiprocessing.shared_memory import SharedMemory
+from numbers import Integral, Real
+
+import numpy as np
+from joblib import Parallel, delayed
+
+# Column kinds of the scenario table and of the results.
+_BOOL, _INT, _FLOAT, _CATEGORY = "bool", "int", "float", "category"
+
+
+def _kind(values):
+    """Storage kind for a column of parameter or result values."""
+    if all(isinstance(value, bool) for value in values):
+        return _BOOL
+    if all(isinstance(value, Integral) and not isinstance(value, bool) for value in values):
+        return _INT
+    if all(isinstance(value, Real) and not isinstance(value, bool) for value in values):
+        return _FLOAT
+    return _CATEGORY
+
+
+def _encode_table(dicts):
+    """Encode a list of parameter dictionaries as a ``(columns, rows)`` float array.
+
+    Returns
+    -------
+    tuple(numpy.ndarray, list)
+        The table and, for each column, a ``(name, kind, categories)`` tuple.
+        Category codes of ``-1`` mark parameters missing from a dictionary.
+    """
+    names = list(dict.fromkeys(name for params in dicts for name in params))
+    table = np.empty((len(names), len(dicts)))
+    spec = []
+    for column, name in enumerate(names):
+        values = [params.get(name, None) for params in dicts]
+        kind = _kind(values) if all(name in params for params in dicts) else _CATEGORY
+        categories = None
+        if kind == _CATEGORY:
+            index = {}
+            values = [index.setdefault(params[name], len(index)) if name in params else -1
+                      for params in dicts]
+            categories = list(index)
+        table[column] = values
+        spec.append((name, kind, categories))
+    return table, spec
+
+
+def _decode_row(table, spec, row):
+    params = {}
+    for column, (name, kind, categories) in enumerate(spec):
+        value = table[column, row]
+        if kind == _CATEGORY:
+            if value >= 0:
+                params[name] = categories[int(value)]
+        elif kind == _FLOAT:
+            params[name] = float(value)
+        elif kind == _INT:
+            params[name] = int(value)
+        else:
+            params[name] = bool(value)
+    return params
+
+
+def _result_spec(result):
+    """Output keys (``None`` for scalar results) and the kind of each output row."""
+    if isinstance(result, dict):
+        keys, values = list(result), list(result.values())
+    else:
+        keys, values = None, [result]
+    kinds = [_kind([value]) for value in values]
+    if _CATEGORY in kinds:
+        raise ValueError(f"the shared_memory backend requires numeric results, got {result!r}")
+    return keys, kinds
+
+
+def _output_column(values, kind):
+    """Cast a float output row back to the kind of the first result.
+
+    Results are only known to the workers, so a method returning an integer
+    for the first combination and floats later keeps the float row.
+    """
+    if kind == _FLOAT or not np.array_equal(values, np.round(values)):
+        return values
+    if kind == _BOOL and np.isin(values, (0, 1)).all():
+        return values.astype(bool)
+    return values.astype(np.int64)
+
+
+def _create(shape):
+    segment = SharedMemory(create=True, size=max(1, int(np.prod(shape)) * 8))
+    return segment, np.ndarray(shape, dtype=float, buffer=segment.buf)
+
+
+def _attach(name):
+    """Open an existing segment; only the process that created it unlinks it.
+
+    Before Python 3.13 attaching registers the segment again with the resource
+    tracker. joblib workers share the tracker of the process that started
+    them, where the segment is already registered, so that is harmless.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    return SharedMemory(name=name)
+
+
+def _evaluate_rows(estimator, method_name, table_info, arguments_list, output_info, start, stop):
+    """Evaluate combinations ``start:stop`` and write them into the output segment.
+
+    Combination ``i`` pairs row ``i // len(arguments_list)`` of the scenario
+    table with argument set ``i % len(arguments_list)``, the order of the
+    joblib backend.
+    """
+    # Imported here: the base module imports this one.
+    from pyworkforce.queuing.base import _evaluate_run
+
+    table_name, table_shape, spec = table_info
+    output_name, output_shape, keys = output_info
+    table_segment, output_segment = _attach(table_name), _attach(output_name)
+    try:
+        table = np.ndarray(table_shape, dtype=float, buffer=table_segment.buf)
+        output = np.ndarray(output_shape, dtype=float, buffer=output_segment.buf)
+        n_arguments = len(arguments_list)
+        for row in range(start // n_arguments, (stop - 1) // n_arguments + 1):
+            low, high = max(start, row * n_arguments), min(stop, (row + 1) * n_arguments)
+            erlang = estimator(**_decode_row(table, spec, row))
+            results = _evaluate_run(erlang, method_name,
+                                    arguments_list[low - row * n_arguments:high - row * n_arguments])
+            for index, result in enumerate(results, start=low):
+                if keys is None:
+                    output[0, index] = result
+                else:
+                    output[:, index] = [result[key] for key in keys]
+    finally:
+        # Views must be released before the segments can be closed.
+        table = output = None
+        table_segment.close()
+        output_segment.close()
+
+
+def solve_shared_memory(estimator, method_name, param_list, arguments_list, batch_size, n_jobs=2,
+                        pre_dispatch="2 * n_jobs"):
+    """Evaluate every combination of both lists through shared memory.
+
+    Each joblib task evaluates ``batch_size`` consecutive combinations.
+
+    Returns
+    -------
+    numpy.ndarray or dict of numpy.ndarray
+        One value per combination, in the joblib result order; a dict of
+        columns when the method returns dictionaries.
+    """
+    combinations = len(param_list) * len(arguments_list)
+    if not combinations:
+        return np.empty(0)
+    # The first result, computed here, fixes the layout of the output segment
+    # and the kinds its rows are cast back to when every value allows it.
+    keys, kinds = _result_spec(getattr(estimator(**param_list[0]), method_name)(**arguments_list[0]))
+
+    table, spec = _encode_table(param_list)
+    table_segment, shared_table = _create(table.shape)
+    output_segment, output = _create((len(kinds), combinations))
+    try:
+        shared_table[:] = table
+        table_info = (table_segment.name, table.shape, spec)
+        output_info = (output_segment.name, output.shape, keys)
+        Parallel(n_jobs=n_jobs, pre_dispatch=pre_dispatch)(
+            delayed(_evaluate_rows)(estimator, method_name, table_info, arguments_list, output_info,
+                                    start, min(start + batch_size, combinations))
+            for start in range(0, combinations, batch_size))
+        columns = [_output_column(output[row].copy(), kind) for row, kind in enumerate(kinds)]
+    finally:
+        shared_table = output = None
+        table_segment.close()
+        table_segment.unlink()
+        output_segment.close()
+        output_segment.unlink()
+
+    return columns[0] if keys is None else dict(zip(keys, columns, strict=True))
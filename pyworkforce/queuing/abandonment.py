@@ -8,18 +8,141 @@ after an exponentially distributed patience time with mean ``patience``.
 All performance metrics are computed exactly from the stationary distribution
 of the underlying birth-death Markov chain, so there is no reliance on
 closed-form approximations. The chain is positive recurrent for any load
-because abandonment keeps the queue finite; the state space is truncated once
-the tail probability is negligible.
+because abandonment keeps the queue finite; the state space is truncated where
+a tail bound guarantees the remaining probability is negligible.
 """
 
-from math import ceil, exp
+from collections import OrderedDict
+from math import ceil, log, sqrt
 
-from joblib import Parallel, delayed
+import numpy as np
 
 from pyworkforce.base import BaseWorkforce
-from pyworkforce.utils import ParameterGrid
+from pyworkforce.queuing.base import (
+    BaseMultiErlang,
+    _check_backend,
+    _check_batch_size,
+    _check_output,
+    _param_list,
+    _search_order,
+)
+from pyworkforce.queuing.erlang import ErlangC
 from pyworkforce.utils.validation import check_in_range, check_positive_float
 
+# Relative probability mass allowed beyond the truncation point.
+_TAIL_TOLERANCE = 1e-16
+# Hard cap on the number of queue states, far beyond any practical queue.
+_MAX_QUEUE_STATES = 100000
+# Number of staffing levels whose metrics each ErlangA instance keeps.
+_METRICS_CACHE_SIZE = 32
+
+
+def _lru_get(cache, key, compute):
+    """Return ``cache[key]``, computing and storing it (LRU-evicted) when missing."""
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache[key] = value
+        if len(cache) > _METRICS_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return value
+
+
+def _birth_death_distribution(birth_rate, death_rates):
+    """Normalized stationary distribution of a birth-death chain.
+
+    ``p[n] / p[n - 1] = birth_rate / death_rates[n - 1]``. The products are
+    accumulated as a cumulative sum of logarithms, so no rescaling is needed
+    for heavy traffic.
+    """
+    log_terms = np.empty(len(death_rates) + 1)
+    log_terms[0] = 0.0
+    np.cumsum(np.log(birth_rate / death_rates), out=log_terms[1:])
+    probs = np.exp(log_terms - log_terms.max())
+    return probs / probs.sum()
+
+
+def _served_within(service_rate, abandonment_rate, max_ahead, t):
+    """Return ``G[j]`` = P(tagged customer with ``j`` ahead is served by ``t``).
+
+    ``service_rate`` is the total rate ``c * mu`` at which busy positions
+    free up and ``abandonment_rate`` the per-customer rate ``theta``. From
+    queue position ``i`` the tagged customer leaves at total rate
+    ``nu_i = c * mu + (i + 1) * theta``: it advances (or, at ``i = 0``, is
+    served) with probability ``(c * mu + i * theta) / nu_i`` and abandons
+    otherwise. The holding times do not depend on which event happens, so
+
+    ``G[j] = c * mu / (c * mu + (j + 1) * theta) * P(S_j <= t)``
+
+    where the product of advance probabilities telescopes and
+    ``S_j = sum(Exp(nu_i), i = 0..j)``. The rates are equally spaced, which
+    makes ``S_j`` an order statistic of exponentials:
+    ``P(S_j <= t) = I_x(j + 1, b)`` with ``x = 1 - exp(-theta * t)`` and
+    ``b = (c * mu + theta) / theta``. For an integer first argument the
+    regularized incomplete beta is one minus a negative binomial cumulative
+    sum, so every ``G[j]`` comes from a single cumulative sum evaluated in log
+    space.
+    """
+    ahead = np.arange(max_ahead + 1)
+    b = (service_rate + abandonment_rate) / abandonment_rate
+    log_x = log(-np.expm1(-abandonment_rate * t))
+
+    # log of the negative binomial terms C(b + k - 1, k) * x**k * (1 - x)**b.
+    log_terms = np.empty(max_ahead + 1)
+    log_terms[0] = -(service_rate + abandonment_rate) * t
+    np.cumsum(np.log((b + ahead[1:] - 1) / ahead[1:]) + log_x, out=log_terms[1:])
+    log_terms[1:] += log_terms[0]
+
+    served_by_t = np.clip(1 - np.cumsum(np.exp(log_terms)), 0, 1)
+    return service_rate / (service_rate + (ahead + 1) * abandonment_rate) * served_by_t
+
+
+def _smallest_feasible_positions(meets_targets, intensity, transactions, aht, asa, interval, service_level,
+                                 max_occupancy, lowest=1):
+    """Smallest number of positions for which ``meets_targets`` holds.
+
+    Every target is monotone in the number of positions, so the smallest
+    feasible staffing is bracketed around the Erlang C answer for the same
+    traffic, which is cheap and usually within a few positions, with doubling
+    steps and then bisected. Positions below ``intensity``, or below
+    ``lowest`` when the answer is known to be at least that, are not
+    considered.
+    """
+    lowest = max(lowest, int(ceil(intensity)))
+    guard = intensity + 100000
+    seed = ErlangC(transactions=transactions, aht=aht, asa=asa,
+                   interval=interval).required_positions(service_level, max_occupancy)["raw_positions"]
+    seed = int(min(max(lowest, seed), guard))
+
+    step = 1
+    if meets_targets(seed):
+        infeasible, feasible = lowest - 1, seed
+        while feasible - step >= lowest:
+            if not meets_targets(feasible - step):
+                infeasible = feasible - step
+                break
+            feasible -= step
+            step *= 2
+    else:
+        infeasible, feasible = seed, None
+        while feasible is None:
+            candidate = infeasible + step
+            if candidate > guard or meets_targets(candidate):  # guard: safety stop
+                feasible = candidate
+            else:
+                infeasible = candidate
+                step *= 2
+
+    while feasible - infeasible > 1:
+        middle = (infeasible + feasible) // 2
+        if meets_targets(middle):
+            feasible = middle
+        else:
+            infeasible = middle
+    return feasible
+
 
 class ErlangA(BaseWorkforce):
     """
@@ -85,48 +208,80 @@ class ErlangA(BaseWorkforce):
         self.abandonment_rate = 1.0 / patience
         self.intensity = self.arrival_rate / self.service_rate
 
-    def _stationary_distribution(self, positions):
-        """Return the normalized stationary distribution ``p[n]`` for ``c`` servers.
+        # Metrics are cached per staffing level so that every public method,
+        # and each step of required_positions, builds a distribution once.
+        self._metrics_cache = OrderedDict()
+        self._service_level_cache = OrderedDict()
 
-        The birth-death chain has birth rate ``arrival_rate`` and death rate
-        ``min(n, c) * service_rate + max(n - c, 0) * abandonment_rate``. The
-        state space is grown until the unnormalized tail is negligible.
+    def _sufficient_statistics(self):
+        """Values that determine every result up to shrinkage; equal values give identical results."""
+        return self.arrival_rate, self.aht, self.patience, self.asa
+
+    def _queue_truncation(self, positions):
+        """Number of queue states ``K`` whose tail beyond is below ``_TAIL_TOLERANCE``.
+
+        With ``a[k] = p[c + k] / p[c] = prod(lam / (c * mu + i * theta), i = 1..k)``
+        two bounds apply:
+
+        * if ``rho = lam / (c * mu) < 1``, ``a[k] <= rho ** k`` (geometric tail);
+        * past the mode ``k* = ceil((lam - c * mu) / theta)`` every ratio is at
+          most ``1 / (1 + j / m)`` with ``m = lam / theta``, so the tail after
+          ``k* + j`` is at most ``2 ** (-j * (j + 1) / (2 * m)) * (1 + m / j)``
+          for ``j <= m`` and halves at each step beyond ``m``.
+
+        The smaller of the resulting truncation points is used, the first
+        bound only where its ``j`` stays within ``m``.
         """
         c = positions
         lam = self.arrival_rate
         mu = self.service_rate
         theta = self.abandonment_rate
+        log_tolerance = log(_TAIL_TOLERANCE)
 
-        probs = [1.0]
-        total = 1.0
-        n = 0
-        # Grow the chain until the newest term is a negligible fraction of the
-        # accumulated mass (and we are safely beyond the number of servers).
-        while True:
-            n += 1
-            death_rate = (n if n <= c else c) * mu + (max(n - c, 0)) * theta
-            term = probs[-1] * lam / death_rate
-            probs.append(term)
-            total += term
-            if n > c and term < 1e-15 * total:
-                break
-            if n > c + 100000:  # pragma: no cover - safety guard, should never trigger
-                break
-            # Rescale to avoid overflow for very heavy traffic.
-            if probs[-1] > 1e250:  # pragma: no cover - overflow guard for extreme load
-                probs = [p / 1e250 for p in probs]
-                total /= 1e250
+        m = lam / theta
+        mode = max(0, ceil((lam - c * mu) / theta))
+        spread = ceil(m) + ceil((log(2) - log_tolerance) / log(2))
+        j = ceil(sqrt(2 * m * (log(1 + m) - log_tolerance) / log(2)))
+        if j <= m:
+            spread = min(spread, j + 1)
+        truncation = mode + spread
 
-        norm = sum(probs)
-        return [p / norm for p in probs]
+        rho = lam / (c * mu)
+        if rho < 1:
+            truncation = min(truncation, ceil((log_tolerance + log(1 - rho)) / log(rho)))
+
+        return min(truncation, _MAX_QUEUE_STATES)
+
+    def _stationary_distribution(self, positions):
+        """Return the normalized stationary distribution ``p[n]`` for ``c`` servers.
+
+        The birth-death chain has birth rate ``arrival_rate`` and death rate
+        ``min(n, c) * service_rate + max(n - c, 0) * abandonment_rate``. It is
+        truncated ``K`` states past ``c``, where ``K`` comes from the tail
+        bound in :meth:`_queue_truncation`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Probabilities of states ``0 .. c + K``.
+        """
+        c = positions
+        states = np.arange(1, c + self._queue_truncation(c) + 1)
+        death_rates = (np.minimum(states, c) * self.service_rate
+                       + np.maximum(states - c, 0) * self.abandonment_rate)
+        return _birth_death_distribution(self.arrival_rate, death_rates)
 
     def _metrics(self, positions):
+        """Core stationary metrics for ``positions`` servers, cached per instance."""
+        return _lru_get(self._metrics_cache, positions, lambda: self._compute_metrics(positions))
+
+    def _compute_metrics(self, positions):
         """Compute the core stationary metrics for ``positions`` servers."""
         c = positions
         probs = self._stationary_distribution(c)
 
-        wait_probability = sum(probs[n] for n in range(c, len(probs)))
-        queue_length = sum((n - c) * probs[n] for n in range(c, len(probs)))
+        wait_probability = float(probs[c:].sum())
+        queue_length = float(np.arange(len(probs) - c) @ probs[c:])
         abandonment_probability = (self.abandonment_rate * queue_length) / self.arrival_rate
         throughput = self.arrival_rate * (1 - abandonment_probability)
         occupancy = throughput / (c * self.service_rate)
@@ -203,8 +358,9 @@ class ErlangA(BaseWorkforce):
         transactions, the probability of being served within ``asa`` is computed
         exactly from the tagged-customer absorbing Markov chain (a customer in
         queue position ``j`` advances at rate ``c * service_rate + j *
-        abandonment_rate`` and abandons at rate ``abandonment_rate``) using
-        uniformization.
+        abandonment_rate`` and abandons at rate ``abandonment_rate``), whose
+        absorption probabilities have a closed form in terms of the incomplete
+        beta function.
 
         Parameters
         ----------
@@ -218,96 +374,162 @@ class ErlangA(BaseWorkforce):
         if asa is None:
             asa = self.asa
         check_positive_float("asa", asa)
+        return self._service_level(positions, asa)
 
-        c = positions
+    def _service_level(self, positions, asa):
+        """Service level for validated inputs, cached per ``(positions, asa)``."""
+        return _lru_get(self._service_level_cache, (positions, asa),
+                        lambda: self._compute_service_level(positions, asa))
+
+    def _compute_service_level(self, c, asa):
         metrics = self._metrics(c)
         probs = metrics["probs"]
 
-        served_immediately = sum(probs[:c])
-        delayed_states = list(range(c, len(probs)))
-        if not delayed_states:  # pragma: no cover - the chain always extends past c
-            return served_immediately
-
+        served_immediately = probs[:c].sum()
         max_ahead = len(probs) - 1 - c  # maximum queue position a customer can take
-        served_within = self._delayed_served_within(c, max_ahead, asa)
+        served_within = _served_within(c * self.service_rate, self.abandonment_rate, max_ahead, asa)
+        delayed_served = probs[c:] @ served_within
 
-        delayed_served = 0.0
-        for n in delayed_states:
-            ahead = n - c
-            delayed_served += probs[n] * served_within[ahead]
+        return min(1.0, float(served_immediately + delayed_served))
 
-        return min(1.0, served_immediately + delayed_served)
+    def evaluate(self, positions: int, asa: float = None):
+        """All performance metrics for ``positions`` from a single distribution.
 
-    def _delayed_served_within(self, c, max_ahead, t):
-        """Return ``G[j]`` = P(tagged customer with ``j`` ahead is served by ``t``).
+        Parameters
+        ----------
+        positions: int,
+            Number of available positions (servers).
+        asa: float, optional
+            Target answer time in minutes for the service level. Defaults to
+            the construction ``asa``.
 
-        Uses uniformization of the tagged-customer CTMC with absorbing states
-        ``served`` and ``abandoned``.
+        Returns
+        -------
+        dict
+            Keys: ``service_level``, ``occupancy``, ``abandonment_probability``,
+            ``waiting_probability``, ``average_speed_of_answer`` and
+            ``average_queue_length``.
         """
-        mu = self.service_rate
-        states = max_ahead + 1  # j = 0 .. max_ahead
-
-        # Uniformization rate: maximum total outflow across transient states.
-        max_rate = c * mu + max_ahead * self.abandonment_rate + self.abandonment_rate
-        if max_rate <= 0:  # pragma: no cover - rates are always strictly positive
-            return [0.0] * states
-
-        # The tagged chain is lower-triangular (queue position only decreases),
-        # so we solve the transient absorption once per starting position.
-        served = [0.0] * states
-        for start in range(states):
-            served[start] = self._uniformized_served_prob(start, c, max_ahead, t, max_rate)
-        return served
-
-    def _uniformized_served_prob(self, start, c, max_ahead, t, max_rate):
-        """P(absorbed into 'served' by time ``t``) starting at queue position ``start``."""
-        mu = self.service_rate
-        theta = self.abandonment_rate
-        states = max_ahead + 1
-
-        # Distribution over transient states, plus accumulated absorbed-served mass.
-        dist = [0.0] * states
-        dist[start] = 1.0
-        served_mass = 0.0
-
-        lam_t = max_rate * t
-        # Poisson weights of the uniformized chain; truncate when tail is tiny.
-        # Number of steps: mean lam_t plus margin.
-        max_steps = int(lam_t + 10 * (lam_t ** 0.5) + 50)
-
-        poisson = exp(-lam_t)  # P(N = 0)
-        result = poisson * served_mass  # contribution from 0 jumps (no absorption yet)
-        for k in range(1, max_steps + 1):
-            # Advance the uniformized DTMC one step.
-            new_dist = [0.0] * states
-            for j in range(states):
-                pj = dist[j]
-                if pj == 0.0:
-                    continue
-                if j == 0:
-                    success_rate = c * mu
-                    abandon_rate = theta
-                    stay_rate = max_rate - success_rate - abandon_rate
-                    served_mass += pj * (success_rate / max_rate)
-                    # abandon mass is simply lost (absorbed into fail)
-                    new_dist[0] += pj * (stay_rate / max_rate)
-                else:
-                    advance_rate = c * mu + j * theta
-                    abandon_rate = theta
-                    stay_rate = max_rate - advance_rate - abandon_rate
-                    new_dist[j - 1] += pj * (advance_rate / max_rate)
-                    new_dist[j] += pj * (stay_rate / max_rate)
-            dist = new_dist
-
-            poisson *= lam_t / k  # P(N = k)
-            result += poisson * served_mass
-
-        return result
+        service_level = self.service_level(positions, asa=asa)
+        metrics = self._metrics(positions)
+        return {
+            "service_level": service_level,
+            "occupancy": metrics["occupancy"],
+            "abandonment_probability": metrics["abandonment_probability"],
+            "waiting_probability": metrics["waiting_probability"],
+            "average_speed_of_answer": metrics["average_speed_of_answer"],
+            "average_queue_length": metrics["average_queue_length"],
+        }
+
+    def sensitivity(self, positions: int, asa: float = None):
+        """Every metric of :meth:`evaluate` with its derivatives.
+
+        The stationary probabilities have the product form
+        ``p[n] ~ lam ** n / prod(death_rate[k], k <= n)``, so the derivative of
+        any expectation ``E[f(N)]`` is a covariance under the distribution that
+        :meth:`evaluate` already built: ``Cov(f(N), N) / lam`` in the arrival
+        rate and ``-Cov(f(N), h(N))`` in the service rate, with
+        ``h(n) = sum(min(k, c) / death_rate[k], k <= n)``. Only the answer
+        probabilities of delayed transactions, which depend on ``aht`` and
+        ``asa`` but not on the distribution, are differentiated by forward
+        differences. The effect of one more position is a forward difference
+        that reuses the cached metrics.
+
+        Parameters
+        ----------
+        positions: int,
+            Number of available positions (servers).
+        asa: float, optional
+            Target answer time in minutes for the service level. Defaults to
+            the construction ``asa``.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per key of :meth:`evaluate` with its ``value`` and the
+            columns:
+
+            - ``positions``: change from one more position.
+            - ``intensity``: derivative in the traffic intensity, with ``aht``,
+              ``patience`` and ``asa`` fixed. Multiply by ``0.01 * intensity``
+              for the effect of 1% more transactions.
+            - ``aht``: derivative in ``aht`` per minute, with the transactions
+              fixed.
+            - ``asa``: derivative in ``asa`` per minute.
+
+        Examples
+        --------
+        >>> from pyworkforce.queuing import ErlangA
+        >>> erlang = ErlangA(transactions=100, aht=3, asa=20 / 60, interval=30, patience=2)
+        >>> round(float(erlang.sensitivity(positions=12).loc["service_level", "positions"]), 3)
+        0.063
+        """
+        import pandas as pd
+
+        self._check_positions(positions)
+        if asa is None:
+            asa = self.asa
+        check_positive_float("asa", asa)
+
+        c = positions
+        lam, mu, theta = self.arrival_rate, self.service_rate, self.abandonment_rate
+        values = self.evaluate(c, asa=asa)
+        next_values = self.evaluate(c + 1, asa=asa)
+        probs = self._metrics(c)["probs"]
+
+        states = np.arange(len(probs))
+        queued = np.maximum(states - c, 0)
+        served_within = _served_within(c * mu, theta, len(probs) - 1 - c, asa)
+        answered = np.concatenate((np.ones(c), served_within))
+        death_rates = np.minimum(states[1:], c) * mu + queued[1:] * theta
+        service_share = np.concatenate(([0.0], np.cumsum(np.minimum(states[1:], c) / death_rates)))
+
+        def covariance(f, g):
+            return probs @ (f * (g - probs @ g))
+
+        # Derivatives of (waiting probability, queue length, service level) in lam and in mu.
+        statistics = (states >= c, queued, answered)
+        by_arrival = [covariance(f, states) / lam for f in statistics]
+        by_service = [-covariance(f, service_share) for f in statistics]
+        step = sqrt(np.finfo(float).eps)
+        rate_step = step * c * mu
+        by_service[2] += c * probs[c:] @ (
+            _served_within(c * mu + rate_step, theta, len(probs) - 1 - c, asa) - served_within) / rate_step
+        by_asa = probs[c:] @ (_served_within(c * mu, theta, len(probs) - 1 - c, asa + step * asa)
+                              - served_within) / (step * asa)
+
+        queue_length = values["average_queue_length"]
+
+        def derivatives(d_waiting, d_queue, d_service_level, d_lam, d_mu):
+            """Metric derivatives for a change of ``lam`` and ``mu`` at rates ``d_lam`` and ``d_mu``."""
+            d_answer = (d_queue * lam - queue_length * d_lam) / lam ** 2
+            return {
+                "service_level": d_service_level,
+                "occupancy": ((d_lam - theta * d_queue) * mu - (lam - theta * queue_length) * d_mu) / (c * mu ** 2),
+                "abandonment_probability": theta * d_answer,
+                "waiting_probability": d_waiting,
+                "average_speed_of_answer": d_answer,
+                "average_queue_length": d_queue,
+            }
+
+        # The intensity moves lam at rate mu; aht moves mu at rate -mu ** 2.
+        by_intensity = derivatives(*(mu * value for value in by_arrival), d_lam=mu, d_mu=0.0)
+        by_aht = derivatives(*(-mu ** 2 * value for value in by_service), d_lam=0.0, d_mu=-mu ** 2)
+        table = {
+            key: [value, next_values[key] - value, by_intensity[key], by_aht[key],
+                  by_asa if key == "service_level" else 0.0]
+            for key, value in values.items()
+        }
+        return pd.DataFrame.from_dict(table, orient="index", columns=["value", "positions", "intensity", "aht", "asa"])
 
     def required_positions(self, service_level: float, max_occupancy: float = 1.0,
                            max_abandonment: float = 1.0, asa: float = None):
         """Smallest number of positions meeting the target service level.
 
+        The search starts from the Erlang C staffing for the same targets,
+        brackets the answer with doubling steps and bisects it, so a sizing
+        usually needs only a handful of exact Erlang A evaluations.
+
         Parameters
         ----------
         service_level: float,
@@ -327,32 +549,48 @@ class ErlangA(BaseWorkforce):
             ``abandonment_probability``, ``waiting_probability`` and
             ``average_speed_of_answer``.
         """
+        return self._required_positions(service_level, max_occupancy, max_abandonment, asa)
+
+    def _required_positions_batch(self, arguments_list):
+        """:meth:`required_positions` for several argument sets, in their order.
+
+        Targets are visited by increasing service level and each search only
+        considers positions from the previous answer up, while the metrics
+        cache keeps the distributions it already built, so a whole curve of
+        targets costs about as much as its highest target.
+        """
+        results = [None] * len(arguments_list)
+        for group in _search_order(self.required_positions, arguments_list, "service_level"):
+            lowest = 1
+            for index, arguments in group:
+                results[index] = self._required_positions(**arguments, lowest=lowest)
+                lowest = results[index]["raw_positions"]
+        return results
+
+    def _required_positions(self, service_level, max_occupancy=1.0, max_abandonment=1.0, asa=None, lowest=1):
+        """:meth:`required_positions` knowing that at least ``lowest`` positions are needed."""
         check_in_range("service_level", service_level, 0, 1)
         check_in_range("max_occupancy", max_occupancy, 0, 1, include_low=False)
         check_in_range("max_abandonment", max_abandonment, 0, 1)
         if asa is None:
             asa = self.asa
+        check_positive_float("asa", asa)
 
-        positions = max(1, int(ceil(self.intensity)))
-        while True:
+        def meets_targets(positions):
             metrics = self._metrics(positions)
-            achieved_sl = self.service_level(positions, asa=asa)
-            if (achieved_sl >= service_level
+            return (self._service_level(positions, asa) >= service_level
                     and metrics["occupancy"] <= max_occupancy
-                    and metrics["abandonment_probability"] <= max_abandonment):
-                break
-            positions += 1
-            if positions > self.intensity + 100000:  # pragma: no cover - safety guard
-                break
+                    and metrics["abandonment_probability"] <= max_abandonment)
 
-        raw_positions = positions
+        raw_positions = _smallest_feasible_positions(meets_targets, self.intensity, self.transactions, self.aht,
+                                                     asa, self.interval, service_level, max_occupancy, lowest)
         scaled_positions = int(ceil(raw_positions / (1 - self.shrinkage)))
         metrics = self._metrics(raw_positions)
 
         return {
             "raw_positions": raw_positions,
             "positions": scaled_positions,
-            "service_level": self.service_level(raw_positions, asa=asa),
+            "service_level": self._service_level(raw_positions, asa),
             "occupancy": metrics["occupancy"],
             "abandonment_probability": metrics["abandonment_probability"],
             "waiting_probability": metrics["waiting_probability"],
@@ -365,7 +603,7 @@ class ErlangA(BaseWorkforce):
             raise ValueError(f"positions must be a positive integer, got {positions!r}")
 
 
-class MultiErlangA(BaseWorkforce):
+class MultiErlangA(BaseMultiErlang):
     """
     Runs Erlang A calculations over multiple parameter combinations.
 
@@ -382,11 +620,30 @@ class MultiErlangA(BaseWorkforce):
         to iterate over.
         example: {"transactions": [100, 200], "aht": [3], "interval": [30],
         "asa": [20 / 60], "patience": [5], "shrinkage": [0.3]}
+        A :class:`~pyworkforce.utils.ParameterSampler` can be passed instead to
+        evaluate a random or Latin hypercube sample of a larger space.
     n_jobs: int, default=2
         Maximum number of concurrently running jobs. ``-1`` uses all CPUs,
         ``1`` disables parallelism (useful for debugging).
     pre_dispatch: {"all", int, or expression}, default='2 * n_jobs'
         Number of task batches to pre-dispatch. See joblib's documentation.
+    batch_size: int or "auto", default="auto"
+        Number of combinations evaluated per joblib task. ``"auto"`` splits the
+        combinations into about four blocks per worker, of at most 1,000
+        combinations each.
+    deduplicate: bool, default=True
+        Evaluate parameter sets with the same arrival rate, ``aht``,
+        ``patience`` and ``asa`` only once and copy their results back in
+        grid order, rescaling ``positions`` with each set's shrinkage.
+    output: {"list", "columns"}, default="list"
+        ``"columns"`` returns a :class:`~pyworkforce.utils.ColumnarResults`
+        instead of a list of results; the ``*_params`` attributes are then
+        ``None``.
+    backend: {"auto", "joblib", "shared_memory"}, default="auto"
+        ``"shared_memory"`` keeps the parameter table and the results in
+        shared memory instead of pickling them to and from the workers, which
+        helps with many workers on a single machine. ``"auto"`` uses
+        ``"joblib"``.
 
     Attributes
     ----------
@@ -398,11 +655,22 @@ class MultiErlangA(BaseWorkforce):
         order. Each entry is an ``(erlang_params, method_params)`` tuple.
     """
 
-    def __init__(self, param_grid: dict, n_jobs: int = 2, pre_dispatch: str = '2 * n_jobs'):
+    _estimator = ErlangA
+
+    def __init__(self, param_grid: dict, n_jobs: int = 2, pre_dispatch: str = '2 * n_jobs',
+                 batch_size="auto", output: str = "list", deduplicate: bool = True,
+                 backend: str = "auto"):
+        _check_batch_size(batch_size)
+        _check_output(output)
+        _check_backend(backend, self._backends)
         self.param_grid = param_grid
         self.n_jobs = n_jobs
         self.pre_dispatch = pre_dispatch
-        self.param_list = list(ParameterGrid(self.param_grid))
+        self.batch_size = batch_size
+        self.output = output
+        self.deduplicate = deduplicate
+        self.backend = backend
+        self.param_list = _param_list(self.param_grid)
         self.waiting_probability_params = None
         self.abandonment_probability_params = None
         self.achieved_occupancy_params = None
@@ -411,27 +679,6 @@ class MultiErlangA(BaseWorkforce):
         self.service_level_params = None
         self.required_positions_params = None
 
-    def _solve(self, method_name, arguments_grid):
-        """Evaluate ``method_name`` over the cartesian product of both grids.
-
-        Returns
-        -------
-        tuple(list, list)
-            The list of results and the parallel list of
-            ``(erlang_params, method_params)`` tuples that produced them.
-        """
-        arguments_list = list(ParameterGrid(arguments_grid))
-        used_params = [(erlang_params, method_params)
-                       for erlang_params in self.param_list
-                       for method_params in arguments_list]
-        combinations = len(self.param_list) * len(arguments_list)
-        results = Parallel(n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch)(
-            delayed(getattr(ErlangA(**params), method_name))(**arguments)
-            for params in self.param_list
-            for arguments in arguments_list)
-        self._check_solutions(results, combinations)
-        return results, used_params
-
     def waiting_probability(self, arguments_grid):
         """Probability of waiting for every grid combination.
 
@@ -489,9 +736,51 @@ class MultiErlangA(BaseWorkforce):
         results, self.required_positions_params = self._solve("required_positions", arguments_grid)
         return results
 
-    def _check_solutions(self, solutions, combinations):
-        """Check the integrity of the solution in terms of dimensions."""
-        if len(solutions) < 1:
-            raise ValueError("Could not find any solution, make sure the param_grid is defined correctly")
-        if len(solutions) != combinations:
-            raise ValueError(f"Inconsistent results. Expected {combinations} solutions, got {len(solutions)}")
+    def iter_waiting_probability(self, arguments_grid):
+        """Streaming :meth:`waiting_probability`, see :meth:`_iter_solve`.
+
+        ``arguments_grid`` example: ``{"positions": [12, 14, 16]}``.
+        """
+        return self._iter_solve("waiting_probability", arguments_grid)
+
+    def iter_abandonment_probability(self, arguments_grid):
+        """Streaming :meth:`abandonment_probability`, see :meth:`_iter_solve`.
+
+        ``arguments_grid`` example: ``{"positions": [12, 14, 16]}``.
+        """
+        return self._iter_solve("abandonment_probability", arguments_grid)
+
+    def iter_achieved_occupancy(self, arguments_grid):
+        """Streaming :meth:`achieved_occupancy`, see :meth:`_iter_solve`.
+
+        ``arguments_grid`` example: ``{"positions": [12, 14, 16]}``.
+        """
+        return self._iter_solve("achieved_occupancy", arguments_grid)
+
+    def iter_average_speed_of_answer(self, arguments_grid):
+        """Streaming :meth:`average_speed_of_answer`, see :meth:`_iter_solve`.
+
+        ``arguments_grid`` example: ``{"positions": [12, 14, 16]}``.
+        """
+        return self._iter_solve("average_speed_of_answer", arguments_grid)
+
+    def iter_average_queue_length(self, arguments_grid):
+        """Streaming :meth:`average_queue_length`, see :meth:`_iter_solve`.
+
+        ``arguments_grid`` example: ``{"positions": [12, 14, 16]}``.
+        """
+        return self._iter_solve("average_queue_length", arguments_grid)
+
+    def iter_service_level(self, arguments_grid):
+        """Streaming :meth:`service_level`, see :meth:`_iter_solve`.
+
+        ``arguments_grid`` example: ``{"positions": [12, 14], "asa": [20 / 60]}``.
+        """
+        return self._iter_solve("service_level", arguments_grid)
+
+    def iter_required_positions(self, arguments_grid):
+        """Streaming :meth:`required_positions`, see :meth:`_iter_solve`.
+
+        ``arguments_grid`` example: ``{"service_level": [0.8, 0.9], "max_abandonment": [0.05]}``.
+        """
+        return self._iter_solve("required_positions", arguments_grid)
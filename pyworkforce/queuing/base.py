@@ -0,0 +1,371 @@
+"""Shared machinery for the ``Multi*`` queuing estimators.
+
+:class:`MultiErlangC`, :class:`MultiErlangB` and :class:`MultiErlangA` all
+evaluate one estimator method over the Cartesian product of a parameter grid
+and an argument grid. :class:`BaseMultiErlang` implements that loop once.
+
+Single evaluations are cheap, so dispatching one joblib task per combination
+spends most of the time pickling and scheduling. The combinations are instead
+split into blocks of ``batch_size``; each worker builds its estimators and
+evaluates a whole block locally.
+
+The ``iter_<method>`` generators stream the same results block by block, so
+grids with millions of combinations can be written out without holding
+every result in memory. With ``output="columns"`` blocks travel back from the
+workers as NumPy columns and are returned as a
+:class:`~pyworkforce.utils.ColumnarResults` instead of a list of dictionaries.
+
+``backend="shared_memory"`` avoids pickling altogether: the scenario table and
+the results live in shared memory, and tasks only carry ranges of rows (see
+:mod:`pyworkforce.queuing._shared_memory`).
+
+Estimators can implement ``_<method>_batch(arguments_list)`` to evaluate all
+the argument sets of one scenario together. ``required_positions`` uses it to
+visit the targets from loosest to strictest and resume each search where the
+previous one stopped, since the required positions only grow with the target.
+"""
+
+from inspect import signature
+from itertools import groupby, islice, product
+from math import ceil
+
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+
+from pyworkforce.base import BaseWorkforce
+from pyworkforce.queuing._shared_memory import solve_shared_memory
+from pyworkforce.utils import ColumnarResults, ParameterGrid, ParameterSampler
+from pyworkforce.utils.validation import check_positive_integer
+
+# Blocks per worker for ``batch_size="auto"``, so that uneven blocks still balance.
+_BLOCKS_PER_WORKER = 4
+# Largest ``batch_size="auto"`` block, which bounds the work in flight when streaming.
+_MAX_AUTO_BATCH_SIZE = 1000
+# Combinations per block when streaming the vectorized or shared-memory paths.
+# Each vectorized block reruns the recursions up to its largest staffing level,
+# and each shared-memory block starts a round of tasks, so blocks are kept large.
+_VECTORIZED_BLOCK_SIZE = 100000
+
+
+_OUTPUTS = ("list", "columns")
+
+
+def _to_columns(results):
+    """Turn a list of results into one array, or a dict of arrays for dict results."""
+    if results and isinstance(results[0], dict):
+        return {key: np.asarray([result[key] for result in results]) for key in results[0]}
+    return np.asarray(results)
+
+
+def _to_rows(columns):
+    """Inverse of :func:`_to_columns`, with Python scalars."""
+    if isinstance(columns, dict):
+        values = [column.tolist() for column in columns.values()]
+        return [dict(zip(columns, row, strict=True)) for row in zip(*values, strict=True)]
+    return columns.tolist()
+
+
+def _concatenate(blocks):
+    if not blocks:
+        return np.empty(0)
+    if isinstance(blocks[0], dict):
+        return {key: np.concatenate([block[key] for block in blocks]) for key in blocks[0]}
+    return np.concatenate(blocks)
+
+
+def _evaluate_run(erlang, method_name, arguments_list):
+    """Results of ``method_name`` for several argument sets of one estimator.
+
+    Uses the estimator's ``_<method_name>_batch`` when it has one, which
+    shares work across the argument sets.
+    """
+    batch = getattr(erlang, f"_{method_name}_batch", None)
+    if batch is not None:
+        return batch(arguments_list)
+    method = getattr(erlang, method_name)
+    return [method(**arguments) for arguments in arguments_list]
+
+
+def _search_order(method, arguments_list, target, increasing=True):
+    """Argument sets grouped by every argument but ``target`` and sorted by ``target``.
+
+    Within each group the required positions never decrease, so a search can
+    resume from the answer of the previous argument set. Missing arguments
+    take the defaults of ``method``, and invalid argument names raise the
+    ``TypeError`` of a direct call.
+
+    Returns
+    -------
+    list of list of tuple(int, dict)
+        For each group, the position of every argument set in
+        ``arguments_list`` and its complete arguments, in search order.
+    """
+    method_signature = signature(method)
+    groups = {}
+    for index, arguments in enumerate(arguments_list):
+        try:
+            bound = method_signature.bind(**arguments)
+        except TypeError:
+            method(**arguments)  # raises the error of a direct call
+            raise
+        bound.apply_defaults()
+        key = tuple((name, value) for name, value in bound.arguments.items() if name != target)
+        groups.setdefault(key, []).append((index, dict(bound.arguments)))
+    return [sorted(group, key=lambda item: item[1][target], reverse=not increasing) for group in groups.values()]
+
+
+def _evaluate_block(estimator, method_name, block, columnar=False):
+    """Evaluate ``method_name`` for a block of ``(params, arguments)`` combinations.
+
+    Arguments vary fastest, so consecutive combinations share the same
+    parameters dictionary: each estimator is built once per run and
+    evaluates all the arguments of the run together, reusing its caches.
+    With ``columnar`` the block is returned as NumPy columns, which are much
+    cheaper to send back.
+    """
+    results = []
+    for _, run in groupby(block, key=lambda combination: id(combination[0])):
+        run = list(run)
+        erlang = estimator(**run[0][0])
+        results.extend(_evaluate_run(erlang, method_name, [arguments for _, arguments in run]))
+    return _to_columns(results) if columnar else results
+
+
+def _param_list(param_grid):
+    """Expand a ``param_grid`` into the list of estimator parameter sets.
+
+    ``param_grid`` is a dict (or list of dicts) of candidate values, or an
+    already built :class:`ParameterGrid` or :class:`ParameterSampler`.
+    """
+    if isinstance(param_grid, (ParameterGrid, ParameterSampler)):
+        return list(param_grid)
+    return list(ParameterGrid(param_grid))
+
+
+def _check_batch_size(batch_size):
+    """Validate a ``batch_size`` option: ``"auto"`` or a positive integer."""
+    if batch_size != "auto":
+        check_positive_integer("batch_size", batch_size)
+    return True
+
+
+def _check_backend(backend, backends):
+    """Validate a ``backend`` option against the backends an estimator supports."""
+    if backend not in backends:
+        raise ValueError(f"backend must be one of {backends}, got {backend!r}")
+    return True
+
+
+def _check_output(output):
+    """Validate an ``output`` option."""
+    if output not in _OUTPUTS:
+        raise ValueError(f"output must be one of {_OUTPUTS}, got {output!r}")
+    return True
+
+
+class BaseMultiErlang(BaseWorkforce):
+    """Grid evaluation shared by the ``Multi*`` estimators.
+
+    Subclasses set ``_estimator`` to the single-scenario class and store
+    ``param_list``, ``n_jobs``, ``pre_dispatch``, ``batch_size``, ``backend``,
+    ``output`` and ``deduplicate``. The estimator must implement
+    ``_sufficient_statistics`` and have a ``shrinkage`` attribute.
+
+    With ``deduplicate``, scenarios that only differ in shrinkage are merged
+    too: shrinkage only rescales ``required_positions`` into ``positions``,
+    which is recomputed for every scenario after the results are copied back.
+    Calls with ``scale_positions=True`` read shrinkage, so they keep it in the
+    key.
+    """
+
+    _estimator = None
+    _backends = ("auto", "joblib", "shared_memory")
+
+    def _solve(self, method_name, arguments_grid):
+        """Evaluate ``method_name`` over the cartesian product of both grids.
+
+        Returns
+        -------
+        tuple(list, list)
+            The list of results and the parallel list of
+            ``(erlang_params, method_params)`` tuples that produced them.
+            With ``output="columns"``, a :class:`ColumnarResults` that
+            already holds the parameters, and ``None``.
+        """
+        arguments_list = list(ParameterGrid(arguments_grid))
+        combinations = len(self.param_list) * len(arguments_list)
+        unique_params, inverse, shrinkage = self._unique_params(arguments_list)
+        # Position of each combination's result among the unique evaluations.
+        source = (inverse[:, None] * len(arguments_list) + np.arange(len(arguments_list))).ravel()
+
+        if self.output == "columns":
+            blocks = list(self._evaluate_blocks(method_name, arguments_list, columnar=True,
+                                                param_list=unique_params))
+            columns = _concatenate(blocks)
+            if len(unique_params) < len(self.param_list):
+                columns = ({key: values[source] for key, values in columns.items()}
+                           if isinstance(columns, dict) else columns[source])
+                if method_name == "required_positions":
+                    shrinkage = np.repeat(shrinkage, len(arguments_list))
+                    columns["positions"] = np.ceil(columns["raw_positions"] / (1 - shrinkage)).astype(np.int64)
+            results = self._columnar_results(columns, arguments_list)
+            self._check_solutions(results, combinations)
+            return results, None
+
+        used_params = [(erlang_params, method_params)
+                       for erlang_params in self.param_list
+                       for method_params in arguments_list]
+        results = [result for block_results in self._evaluate_blocks(method_name, arguments_list,
+                                                                     param_list=unique_params)
+                   for result in block_results]
+        if len(unique_params) < len(self.param_list):
+            # Copy dictionaries so that duplicated scenarios do not share result objects.
+            results = [dict(results[index]) if isinstance(results[index], dict) else results[index]
+                       for index in source.tolist()]
+            if method_name == "required_positions":
+                shrinkage = np.repeat(shrinkage, len(arguments_list)).tolist()
+                for result, scenario_shrinkage in zip(results, shrinkage, strict=True):
+                    result["positions"] = ceil(result["raw_positions"] / (1 - scenario_shrinkage))
+        self._check_solutions(results, combinations)
+        return results, used_params
+
+    def _unique_params(self, arguments_list):
+        """One parameter set per distinct ``_sufficient_statistics`` value.
+
+        Shrinkage joins the key when an argument set has ``scale_positions``.
+
+        Returns
+        -------
+        tuple(list, numpy.ndarray, numpy.ndarray or None)
+            The representative parameter sets, in order of first appearance,
+            the index of each entry of ``param_list`` among them and the
+            shrinkage of each entry (``None`` without deduplication).
+        """
+        if not self.deduplicate:
+            return self.param_list, np.arange(len(self.param_list)), None
+
+        scaled = any(arguments.get("scale_positions", False) for arguments in arguments_list)
+        representatives, inverse, shrinkage, seen = [], [], [], {}
+        for params in self.param_list:
+            erlang = self._estimator(**params)
+            key = erlang._sufficient_statistics()
+            if scaled:
+                key += (erlang.shrinkage,)
+            if key not in seen:
+                seen[key] = len(representatives)
+                representatives.append(params)
+            inverse.append(seen[key])
+            shrinkage.append(erlang.shrinkage)
+        return representatives, np.asarray(inverse, dtype=np.int64), np.asarray(shrinkage, dtype=float)
+
+    def _columnar_results(self, columns, arguments_list):
+        """Wrap result columns with the parameters stored once as category codes.
+
+        Estimator parameters repeat once per argument combination and method
+        parameters cycle once per estimator, so only the codes of each grid
+        are expanded.
+        """
+        codes, categories = {}, {}
+        for dicts, expand in ((self.param_list, lambda c: np.repeat(c, len(arguments_list))),
+                              (arguments_list, lambda c: np.tile(c, len(self.param_list)))):
+            for name in dict.fromkeys(name for params in dicts for name in params):
+                index = {}
+                grid_codes = np.fromiter(
+                    (index.setdefault(params[name], len(index)) if name in params else -1
+                     for params in dicts), dtype=np.int64, count=len(dicts))
+                codes[name] = expand(grid_codes)
+                categories[name] = list(index)
+
+        if not isinstance(columns, dict):
+            columns = {"result": columns}
+        # Preserve input parameters that share a name with a result key.
+        columns = {f"{key}_result" if key in codes else key: value for key, value in columns.items()}
+        return ColumnarResults(codes, categories, columns)
+
+    def _iter_solve(self, method_name, arguments_grid):
+        """Lazily yield ``(erlang_params, method_params, result)`` in result order.
+
+        This backs every ``iter_<method>`` generator. Results come in the
+        same order as the eager ``<method>`` but are computed block by block
+        as the generator is consumed, so they can be streamed to disk without
+        holding the whole grid in memory; ``<method>_params`` is not set.
+        At most ``pre_dispatch`` blocks are in flight at any time. Duplicated
+        scenarios are not merged, since that would require keeping every
+        result until the end of the stream.
+        """
+        arguments_list = list(ParameterGrid(arguments_grid))
+        combinations = product(self.param_list, arguments_list)
+        for block_results in self._evaluate_blocks(method_name, arguments_list, return_as="generator"):
+            for result in block_results:
+                erlang_params, method_params = next(combinations)
+                yield erlang_params, method_params, result
+
+    def _use_vectorized(self, method_name, arguments_list):
+        """Whether the combinations can be evaluated in one NumPy pass.
+
+        Subclasses that return ``True`` must define
+        ``_solve_vectorized(method_name, arguments_list, param_list)``, which
+        returns a flat result array, or dict of arrays, for every combination
+        of ``param_list`` in the joblib result order.
+        """
+        return False
+
+    def _solve_shared_memory(self, method_name, arguments_list, param_list):
+        """Flat result array, or dict of arrays, evaluated by workers through shared memory.
+
+        Tasks only carry ranges of combinations, so ``batch_size="auto"`` is
+        not capped: every worker gets about four tasks.
+        """
+        combinations = len(param_list) * len(arguments_list)
+        batch_size = self.batch_size
+        if batch_size == "auto":
+            batch_size = max(1, ceil(combinations / (_BLOCKS_PER_WORKER * effective_n_jobs(self.n_jobs))))
+        return solve_shared_memory(self._estimator, method_name, param_list, arguments_list, batch_size,
+                                   n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch)
+
+    def _batch_size(self, combinations):
+        if self.batch_size == "auto":
+            workers = effective_n_jobs(self.n_jobs)
+            return max(1, min(ceil(combinations / (_BLOCKS_PER_WORKER * workers)), _MAX_AUTO_BATCH_SIZE))
+        return self.batch_size
+
+    def _evaluate_blocks(self, method_name, arguments_list, return_as="list", columnar=False,
+                         param_list=None):
+        """Evaluate the combinations block by block, returning an iterable of block results.
+
+        Each block is a list of results, or NumPy columns when ``columnar``.
+        The vectorized and shared-memory paths evaluate whole parameter rows
+        per block and return arrays; otherwise every block is one joblib task.
+        ``param_list`` defaults to every parameter set of the grid.
+        """
+        if param_list is None:
+            param_list = self.param_list
+
+        if self._use_vectorized(method_name, arguments_list):
+            solve = self._solve_vectorized
+        elif self.backend == "shared_memory":
+            solve = self._solve_shared_memory
+        else:
+            solve = None
+
+        if solve is not None:
+            convert = (lambda columns: columns) if columnar else _to_rows
+            if return_as == "list":
+                return [convert(solve(method_name, arguments_list, param_list))]
+            rows = max(1, _VECTORIZED_BLOCK_SIZE // max(1, len(arguments_list)))
+            return (convert(solve(method_name, arguments_list, param_list[start:start + rows]))
+                    for start in range(0, len(param_list), rows))
+
+        batch_size = self._batch_size(len(param_list) * len(arguments_list))
+        pairs = product(param_list, arguments_list)
+        blocks = iter(lambda: list(islice(pairs, batch_size)), [])
+        return Parallel(n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch, return_as=return_as)(
+            delayed(_evaluate_block)(self._estimator, method_name, block, columnar)
+            for block in blocks)
+
+    def _check_solutions(self, solutions, combinations):
+        """Check the integrity of the solution in terms of dimensions."""
+        if len(solutions) < 1:
+            raise ValueError("Could not find any solution, make sure the param_grid is defined correctly")
+        if len(solutions) != combinations:
+            raise ValueError(f"Inconsistent results. Expected {combinations} solutions, got {len(solutions)}")
@@ -0,0 +1,318 @@
+"""Sweeps of ``Multi*`` grids sharded across processes and machines.
+
+A sweep lives in a directory on a filesystem shared by every worker::
+
+    sweep/
+        manifest.json          estimator, grids and options of the sweep
+        shards/shard-000000.json
+        claims/shard-000000.lock
+        results/shard-000000.parquet
+
+:meth:`DistributedSweep.prepare` splits the parameter grid into shards of
+consecutive grid indices and writes one manifest file per shard. Any number of
+workers, started on any host with :meth:`DistributedSweep.run_worker` or
+``python -m pyworkforce.queuing.distributed <directory>``, claim shards by
+creating their lock file with ``O_CREAT | O_EXCL``, which succeeds for exactly
+one worker. Results are written to a temporary file and renamed into place, so
+a shard is either complete or absent. A lock older than ``lease_timeout``
+belongs to a worker that crashed and is taken over, which is how a sweep
+resumes. :meth:`DistributedSweep.merge` concatenates the shard results in grid
+order.
+"""
+
+import argparse
+import json
+import os
+import socket
+import time
+from importlib import import_module
+from uuid import uuid4
+
+from pyworkforce.queuing.base import BaseMultiErlang
+from pyworkforce.utils import ParameterGrid, results_to_dataframe
+from pyworkforce.utils.validation import check_positive_float, check_positive_integer
+
+_MANIFEST = "manifest.json"
+_FILE_FORMATS = ("auto", "parquet", "pickle")
+_EXTENSIONS = {"parquet": ".parquet", "pickle": ".pkl"}
+
+
+def _parquet_engine_available():
+    for engine in ("pyarrow", "fastparquet"):
+        try:
+            import_module(engine)
+        except ImportError:
+            continue
+        return True
+    return False
+
+
+def _shard_name(index):
+    return f"shard-{index:06d}"
+
+
+class DistributedSweep:
+    """
+    File-based work queue that evaluates a ``Multi*`` grid shard by shard.
+
+    Parameters
+    ----------
+    directory : str or os.PathLike
+        Directory of the sweep. It must be reachable by every worker, for
+        example on a network filesystem.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from pyworkforce.queuing import MultiErlangC
+    >>> from pyworkforce.queuing.distributed import DistributedSweep
+    >>> sweep = DistributedSweep(tempfile.mkdtemp())
+    >>> sweep.prepare(MultiErlangC, {"transactions": [100, 200, 300], "aht": [3], "interval": [30],
+    ...                              "asa": [20 / 60]},
+    ...               "required_positions", {"service_level": [0.8]}, shard_size=2)
+    2
+    >>> sweep.run_worker()
+    [0, 1]
+    >>> sweep.merge()["positions"].tolist()
+    [14, 24, 35]
+    """
+
+    def __init__(self, directory):
+        self.directory = os.fspath(directory)
+
+    def prepare(self, estimator, param_grid, method_name, arguments_grid, shard_size=1000,
+                estimator_params=None, file_format="auto"):
+        """Write the manifest and the shard files of a new sweep.
+
+        Parameters
+        ----------
+        estimator : type
+            ``Multi*`` class to evaluate, such as :class:`MultiErlangA`.
+        param_grid : dict, list of dict or ParameterGrid
+            Estimator parameters. Values must be JSON serializable.
+        method_name : str
+            Method of ``estimator`` to call, for example
+            ``"required_positions"``.
+        arguments_grid : dict
+            Arguments grid of the method, as for the ``Multi*`` classes.
+        shard_size : int, default=1000
+            Parameter sets per shard. Each shard evaluates these parameter sets
+            with every combination of ``arguments_grid``.
+        estimator_params : dict, default=None
+            Extra constructor arguments of ``estimator`` used by the workers,
+            such as ``{"n_jobs": 1}``.
+        file_format : {"auto", "parquet", "pickle"}, default="auto"
+            Format of the shard results. ``"parquet"`` requires pyarrow or
+            fastparquet; ``"auto"`` uses it when available and pickle
+            otherwise.
+
+        Returns
+        -------
+        int
+            Number of shards.
+        """
+        if not (isinstance(estimator, type) and issubclass(estimator, BaseMultiErlang)):
+            raise ValueError(f"estimator must be a Multi* estimator class, got {estimator!r}")
+        if not callable(getattr(estimator, method_name, None)):
+            raise ValueError(f"{estimator.__name__} has no method {method_name!r}")
+        check_positive_integer("shard_size", shard_size)
+        if file_format not in _FILE_FORMATS:
+            raise ValueError(f"file_format must be one of {_FILE_FORMATS}, got {file_format!r}")
+        if file_format == "auto":
+            file_format = "parquet" if _parquet_engine_available() else "pickle"
+        elif file_format == "parquet" and not _parquet_engine_available():
+            raise ImportError("file_format='parquet' requires pyarrow or fastparquet; "
+                              "install one of them or use file_format='pickle'")
+        if os.path.exists(self._path(_MANIFEST)):
+            raise FileExistsError(f"{self.directory} already holds a sweep")
+
+        if isinstance(param_grid, ParameterGrid):
+            param_grid = param_grid.param_grid
+        grid = ParameterGrid(param_grid)
+        n_shards = -(-len(grid) // shard_size)
+
+        for folder in ("shards", "claims", "results"):
+            os.makedirs(self._path(folder), exist_ok=True)
+        for index in range(n_shards):
+            bounds = {"index": index, "start": index * shard_size, "stop": min((index + 1) * shard_size, len(grid))}
+            self._write_json(self._shard_path(index), bounds)
+        # The manifest is written last: a directory with a manifest is a complete sweep.
+        self._write_json(self._path(_MANIFEST), {
+            "estimator": f"{estimator.__module__}.{estimator.__qualname__}",
+            "estimator_params": dict(estimator_params or {}),
+            "param_grid": [{key: list(values) for key, values in sub_grid.items()} for sub_grid in grid.param_grid],
+            "method_name": method_name,
+            "arguments_grid": arguments_grid,
+            "n_shards": n_shards,
+            "file_format": file_format,
+        })
+        return n_shards
+
+    def run_worker(self, lease_timeout=3600.0, max_shards=None):
+        """Claim and evaluate shards until none is left to claim.
+
+        Parameters
+        ----------
+        lease_timeout : float, default=3600.0
+            Seconds after which a claimed shard without results is considered
+            abandoned by a crashed worker and claimed again. It must exceed the
+            time a worker takes to evaluate one shard.
+        max_shards : int, default=None
+            Stop after evaluating this many shards.
+
+        Returns
+        -------
+        list of int
+            Indices of the shards evaluated by this call.
+        """
+        check_positive_float("lease_timeout", lease_timeout)
+        if max_shards is not None:
+            check_positive_integer("max_shards", max_shards)
+        manifest = self._read_json(self._path(_MANIFEST))
+
+        completed = []
+        for index in range(manifest["n_shards"]):
+            if max_shards is not None and len(completed) >= max_shards:
+                break
+            if self._is_done(index, manifest) or not self._claim(index, lease_timeout):
+                continue
+            try:
+                # Another worker may have finished the shard between both checks.
+                if not self._is_done(index, manifest):
+                    self._evaluate_shard(index, manifest)
+                    completed.append(index)
+            finally:
+                self._release(index)
+        return completed
+
+    def status(self):
+        """Number of ``total``, ``done``, ``claimed`` and ``pending`` shards."""
+        manifest = self._read_json(self._path(_MANIFEST))
+        done = claimed = 0
+        for index in range(manifest["n_shards"]):
+            if self._is_done(index, manifest):
+                done += 1
+            elif os.path.exists(self._lock_path(index)):
+                claimed += 1
+        total = manifest["n_shards"]
+        return {"total": total, "done": done, "claimed": claimed, "pending": total - done - claimed}
+
+    def merge(self):
+        """Concatenate the shard results in grid order.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per ``(erlang_params, method_params)`` combination, in the
+            order of the ``*_params`` attributes of the ``Multi*`` estimator.
+        """
+        import pandas as pd
+
+        manifest = self._read_json(self._path(_MANIFEST))
+        missing = [index for index in range(manifest["n_shards"]) if not self._is_done(index, manifest)]
+        if missing:
+            raise ValueError(f"merge requires every shard to be complete, "
+                             f"{len(missing)} of {manifest['n_shards']} are missing")
+        read = pd.read_parquet if manifest["file_format"] == "parquet" else pd.read_pickle
+        frames = [read(self._result_path(index, manifest)) for index in range(manifest["n_shards"])]
+        # Category sets differ between shards, so parameters are merged as plain values.
+        frames = [frame.astype({column: frame[column].cat.categories.dtype
+                                for column in frame.select_dtypes("category")}) for frame in frames]
+        return pd.concat(frames, ignore_index=True)
+
+    def _evaluate_shard(self, index, manifest):
+        bounds = self._read_json(self._shard_path(index))
+        # One single-valued sub-grid per parameter set keeps the grid order.
+        points = ParameterGrid(manifest["param_grid"])[bounds["start"]:bounds["stop"]]
+        module, name = manifest["estimator"].rsplit(".", 1)
+        estimator = getattr(import_module(module), name)
+        multi = estimator(param_grid=[{key: [value] for key, value in point.items()} for point in points],
+                          **{**manifest["estimator_params"], "output": "columns"})
+        frame = results_to_dataframe(getattr(multi, manifest["method_name"])(manifest["arguments_grid"]))
+
+        path = self._result_path(index, manifest)
+        partial = f"{path}.{uuid4().hex}.tmp"
+        if manifest["file_format"] == "parquet":
+            frame.to_parquet(partial)
+        else:
+            frame.to_pickle(partial)
+        os.replace(partial, path)
+
+    def _claim(self, index, lease_timeout):
+        """Create the shard's lock file; take it over when its lease has expired.
+
+        Two workers can both take over the same expired lease in a narrow
+        window. The shard is then evaluated twice, which is harmless: results
+        are deterministic and each copy replaces the file atomically.
+        """
+        lock = self._lock_path(index)
+        owner = json.dumps({"host": socket.gethostname(), "pid": os.getpid(), "claimed_at": time.time()})
+        for _ in range(2):
+            try:
+                descriptor = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    expired = time.time() - os.stat(lock).st_mtime > lease_timeout
+                    if expired:
+                        # Renaming first means only one of the workers removes the lock.
+                        stale = f"{lock}.{uuid4().hex}.stale"
+                        os.rename(lock, stale)
+                        os.remove(stale)
+                except FileNotFoundError:
+                    expired = True
+                if not expired:
+                    return False
+                continue
+            with os.fdopen(descriptor, "w") as file:
+                file.write(owner)
+            return True
+        return False
+
+    def _release(self, index):
+        try:
+            os.remove(self._lock_path(index))
+        except FileNotFoundError:
+            pass
+
+    def _is_done(self, index, manifest):
+        return os.path.exists(self._result_path(index, manifest))
+
+    def _path(self, *parts):
+        return os.path.join(self.directory, *parts)
+
+    def _shard_path(self, index):
+        return self._path("shards", f"{_shard_name(index)}.json")
+
+    def _lock_path(self, index):
+        return self._path("claims", f"{_shard_name(index)}.lock")
+
+    def _result_path(self, index, manifest):
+        return self._path("results", _shard_name(index) + _EXTENSIONS[manifest["file_format"]])
+
+    @staticmethod
+    def _read_json(path):
+        with open(path) as file:
+            return json.load(file)
+
+    @staticmethod
+    def _write_json(path, content):
+        partial = f"{path}.{uuid4().hex}.tmp"
+        with open(partial, "w") as file:
+            json.dump(content, file)
+        os.replace(partial, path)
+
+
+def main(argv=None):
+    """Command line worker: ``python -m pyworkforce.queuing.distributed <directory>``."""
+    parser = argparse.ArgumentParser(description="Evaluate the shards of a pyworkforce sweep.")
+    parser.add_argument("directory", help="directory of a sweep written by DistributedSweep.prepare")
+    parser.add_argument("--lease-timeout", type=float, default=3600.0,
+                        help="seconds after which the claim of a crashed worker expires")
+    parser.add_argument("--max-shards", type=int, default=None, help="stop after this many shards")
+    arguments = parser.parse_args(argv)
+    completed = DistributedSweep(arguments.directory).run_worker(arguments.lease_timeout, arguments.max_shards)
+    print(f"evaluated {len(completed)} shards")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,19 @@
-from math import ceil, exp, floor
+from math import ceil, erfc, exp, floor, lgamma, log, pi, sqrt
+from numbers import Integral, Real
 
-from joblib import Parallel, delayed
+import numpy as np
 
 from pyworkforce.base import BaseWorkforce
-from pyworkforce.utils import ParameterGrid
-from pyworkforce.utils.validation import check_in_range, check_positive_float
+from pyworkforce.queuing import _kernels
+from pyworkforce.queuing.base import (
+    BaseMultiErlang,
+    _check_backend,
+    _check_batch_size,
+    _check_output,
+    _param_list,
+    _search_order,
+)
+from pyworkforce.utils.validation import check_array, check_in_range, check_positive_float
 
 
 class ErlangC(BaseWorkforce):
@@ -29,6 +38,22 @@ class ErlangC(BaseWorkforce):
         Interval length, in minutes.
     shrinkage: float, default=0.0
         Fraction of time that an operator unit is not available, in ``[0, 1)``.
+    method: {"exact", "log", "qed"}, default="exact"
+        How the waiting probability is evaluated:
+
+        - ``"exact"``: the Erlang B recursion, ``O(positions)`` per evaluation.
+        - ``"log"``: exact Poisson-ratio form of Erlang B evaluated in log
+          space with ``lgamma``. Only the ``O(sqrt(intensity))`` terms that
+          carry probability mass are summed, so it stays stable for very
+          large queues.
+        - ``"qed"``: Halfin-Whitt (quality and efficiency driven)
+          approximation, constant time per evaluation. Its absolute error on
+          the waiting probability shrinks like ``1 / sqrt(intensity)``, about
+          ``0.15 / sqrt(intensity)`` for typical staffing levels (below 0.002
+          at 10,000 Erlangs).
+
+        With ``"log"`` and ``"qed"``, :meth:`required_positions` brackets and
+        bisects the service level target instead of scanning every position.
 
     Attributes
     ----------
@@ -44,20 +69,25 @@ class ErlangC(BaseWorkforce):
     20
     """
 
+    _methods = ("exact", "log", "qed")
+
     def __init__(self, transactions: float, aht: float, asa: float,
-                 interval: int, shrinkage: float = 0.0):
+                 interval: int, shrinkage: float = 0.0, method: str = "exact"):
 
         check_positive_float("transactions", transactions)
         check_positive_float("aht", aht)
         check_positive_float("asa", asa)
         check_positive_float("interval", interval)
         check_in_range("shrinkage", shrinkage, 0, 1, include_high=False)
+        if method not in self._methods:
+            raise ValueError(f"method must be one of {self._methods}, got {method!r}")
 
         self.transactions = transactions
         self.aht = aht
         self.asa = asa
         self.interval = interval
         self.shrinkage = shrinkage
+        self.method = method
         self.intensity = (self.transactions / self.interval) * self.aht
 
     # Backwards-compatible alias for the traffic volume.
@@ -65,6 +95,10 @@ class ErlangC(BaseWorkforce):
     def n_transactions(self):
         return self.transactions
 
+    def _sufficient_statistics(self):
+        """Values that determine every result up to shrinkage; equal values give identical results."""
+        return self.intensity, self.asa / self.aht, self.method
+
     def _productive_positions(self, positions: int, scale_positions: bool = False):
         if scale_positions:
             productive_positions = floor((1 - self.shrinkage) * positions)
@@ -79,6 +113,61 @@ class ErlangC(BaseWorkforce):
 
         return productive_positions
 
+    def _erlang_b(self, productive_positions: int):
+        """Erlang B blocking probability via the numerically stable recursion."""
+        erlang_b = 1.0
+        for position in range(1, productive_positions + 1):
+            erlang_b = self._next_erlang_b(position, erlang_b)
+        return erlang_b
+
+    def _next_erlang_b(self, position: int, erlang_b: float):
+        """Advance the Erlang B recursion from ``position - 1`` to ``position``."""
+        return (self.intensity * erlang_b) / (position + self.intensity * erlang_b)
+
+    def _log_erlang_b(self, productive_positions: int):
+        """Erlang B blocking probability evaluated in log space.
+
+        ``B(c, A) = p(c) / sum(p(k), k <= c)`` where ``p`` is the Poisson(A)
+        probability mass function. Terms further than ``12 * sqrt(A) + 20``
+        from the mean are below double precision relative to the sum, so only
+        the window around ``A`` is evaluated.
+        """
+        intensity = self.intensity
+        spread = 12 * sqrt(intensity) + 20
+        low = max(0, floor(intensity - spread))
+        high = min(productive_positions, ceil(intensity + spread))
+
+        # log(p(k) / p(high)) for k = high, high - 1, ..., low, using p(k - 1) / p(k) = k / A.
+        log_ratios = np.concatenate(([0.0], np.cumsum(np.log(np.arange(high, low, -1) / intensity))))
+        peak = log_ratios.max()
+        log_total = peak + log(np.exp(log_ratios - peak).sum())
+        log_head = ((productive_positions - high) * log(intensity)
+                    - (lgamma(productive_positions + 1) - lgamma(high + 1)))
+        return exp(log_head - log_total)
+
+    def _qed_waiting_probability(self, productive_positions: int):
+        """Halfin-Whitt approximation ``1 / (1 + beta * Phi(beta) / phi(beta))``."""
+        beta = (productive_positions - self.intensity) / sqrt(self.intensity)
+        density = exp(-beta ** 2 / 2)  # phi(beta) * sqrt(2 * pi), kept unscaled to avoid overflow
+        cumulative = 0.5 * erfc(-beta / sqrt(2))
+        return density / (density + beta * cumulative * sqrt(2 * pi))
+
+    def _waiting_probability(self, productive_positions: int):
+        if self.method == "qed":
+            return self._qed_waiting_probability(productive_positions)
+        if self.method == "log":
+            erlang_b = self._log_erlang_b(productive_positions)
+        else:
+            erlang_b = self._erlang_b(productive_positions)
+        return self._waiting_probability_from_erlang_b(productive_positions, erlang_b)
+
+    def _waiting_probability_from_erlang_b(self, productive_positions: int, erlang_b: float):
+        return productive_positions * erlang_b / (productive_positions - self.intensity * (1 - erlang_b))
+
+    def _service_level_from_waiting_probability(self, productive_positions: int, probability_wait: float):
+        exponential = exp(-(productive_positions - self.intensity) * (self.asa / self.aht))
+        return max(0, 1 - (probability_wait * exponential))
+
     def waiting_probability(self, positions: int, scale_positions: bool = False):
         """
         Returns the probability that a transaction waits in queue.
@@ -94,13 +183,7 @@ class ErlangC(BaseWorkforce):
         """
 
         productive_positions = self._productive_positions(positions, scale_positions)
-
-        erlang_b_inverse = 1
-        for position in range(1, productive_positions + 1):
-            erlang_b_inverse = 1 + (erlang_b_inverse * position / self.intensity)
-
-        erlang_b = 1 / erlang_b_inverse
-        return productive_positions * erlang_b / (productive_positions - self.intensity * (1 - erlang_b))
+        return self._waiting_probability(productive_positions)
 
     def service_level(self, positions: int, scale_positions: bool = False):
         """
@@ -119,8 +202,7 @@ class ErlangC(BaseWorkforce):
         productive_positions = self._productive_positions(positions, scale_positions)
 
         probability_wait = self.waiting_probability(productive_positions, scale_positions=False)
-        exponential = exp(-(productive_positions - self.intensity) * (self.asa / self.aht))
-        return max(0, 1 - (probability_wait * exponential))
+        return self._service_level_from_waiting_probability(productive_positions, probability_wait)
 
     def achieved_occupancy(self, positions: int, scale_positions: bool = False):
         """
@@ -140,6 +222,115 @@ class ErlangC(BaseWorkforce):
 
         return self.intensity / productive_positions
 
+    def sensitivity(self, positions: int, scale_positions: bool = False):
+        """
+        Returns the metrics for a number of positions and their derivatives.
+
+        Derivatives in the intensity, ``aht`` and ``asa`` are analytic, from
+        ``dB/dA = B * (c / A - 1 + B)`` for the Erlang B term (or the
+        derivative of the Halfin-Whitt formula with ``method="qed"``). The
+        effect of one more position is a forward difference that advances the
+        Erlang B recursion by one step, so the whole table costs a single
+        evaluation.
+
+        Parameters
+        ----------
+
+        positions: int,
+            The number of positions available to handle transactions.
+            Productive positions must be greater than traffic intensity.
+        scale_positions: bool, default=False
+            Set to True when ``positions`` includes shrinkage.
+
+        Returns
+        -------
+
+        pandas.DataFrame
+            One row per metric (``waiting_probability``, ``service_level`` and
+            ``occupancy``) with its ``value`` and the columns:
+
+            - ``positions``: change from one more productive position.
+            - ``intensity``: derivative in the traffic intensity, with ``aht``
+              and ``asa`` fixed. Multiply by ``0.01 * intensity`` for the
+              effect of 1% more transactions.
+            - ``aht``: derivative in ``aht`` per minute, with the transactions
+              fixed, so the intensity grows with ``aht``.
+            - ``asa``: derivative in ``asa`` per minute.
+
+        Examples
+        --------
+        >>> from pyworkforce.queuing import ErlangC
+        >>> erlang = ErlangC(transactions=100, aht=3, asa=20 / 60, interval=30)
+        >>> table = erlang.sensitivity(positions=14)
+        >>> round(float(table.loc["service_level", "positions"]), 3)
+        0.053
+        """
+        import pandas as pd
+
+        productive_positions = self._productive_positions(positions, scale_positions)
+        intensity, asa_aht = self.intensity, self.asa / self.aht
+        waiting_probability, d_waiting_probability, next_waiting_probability = (
+            self._waiting_probability_derivative(productive_positions))
+        service_level = self._service_level_from_waiting_probability(productive_positions, waiting_probability)
+        next_service_level = self._service_level_from_waiting_probability(productive_positions + 1,
+                                                                           next_waiting_probability)
+        decay = exp(-(productive_positions - intensity) * asa_aht)
+
+        # aht moves both the intensity and the exponent -(c - A) * asa / aht.
+        table = {
+            "waiting_probability": [
+                waiting_probability,
+                next_waiting_probability - waiting_probability,
+                d_waiting_probability,
+                d_waiting_probability * intensity / self.aht,
+                0.0,
+            ],
+            "service_level": [
+                service_level,
+                next_service_level - service_level,
+                -decay * (d_waiting_probability + waiting_probability * asa_aht),
+                -decay * (d_waiting_probability * intensity + waiting_probability * productive_positions * asa_aht)
+                / self.aht,
+                decay * waiting_probability * (productive_positions - intensity) / self.aht,
+            ],
+            "occupancy": [
+                intensity / productive_positions,
+                intensity / (productive_positions + 1) - intensity / productive_positions,
+                1 / productive_positions,
+                intensity / (self.aht * productive_positions),
+                0.0,
+            ],
+        }
+        return pd.DataFrame.from_dict(table, orient="index",
+                                      columns=["value", "positions", "intensity", "aht", "asa"])
+
+    def _waiting_probability_derivative(self, productive_positions: int):
+        """Waiting probability, its derivative in the intensity and its value with one more position."""
+        c, intensity = productive_positions, self.intensity
+        if self.method == "qed":
+            waiting_probability = self._qed_waiting_probability(c)
+            beta = (c - intensity) / sqrt(intensity)
+            density = exp(-beta ** 2 / 2)
+            if density == 0:
+                derivative = 0.0
+            else:
+                # C = 1 / (1 + beta * Phi / phi), d(beta * Phi / phi) / d(beta) = (1 + beta ** 2) * Phi / phi + beta
+                # and d(beta) / dA = -(c + A) / (2 * A ** 1.5).
+                ratio = 0.5 * erfc(-beta / sqrt(2)) * sqrt(2 * pi) / density
+                derivative = (waiting_probability ** 2 * ((1 + beta ** 2) * ratio + beta)
+                              * (c + intensity) / (2 * intensity * sqrt(intensity)))
+            return waiting_probability, derivative, self._qed_waiting_probability(c + 1)
+
+        erlang_b = self._log_erlang_b(c) if self.method == "log" else self._erlang_b(c)
+        d_erlang_b = erlang_b * (c / intensity - 1 + erlang_b)
+        # C = c * B / D with D = c - A * (1 - B).
+        denominator = c - intensity * (1 - erlang_b)
+        d_denominator = erlang_b - 1 + intensity * d_erlang_b
+        waiting_probability = c * erlang_b / denominator
+        derivative = c * (d_erlang_b * denominator - erlang_b * d_denominator) / denominator ** 2
+        next_erlang_b = self._next_erlang_b(c + 1, erlang_b)
+        return waiting_probability, derivative, self._waiting_probability_from_erlang_b(c + 1, next_erlang_b)
+
     def required_positions(self, service_level: float, max_occupancy: float = 1.0):
         """
         Computes the required positions for a target service level.
@@ -168,14 +359,43 @@ class ErlangC(BaseWorkforce):
             Probability that a transaction waits in queue.
         """
 
+        return self._required_positions(service_level, max_occupancy)[0]
+
+    def _required_positions_batch(self, arguments_list):
+        """
+        :meth:`required_positions` for several argument sets, in their order.
+
+        Targets are visited by increasing service level and each search
+        resumes where the previous one stopped, carrying the Erlang B
+        recursion along, so a whole curve of targets costs about as much as
+        its highest target.
+        """
+        results = [None] * len(arguments_list)
+        for group in _search_order(self.required_positions, arguments_list, "service_level"):
+            start = None
+            for index, arguments in group:
+                results[index], start = self._required_positions(**arguments, start=start)
+        return results
+
+    def _required_positions(self, service_level: float, max_occupancy: float = 1.0, start=None):
+        """
+        :meth:`required_positions` resuming from ``start``, the ``(positions, erlang_b)``
+        where the search for a lower service level stopped.
+
+        Returns the result and the state to resume the next search from.
+        ``erlang_b`` is ``None`` for the methods that bisect.
+        """
         check_in_range("service_level", service_level, 0, 1)
         check_in_range("max_occupancy", max_occupancy, 0, 1, include_low=False)
 
-        positions = round(self.intensity + 1)
-        achieved_service_level = self.service_level(positions, scale_positions=False)
-        while achieved_service_level < service_level:
-            positions += 1
-            achieved_service_level = self.service_level(positions, scale_positions=False)
+        if self.method == "exact":
+            positions, achieved_service_level, waiting_probability, erlang_b = self._scan_positions(
+                service_level, start)
+        else:
+            positions, achieved_service_level, waiting_probability = self._bisect_positions(
+                service_level, None if start is None else start[0])
+            erlang_b = None
+        start = (positions, erlang_b)
 
         achieved_occupancy = self.achieved_occupancy(positions, scale_positions=False)
 
@@ -185,18 +405,159 @@ class ErlangC(BaseWorkforce):
             raw_positions = ceil(self.intensity / max_occupancy)
             achieved_occupancy = self.achieved_occupancy(raw_positions)
             achieved_service_level = self.service_level(raw_positions)
+            waiting_probability = self.waiting_probability(positions=raw_positions)
 
-        waiting_probability = self.waiting_probability(positions=raw_positions)
         positions = ceil(raw_positions / (1 - self.shrinkage))
 
         return {"raw_positions": raw_positions,
                 "positions": positions,
                 "service_level": achieved_service_level,
                 "occupancy": achieved_occupancy,
-                "waiting_probability": waiting_probability}
+                "waiting_probability": waiting_probability}, start
+
+    def _scan_positions(self, service_level: float, start=None):
+        """Smallest stable position meeting ``service_level``, scanning upward.
 
+        The Erlang B recursion is carried forward one position at a time, so
+        the whole search costs a single pass instead of one pass per candidate.
+        The scan starts at ``start``, a ``(positions, erlang_b)`` pair, when
+        given. Returns the Erlang B value at the answer as well.
+        """
+        if start is None:
+            positions = round(self.intensity + 1)
+            erlang_b = self._erlang_b(positions)
+        else:
+            positions, erlang_b = start
+        waiting_probability = self._waiting_probability_from_erlang_b(positions, erlang_b)
+        achieved_service_level = self._service_level_from_waiting_probability(positions, waiting_probability)
+        while achieved_service_level < service_level:
+            positions += 1
+            erlang_b = self._next_erlang_b(positions, erlang_b)
+            waiting_probability = self._waiting_probability_from_erlang_b(positions, erlang_b)
+            achieved_service_level = self._service_level_from_waiting_probability(positions, waiting_probability)
+        return positions, achieved_service_level, waiting_probability, erlang_b
+
+    def _bisect_positions(self, service_level: float, low: int = None):
+        """Smallest stable position meeting ``service_level``, by bracketing and bisection.
+
+        The service level is monotone in positions, so the target is bracketed
+        with doubling steps and then bisected; this needs ``O(log(positions))``
+        evaluations. The bracket starts at ``low`` when given, the answer for
+        a lower target.
+        """
+        def evaluate(positions):
+            waiting_probability = self._waiting_probability(positions)
+            return self._service_level_from_waiting_probability(positions, waiting_probability), waiting_probability
+
+        if low is None:
+            low = round(self.intensity + 1)
+        achieved = evaluate(low)
+        if achieved[0] >= service_level:
+            return (low, *achieved)
+
+        step = 1
+        high = low + step
+        achieved = evaluate(high)
+        while achieved[0] < service_level:
+            low = high
+            step *= 2
+            high = low + step
+            achieved = evaluate(high)
+
+        while high - low > 1:
+            middle = (low + high) // 2
+            candidate = evaluate(middle)
+            if candidate[0] >= service_level:
+                high, achieved = middle, candidate
+            else:
+                low = middle
+        return (high, *achieved)
+
+    @classmethod
+    def from_arrays(cls, transactions, aht, asa, interval, shrinkage=0.0, service_level=None,
+                    max_occupancy=1.0, positions=None, scale_positions=False):
+        """
+        Evaluates many Erlang C scenarios at once with NumPy.
 
-class MultiErlangC(BaseWorkforce):
+        Every array argument is broadcast against the others, so a whole
+        interval profile (or several queues) can be sized in one call instead
+        of building one :class:`ErlangC` per interval. Exactly one of
+        ``service_level`` or ``positions`` must be given.
+
+        Parameters
+        ----------
+
+        transactions, aht, asa, interval, shrinkage: array-like,
+            The :class:`ErlangC` parameters, as scalars or arrays.
+        service_level: array-like, optional
+            Target service level. When given, the result holds the output of
+            :meth:`required_positions` for every scenario.
+        max_occupancy: array-like, default=1.0
+            Maximum occupancy used together with ``service_level``.
+        positions: array-like, optional
+            Number of positions. When given, the result holds the waiting
+            probability, service level and occupancy for every scenario.
+        scale_positions: bool, default=False
+            Set to True when ``positions`` includes shrinkage.
+
+        Returns
+        -------
+
+        pandas.DataFrame
+            One row per broadcast scenario. The columns are the keys of
+            :meth:`required_positions` when ``service_level`` is given,
+            otherwise ``waiting_probability``, ``service_level`` and ``occupancy``.
+
+        Examples
+        --------
+        >>> from pyworkforce.queuing import ErlangC
+        >>> df = ErlangC.from_arrays(transactions=[100, 150, 200], aht=3, asa=20 / 60,
+        ...                          interval=30, shrinkage=0.3, service_level=0.8)
+        >>> df["raw_positions"].tolist()
+        [14, 19, 24]
+        """
+        import pandas as pd
+
+        if (service_level is None) == (positions is None):
+            raise ValueError("exactly one of service_level or positions must be provided")
+
+        transactions = check_array("transactions", transactions, check_positive_float)
+        aht = check_array("aht", aht, check_positive_float)
+        asa = check_array("asa", asa, check_positive_float)
+        interval = check_array("interval", interval, check_positive_float)
+        shrinkage = check_array("shrinkage", shrinkage, check_in_range, 0, 1, include_high=False)
+        intensity = (transactions / interval) * aht
+
+        if service_level is not None:
+            service_level = check_array("service_level", service_level, check_in_range, 0, 1)
+            max_occupancy = check_array("max_occupancy", max_occupancy, check_in_range, 0, 1,
+                                        include_low=False)
+            results = _kernels.erlang_c_required_positions(
+                intensity, asa / aht, service_level, max_occupancy, shrinkage)
+            return pd.DataFrame(results)
+
+        positions = np.asarray(positions)
+        if not np.issubdtype(positions.dtype, np.integer):
+            raise ValueError(f"positions must be integers, got values of dtype {positions.dtype}")
+        intensity, asa_aht, shrinkage, positions = (
+            arr.ravel() for arr in np.broadcast_arrays(intensity, asa / aht, shrinkage, positions))
+        if scale_positions:
+            positions = np.floor((1 - shrinkage) * positions).astype(np.int64)
+
+        if (positions <= 0).any():
+            raise ValueError("productive positions must be greater than 0")
+        if (positions <= intensity).any():
+            raise ValueError("positions must be greater than traffic intensity")
+
+        waiting_probability = _kernels.erlang_c(intensity, positions)
+        return pd.DataFrame({
+            "waiting_probability": waiting_probability,
+            "service_level": _kernels.erlang_c_service_level(intensity, positions, waiting_probability, asa_aht),
+            "occupancy": intensity / positions,
+        })
+
+
+class MultiErlangC(BaseMultiErlang):
     """
     Runs Erlang C calculations over multiple parameter combinations.
 
@@ -211,6 +572,8 @@ class MultiErlangC(BaseWorkforce):
         Dictionary with :class:`ErlangC` initialization parameters. Each key must be an
         expected parameter, and each value must be a list of options to iterate over.
         example: {"transactions": [100, 200], "aht": [3], "interval": [30], "asa": [20 / 60], "shrinkage": [0.3]}
+        A :class:`~pyworkforce.utils.ParameterSampler` can be passed instead to
+        evaluate a random or Latin hypercube sample of a larger space.
     n_jobs: int, default=2
         Maximum number of concurrently running jobs.
         If -1 all CPUs are used. If 1 is given, no parallel computing code is used at all, which is useful for debugging.
@@ -220,6 +583,40 @@ class MultiErlangC(BaseWorkforce):
     pre_dispatch: {"all", int, or expression}, default='2 * n_jobs'
         Number of task batches to pre-dispatch. Default is ``2*n_jobs``.
         See joblib's documentation for more details: https://joblib.readthedocs.io/en/latest/generated/joblib.Parallel.html
+    batch_size: int or "auto", default="auto"
+        Number of combinations evaluated per joblib task. Each worker builds
+        its estimators and evaluates a whole block, which cuts pickling and
+        dispatch overhead. ``"auto"`` splits the combinations into about four
+        blocks per worker, of at most 1,000 combinations each.
+    deduplicate: bool, default=True
+        Evaluate parameter sets that describe the same queue only once. Two
+        sets are merged when they give the same traffic intensity,
+        ``asa / aht`` ratio and method, for example
+        ``transactions=200, interval=60`` and ``transactions=100, interval=30``;
+        their results are copied back in grid order. Shrinkage only rescales
+        ``positions``, which is recomputed for each set, unless
+        ``scale_positions=True`` is passed.
+    output: {"list", "columns"}, default="list"
+        ``"list"`` returns one result (a float or a dictionary) per combination.
+        ``"columns"`` returns a :class:`~pyworkforce.utils.ColumnarResults`
+        with one NumPy array per result key and the parameters stored once as
+        categorical codes; the ``*_params`` attributes are then ``None``.
+    backend: {"auto", "vectorized", "joblib", "shared_memory"}, default="auto"
+        How the combinations are evaluated:
+
+        - ``"vectorized"``: every combination in a single NumPy pass, without
+          creating one task per combination. Requires ``method="exact"`` and
+          numeric method arguments.
+        - ``"joblib"``: one :class:`ErlangC` call per combination, dispatched
+          with joblib.
+        - ``"shared_memory"``: as ``"joblib"``, but the parameter table and the
+          results are kept in shared memory instead of being pickled to and
+          from the workers. Useful with many workers on a single machine.
+        - ``"auto"``: ``"vectorized"`` when the grids allow it, ``"joblib"``
+          otherwise.
+
+        Each Erlang C evaluation takes microseconds, so for numeric grids the
+        vectorized pass is much faster than dispatching the calls to workers.
 
     Attributes
     ----------
@@ -234,37 +631,111 @@ class MultiErlangC(BaseWorkforce):
         Parameters used for each ``required_positions`` result, in result order.
     """
 
-    def __init__(self, param_grid: dict, n_jobs: int = 2, pre_dispatch: str = '2 * n_jobs'):
+    _estimator = ErlangC
+    _backends = ("auto", "vectorized", "joblib", "shared_memory")
+
+    # Arguments each method accepts in the vectorized backend; the first one is required.
+    _vectorized_arguments = {
+        "waiting_probability": ("positions", "scale_positions"),
+        "service_level": ("positions", "scale_positions"),
+        "achieved_occupancy": ("positions", "scale_positions"),
+        "required_positions": ("service_level", "max_occupancy"),
+    }
+
+    def __init__(self, param_grid: dict, n_jobs: int = 2, pre_dispatch: str = '2 * n_jobs',
+                 batch_size="auto", backend: str = "auto", output: str = "list",
+                 deduplicate: bool = True):
+
+        _check_batch_size(batch_size)
+        _check_output(output)
+        _check_backend(backend, self._backends)
 
         self.param_grid = param_grid
         self.n_jobs = n_jobs
         self.pre_dispatch = pre_dispatch
-        self.param_list = list(ParameterGrid(self.param_grid))
+        self.batch_size = batch_size
+        self.backend = backend
+        self.output = output
+        self.deduplicate = deduplicate
+        self.param_list = _param_list(self.param_grid)
         self.waiting_probability_params = None
         self.service_level_params = None
         self.achieved_occupancy_params = None
         self.required_positions_params = None
 
-    def _solve(self, method_name, arguments_grid):
-        """Evaluate ``method_name`` over the cartesian product of both grids.
+    def _use_vectorized(self, method_name, arguments_list):
+        """Whether the combinations can be evaluated by the vectorized backend."""
+        if self.backend not in ("auto", "vectorized"):
+            return False
+
+        supported = (all(params.get("method", "exact") == "exact" for params in self.param_list)
+                     and all(self._vectorizable(method_name, arguments) for arguments in arguments_list))
+        if self.backend == "vectorized" and not supported:
+            raise ValueError("the vectorized backend requires method='exact' and numeric method arguments")
+        return supported
+
+    def _vectorizable(self, method_name, arguments):
+        accepted = self._vectorized_arguments.get(method_name)
+        if accepted is None or accepted[0] not in arguments:
+            return False
+        for name, value in arguments.items():
+            if name not in accepted:
+                return False
+            if name == "scale_positions":
+                valid = isinstance(value, bool)
+            elif name == "positions":
+                valid = isinstance(value, Integral) and not isinstance(value, bool)
+            else:
+                valid = isinstance(value, Real) and not isinstance(value, bool)
+            if not valid:
+                return False
+        return True
+
+    def _solve_vectorized(self, method_name, arguments_list, param_list):
+        """Evaluate every combination in one NumPy pass, in the joblib result order.
+
+        Estimator parameters vary along the rows and method arguments along
+        the columns, so the flattened results follow the same nested order as
+        the joblib backend.
 
         Returns
         -------
-        tuple(list, list)
-            The list of results and the parallel list of
-            ``(erlang_params, method_params)`` tuples that produced them.
-        """
-        arguments_list = list(ParameterGrid(arguments_grid))
-        used_params = [(erlang_params, method_params)
-                       for erlang_params in self.param_list
-                       for method_params in arguments_list]
-        combinations = len(self.param_list) * len(arguments_list)
-        results = Parallel(n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch)(
-            delayed(getattr(ErlangC(**params), method_name))(**arguments)
-            for params in self.param_list
-            for arguments in arguments_list)
-        self._check_solutions(results, combinations)
-        return results, used_params
+        numpy.ndarray or dict of numpy.ndarray
+            One value per combination; a dict of columns for ``required_positions``.
+        """
+        # Building the estimators validates the parameters exactly like the joblib backend.
+        estimators = [ErlangC(**params) for params in param_list]
+        intensity = np.array([erlang.intensity for erlang in estimators])[:, None]
+        asa_aht = np.array([erlang.asa / erlang.aht for erlang in estimators])[:, None]
+        shrinkage = np.array([erlang.shrinkage for erlang in estimators])[:, None]
+
+        if method_name == "required_positions":
+            for arguments in arguments_list:
+                check_in_range("service_level", arguments["service_level"], 0, 1)
+                check_in_range("max_occupancy", arguments.get("max_occupancy", 1.0), 0, 1, include_low=False)
+            service_level = np.array([arguments["service_level"] for arguments in arguments_list])
+            max_occupancy = np.array([arguments.get("max_occupancy", 1.0) for arguments in arguments_list])
+            return _kernels.erlang_c_required_positions(
+                intensity, asa_aht, service_level[None, :], max_occupancy[None, :], shrinkage)
+
+        positions = np.array([arguments["positions"] for arguments in arguments_list], dtype=np.int64)[None, :]
+        scale_positions = np.array([arguments.get("scale_positions", False) for arguments in arguments_list])
+        productive_positions = np.where(scale_positions[None, :], np.floor((1 - shrinkage) * positions),
+                                        positions).astype(np.int64)
+        intensity, productive_positions = np.broadcast_arrays(intensity, productive_positions)
+
+        if (productive_positions <= 0).any():
+            raise ValueError("productive positions must be greater than 0")
+        if (productive_positions <= intensity).any():
+            raise ValueError("positions must be greater than traffic intensity")
+
+        if method_name == "achieved_occupancy":
+            return (intensity / productive_positions).ravel()
+        waiting_probability = _kernels.erlang_c(intensity, productive_positions)
+        if method_name == "waiting_probability":
+            return waiting_probability.ravel()
+        return _kernels.erlang_c_service_level(intensity, productive_positions, waiting_probability,
+                                               asa_aht).ravel()
 
     def waiting_probability(self, arguments_grid):
         """
@@ -338,14 +809,30 @@ class MultiErlangC(BaseWorkforce):
         results, self.required_positions_params = self._solve("required_positions", arguments_grid)
         return results
 
-    def _check_solutions(self, solutions, combinations):
+    def iter_waiting_probability(self, arguments_grid):
+        """Streaming :meth:`waiting_probability`, see :meth:`_iter_solve`.
+
+        ``arguments_grid`` example: ``{"positions": [10, 20, 30], "scale_positions": [True, False]}``.
         """
-        Checks the integrity of the solution in terms of dimensions
+        return self._iter_solve("waiting_probability", arguments_grid)
+
+    def iter_service_level(self, arguments_grid):
+        """Streaming :meth:`service_level`, see :meth:`_iter_solve`.
+
+        ``arguments_grid`` example: ``{"positions": [10, 20, 30], "scale_positions": [True, False]}``.
         """
-        if len(solutions) < 1:  # noqa
-            raise ValueError("Could not find any solution, make sure the param_grid is defined correctly")
+        return self._iter_solve("service_level", arguments_grid)
 
-        if len(solutions) != combinations:
-            raise ValueError(f'Inconsistent results. Expected {combinations} '
-                             f'solutions, got {len(solutions)}'
-                             ) # noqa
+    def iter_achieved_occupancy(self, arguments_grid):
+        """Streaming :meth:`achieved_occupancy`, see :meth:`_iter_solve`.
+
+        ``arguments_grid`` example: ``{"positions": [10, 20, 30], "scale_positions": [True, False]}``.
+        """
+        return self._iter_solve("achieved_occupancy", arguments_grid)
+
+    def iter_required_positions(self, arguments_grid):
+        """Streaming :meth:`required_positions`, see :meth:`_iter_solve`.
+
+        ``arguments_grid`` example: ``{"service_level": [0.85, 0.9], "max_occupancy": [0.8, 0.95]}``.
+        """
+        return self._iter_solve("required_positions", arguments_grid)
@@ -14,13 +14,66 @@ If customers can wait in a queue, use :class:`pyworkforce.queuing.ErlangC`
 (infinite patience) or :class:`pyworkforce.queuing.ErlangA` (finite patience).
 """
 
+from collections import OrderedDict
 from math import ceil, floor
+from threading import Lock
 
-from joblib import Parallel, delayed
+import numpy as np
 
 from pyworkforce.base import BaseWorkforce
-from pyworkforce.utils import ParameterGrid
-from pyworkforce.utils.validation import check_in_range, check_positive_float
+from pyworkforce.queuing import _kernels
+from pyworkforce.queuing.base import (
+    BaseMultiErlang,
+    _check_backend,
+    _check_batch_size,
+    _check_output,
+    _param_list,
+    _search_order,
+)
+from pyworkforce.utils.validation import check_in_range, check_positive_float, check_positive_integer
+
+# Blocking tables B(0..n, A) shared by every ErlangB instance, keyed by the
+# offered traffic A and evicted least-recently-used first. The cache is bounded
+# both in number of tables and in total number of cached values, so sweeps over
+# large position counts cannot pin an unbounded amount of memory.
+_MAX_BLOCKING_TABLES = 128
+_MAX_BLOCKING_ELEMENTS = 2 ** 20
+_blocking_tables = OrderedDict()
+_blocking_elements = 0
+_blocking_tables_lock = Lock()
+
+
+def _blocking_table(intensity: float, positions: int) -> np.ndarray:
+    """Return the cached array ``[B(0, A), B(1, A), ...]`` covering at least ``positions``.
+
+    Tables are built with a single pass of the Erlang B recursion and only
+    ever extended, so repeated calls for the same traffic reuse earlier work.
+    Tables longer than the whole cache budget are returned without being
+    cached.
+    """
+    global _blocking_elements
+    with _blocking_tables_lock:
+        table = _blocking_tables.pop(intensity, None)
+        if table is None:
+            table = np.ones(1)
+        else:
+            _blocking_elements -= len(table)
+
+        if len(table) <= positions:
+            b = float(table[-1])
+            tail = []
+            for n in range(len(table), positions + 1):
+                b = (intensity * b) / (n + intensity * b)
+                tail.append(b)
+            table = np.concatenate((table, tail))
+
+        if len(table) <= _MAX_BLOCKING_ELEMENTS:
+            _blocking_tables[intensity] = table
+            _blocking_elements += len(table)
+            while len(_blocking_tables) > _MAX_BLOCKING_TABLES or _blocking_elements > _MAX_BLOCKING_ELEMENTS:
+                _, evicted = _blocking_tables.popitem(last=False)
+                _blocking_elements -= len(evicted)
+    return table
 
 
 class ErlangB(BaseWorkforce):
@@ -78,6 +131,10 @@ class ErlangB(BaseWorkforce):
         self.shrinkage = shrinkage
         self.intensity = (self.transactions / self.interval) * self.aht
 
+    def _sufficient_statistics(self):
+        """Values that determine every result up to shrinkage; equal values give identical results."""
+        return (self.intensity,)
+
     def _productive_positions(self, positions: int, scale_positions: bool = False) -> int:
         if scale_positions:
             productive_positions = floor((1 - self.shrinkage) * positions)
@@ -94,11 +151,11 @@ class ErlangB(BaseWorkforce):
 
         B(0, A) = 1
         B(n, A) = A * B(n-1, A) / (n + A * B(n-1, A))
+
+        Values are read from a blocking table shared across instances with the
+        same intensity, see :func:`_blocking_table`.
         """
-        b = 1.0
-        for n in range(1, productive_positions + 1):
-            b = (self.intensity * b) / (n + self.intensity * b)
-        return b
+        return float(_blocking_table(self.intensity, productive_positions)[productive_positions])
 
     def blocking_probability(self, positions: int, scale_positions: bool = False) -> float:
         """Probability that an arriving call is blocked (all trunks busy).
@@ -137,6 +194,60 @@ class ErlangB(BaseWorkforce):
         b = self._erlang_b(productive_positions)
         return self.intensity * (1 - b) / productive_positions
 
+    def sensitivity(self, positions: int, scale_positions: bool = False):
+        """Blocking probability and occupancy with their derivatives.
+
+        The intensity derivative is analytic, ``dB/dA = B * (c / A - 1 + B)``,
+        and the effect of one more position is read from the same blocking
+        table, so the whole table costs a single evaluation.
+
+        Parameters
+        ----------
+        positions : int
+            Number of trunks / channels / positions.
+        scale_positions : bool, default False
+            Set to ``True`` when *positions* already includes the shrinkage
+            padding.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per metric (``blocking_probability`` and ``occupancy``)
+            with its ``value`` and the columns:
+
+            ``positions``
+                Change from one more productive position.
+            ``intensity``
+                Derivative in the offered traffic. Multiply by
+                ``0.01 * intensity`` for the effect of 1% more calls.
+            ``aht``
+                Derivative in ``aht`` per minute, with the calls fixed.
+
+        Examples
+        --------
+        >>> from pyworkforce.queuing import ErlangB
+        >>> erlang = ErlangB(transactions=100, aht=3, interval=30)
+        >>> round(float(erlang.sensitivity(positions=17).loc["blocking_probability", "positions"]), 4)
+        -0.0058
+        """
+        import pandas as pd
+
+        productive_positions = self._productive_positions(positions, scale_positions)
+        table = _blocking_table(self.intensity, productive_positions + 1)
+        b, next_b = float(table[productive_positions]), float(table[productive_positions + 1])
+        intensity = self.intensity
+        d_b = b * (productive_positions / intensity - 1 + b)
+        occupancy = intensity * (1 - b) / productive_positions
+        d_occupancy = (1 - b - intensity * d_b) / productive_positions
+
+        # aht scales the offered traffic: dA / d(aht) = A / aht.
+        sensitivities = {
+            "blocking_probability": [b, next_b - b, d_b, d_b * intensity / self.aht],
+            "occupancy": [occupancy, intensity * (1 - next_b) / (productive_positions + 1) - occupancy,
+                          d_occupancy, d_occupancy * intensity / self.aht],
+        }
+        return pd.DataFrame.from_dict(sensitivities, orient="index", columns=["value", "positions", "intensity", "aht"])
+
     def required_positions(self, max_blocking: float, max_occupancy: float = 1.0) -> dict:
         """Minimum number of positions to stay within the blocking target.
 
@@ -160,12 +271,34 @@ class ErlangB(BaseWorkforce):
             ``occupancy``
                 Achieved occupancy at *raw_positions*.
         """
+        return self._required_positions(max_blocking, max_occupancy)
+
+    def _required_positions_batch(self, arguments_list: list) -> list:
+        """:meth:`required_positions` for several argument sets, in their order.
+
+        Targets are visited from the loosest to the strictest blocking target
+        and each scan resumes at the previous answer, so a whole curve of
+        targets costs about as much as its strictest target.
+        """
+        results = [None] * len(arguments_list)
+        for group in _search_order(self.required_positions, arguments_list, "max_blocking", increasing=False):
+            start = 1
+            for index, arguments in group:
+                results[index] = self._required_positions(**arguments, start=start)
+                start = results[index]["raw_positions"]
+        return results
+
+    def _required_positions(self, max_blocking: float, max_occupancy: float = 1.0, start: int = 1) -> dict:
+        """:meth:`required_positions` scanning from ``start``, a known lower bound."""
         check_in_range("max_blocking", max_blocking, 0, 1)
         check_in_range("max_occupancy", max_occupancy, 0, 1, include_low=False)
 
-        positions = 1
+        table = _blocking_table(self.intensity, max(ceil(self.intensity) + 1, start))
+        positions = start
         while True:
-            b = self._erlang_b(positions)
+            if positions >= len(table):
+                table = _blocking_table(self.intensity, 2 * positions)
+            b = float(table[positions])
             occupancy = self.intensity * (1 - b) / positions
             if b <= max_blocking and occupancy <= max_occupancy:
                 break
@@ -177,12 +310,52 @@ class ErlangB(BaseWorkforce):
         return {
             "raw_positions": raw_positions,
             "positions": scaled_positions,
-            "blocking_probability": self._erlang_b(raw_positions),
-            "occupancy": self.intensity * (1 - self._erlang_b(raw_positions)) / raw_positions,
+            "blocking_probability": b,
+            "occupancy": occupancy,
         }
 
+    @staticmethod
+    def max_intensity(positions, max_blocking: float):
+        """Largest offered traffic that *positions* can serve within the blocking target.
+
+        This is the inverse Erlang B problem used for trunk planning: how many
+        Erlangs can ``c`` trunks carry at 1% blocking? It is solved with a
+        safeguarded Newton iteration on the Erlang B recursion, whose
+        derivative ``dB/dA = B * (c / A - 1 + B)`` comes for free with each
+        evaluation.
+
+        Parameters
+        ----------
+        positions : int or array-like of int
+            Number of trunks / channels / positions. An array returns one
+            value per entry, which builds whole capacity tables at once.
+        max_blocking : float
+            Blocking probability target, in ``(0, 1)``.
+
+        Returns
+        -------
+        float or numpy.ndarray
+            Offered traffic ``A`` in Erlangs with ``B(positions, A) = max_blocking``.
+            The carried traffic is ``A * (1 - max_blocking)``.
+
+        Examples
+        --------
+        >>> from pyworkforce.queuing import ErlangB
+        >>> round(ErlangB.max_intensity(10, max_blocking=0.01), 3)
+        4.461
+        """
+        check_in_range("max_blocking", max_blocking, 0, 1, include_low=False, include_high=False)
+        if np.ndim(positions) == 0:
+            check_positive_integer("positions", positions)
+            return float(_kernels.erlang_b_max_intensity(positions, max_blocking))
+
+        positions = np.asarray(positions)
+        if not np.issubdtype(positions.dtype, np.integer) or (positions <= 0).any():
+            raise ValueError("positions must be positive integers")
+        return _kernels.erlang_b_max_intensity(positions, max_blocking)
+
 
-class MultiErlangB(BaseWorkforce):
+class MultiErlangB(BaseMultiErlang):
     """
     Runs Erlang B calculations over multiple parameter combinations.
 
@@ -203,10 +376,30 @@ class MultiErlangB(BaseWorkforce):
                 "shrinkage": [0.0],
             }
 
+        A :class:`~pyworkforce.utils.ParameterSampler` can be passed instead
+        to evaluate a random or Latin hypercube sample of a larger space.
+
     n_jobs : int, default 2
         Number of parallel workers (``-1`` = all CPUs, ``1`` = sequential).
     pre_dispatch : str or int, default ``'2 * n_jobs'``
         Task batches to pre-dispatch. See joblib's documentation.
+    batch_size : int or ``"auto"``, default ``"auto"``
+        Combinations evaluated per joblib task. ``"auto"`` splits the
+        combinations into about four blocks per worker, of at most 1,000
+        combinations each.
+    deduplicate : bool, default True
+        Evaluate parameter sets with the same traffic intensity only once and
+        copy their results back in grid order, rescaling ``positions`` with
+        each set's shrinkage. Shrinkage is compared too for
+        ``scale_positions=True``.
+    output : ``"list"`` or ``"columns"``, default ``"list"``
+        ``"columns"`` returns a :class:`~pyworkforce.utils.ColumnarResults`
+        instead of a list of results; the ``*_params`` attributes are then
+        ``None``.
+    backend : ``"auto"``, ``"joblib"`` or ``"shared_memory"``, default ``"auto"``
+        ``"shared_memory"`` keeps the parameter table and the results in
+        shared memory instead of pickling them to and from the workers.
+        ``"auto"`` uses ``"joblib"``.
 
     Attributes
     ----------
@@ -216,33 +409,26 @@ class MultiErlangB(BaseWorkforce):
         Populated after the corresponding method is called.
     """
 
+    _estimator = ErlangB
+
     def __init__(self, param_grid: dict, n_jobs: int = 2,
-                 pre_dispatch: str = "2 * n_jobs"):
+                 pre_dispatch: str = "2 * n_jobs", batch_size="auto", output: str = "list",
+                 deduplicate: bool = True, backend: str = "auto"):
+        _check_batch_size(batch_size)
+        _check_output(output)
+        _check_backend(backend, self._backends)
         self.param_grid = param_grid
         self.n_jobs = n_jobs
         self.pre_dispatch = pre_dispatch
-        self.param_list = list(ParameterGrid(self.param_grid))
+        self.batch_size = batch_size
+        self.output = output
+        self.deduplicate = deduplicate
+        self.backend = backend
+        self.param_list = _param_list(self.param_grid)
         self.blocking_probability_params = None
         self.achieved_occupancy_params = None
         self.required_positions_params = None
 
-    def _solve(self, method_name, arguments_grid):
-        """Evaluate *method_name* over the Cartesian product of both grids."""
-        arguments_list = list(ParameterGrid(arguments_grid))
-        used_params = [
-            (erlang_params, method_params)
-            for erlang_params in self.param_list
-            for method_params in arguments_list
-        ]
-        combinations = len(self.param_list) * len(arguments_list)
-        results = Parallel(n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch)(
-            delayed(getattr(ErlangB(**params), method_name))(**arguments)
-            for params in self.param_list
-            for arguments in arguments_list
-        )
-        self._check_solutions(results, combinations)
-        return results, used_params
-
     def blocking_probability(self, arguments_grid: dict) -> list:
         """Blocking probability for every grid combination.
 
@@ -268,12 +454,23 @@ class MultiErlangB(BaseWorkforce):
         results, self.required_positions_params = self._solve("required_positions", arguments_grid)
         return results
 
-    def _check_solutions(self, solutions, combinations):
-        if len(solutions) < 1:
-            raise ValueError(
-                "Could not find any solution; make sure the param_grid is defined correctly"
-            )
-        if len(solutions) != combinations:
-            raise ValueError(
-                f"Inconsistent results. Expected {combinations} solutions, got {len(solutions)}"
-            )
+    def iter_blocking_probability(self, arguments_grid):
+        """Streaming :meth:`blocking_probability`, see :meth:`_iter_solve`.
+
+        ``arguments_grid`` example: ``{"positions": [10, 15, 20]}``.
+        """
+        return self._iter_solve("blocking_probability", arguments_grid)
+
+    def iter_achieved_occupancy(self, arguments_grid):
+        """Streaming :meth:`achieved_occupancy`, see :meth:`_iter_solve`.
+
+        ``arguments_grid`` example: ``{"positions": [10, 15, 20]}``.
+        """
+        return self._iter_solve("achieved_occupancy", arguments_grid)
+
+    def iter_required_positions(self, arguments_grid):
+        """Streaming :meth:`required_positions`, see :meth:`_iter_solve`.
+
+        ``arguments_grid`` example: ``{"max_blocking": [0.01, 0.02], "max_occupancy": [0.8]}``.
+        """
+        return self._iter_solve("required_positions", arguments_grid)
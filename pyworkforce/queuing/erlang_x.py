@@ -0,0 +1,386 @@
+"""Erlang X: finite waiting room, abandonment and redials.
+
+Real queues combine the effects that :class:`ErlangB` and :class:`ErlangA`
+model separately: there are only so many trunks, so calls that find every
+position and waiting place busy are blocked; waiting customers abandon; and
+part of the blocked and abandoned customers call again. Redials add to the
+load, which increases losses, which creates more redials.
+
+:class:`ErlangX` models the queue as the ``M/M/c/c+K+M`` birth-death chain
+and treats redials as extra Poisson arrivals in the same interval. The total
+arrival rate ``lam`` then solves the retrial fixed point
+
+``lam = fresh_rate + redial_probability * lam * lost(lam)``
+
+where ``lost(lam)`` is the fraction of arrivals that are blocked or abandon.
+The right-hand side grows more slowly than ``lam``, so the root is unique and
+is found by regula falsi between ``fresh_rate`` and
+``fresh_rate / (1 - redial_probability)``; every step is one vectorized
+evaluation of the chain.
+"""
+
+from collections import OrderedDict
+from math import ceil
+
+import numpy as np
+
+from pyworkforce.base import BaseWorkforce
+from pyworkforce.queuing.abandonment import (
+    _birth_death_distribution,
+    _lru_get,
+    _served_within,
+    _smallest_feasible_positions,
+)
+from pyworkforce.utils.validation import check_in_range, check_positive_float
+
+# Relative tolerance of the retrial fixed point.
+_RETRIAL_TOLERANCE = 1e-12
+# Iterations of the fixed point solver, far more than it needs.
+_MAX_RETRIAL_ITERATIONS = 100
+
+
+class ErlangX(BaseWorkforce):
+    """
+    Staffing and performance metrics for a queue with a finite waiting room,
+    abandonment and redials (Erlang X).
+
+    Parameters
+    ----------
+    transactions: float,
+        Number of fresh transactions arriving in the interval, excluding
+        redials.
+    aht: float,
+        Average handling time of a transaction (minutes).
+    asa: float,
+        The required average speed of answer (minutes). Used as the default
+        target when computing the service level.
+    interval: int,
+        Interval length, in minutes.
+    patience: float,
+        Average time (minutes) a customer waits before abandoning the queue.
+    queue_capacity: int,
+        Number of waiting places. Customers who arrive when every position and
+        waiting place is taken are blocked. ``0`` gives a pure loss system.
+    redial_probability: float, default=0.0
+        Probability that a blocked or abandoned customer calls again within
+        the interval, in ``[0, 1)``.
+    shrinkage: float, default=0.0
+        Fraction of time that an operator unit is not available, in ``[0, 1)``.
+
+    Attributes
+    ----------
+    intensity: float,
+        Fresh traffic intensity in Erlangs (``transactions / interval * aht``).
+
+    Notes
+    -----
+    Probabilities and the service level refer to all arrivals, redials
+    included; blocked transactions count as not answered in time. The average
+    speed of answer is the mean wait of the transactions admitted to the
+    queue. With ``redial_probability=0`` and a large ``queue_capacity`` the
+    metrics converge to :class:`ErlangA`.
+
+    Examples
+    --------
+    >>> from pyworkforce.queuing import ErlangX
+    >>> erlang = ErlangX(transactions=100, aht=3, asa=20 / 60, interval=30, patience=5,
+    ...                  queue_capacity=10, redial_probability=0.5)
+    >>> erlang.required_positions(service_level=0.8)["raw_positions"]
+    13
+    """
+
+    def __init__(self, transactions: float, aht: float, asa: float, interval: int, patience: float,
+                 queue_capacity: int, redial_probability: float = 0.0, shrinkage: float = 0.0):
+
+        check_positive_float("transactions", transactions)
+        check_positive_float("aht", aht)
+        check_positive_float("asa", asa)
+        check_positive_float("interval", interval)
+        check_positive_float("patience", patience)
+        if isinstance(queue_capacity, bool) or not isinstance(queue_capacity, int) or queue_capacity < 0:
+            raise ValueError(f"queue_capacity must be a non-negative integer, got {queue_capacity!r}")
+        check_in_range("redial_probability", redial_probability, 0, 1, include_high=False)
+        check_in_range("shrinkage", shrinkage, 0, 1, include_high=False)
+
+        self.transactions = transactions
+        self.aht = aht
+        self.asa = asa
+        self.interval = interval
+        self.patience = patience
+        self.queue_capacity = queue_capacity
+        self.redial_probability = redial_probability
+        self.shrinkage = shrinkage
+
+        # Rates expressed per minute.
+        self.arrival_rate = transactions / interval
+        self.service_rate = 1.0 / aht
+        self.abandonment_rate = 1.0 / patience
+        self.intensity = self.arrival_rate / self.service_rate
+
+        self._metrics_cache = OrderedDict()
+        self._service_level_cache = OrderedDict()
+
+    def _death_rates(self, positions):
+        states = np.arange(1, positions + self.queue_capacity + 1)
+        return (np.minimum(states, positions) * self.service_rate
+                + np.maximum(states - positions, 0) * self.abandonment_rate)
+
+    def _chain(self, positions, death_rates, arrival_rate):
+        """Stationary distribution and lost fraction for a total ``arrival_rate``."""
+        probs = _birth_death_distribution(arrival_rate, death_rates)
+        queue_length = np.arange(self.queue_capacity + 1) @ probs[positions:]
+        lost = probs[-1] + self.abandonment_rate * queue_length / arrival_rate
+        return probs, float(queue_length), float(lost)
+
+    def _retrial_arrival_rate(self, positions, death_rates):
+        """Total arrival rate, fresh plus redials, that solves the retrial fixed point.
+
+        ``excess(lam) = lam * (1 - r * lost(lam)) - fresh_rate`` is increasing
+        in ``lam``, negative at ``fresh_rate`` and non-negative at
+        ``fresh_rate / (1 - r)``. Its root is found with the Illinois variant
+        of regula falsi, which converges superlinearly and never leaves the
+        bracket.
+        """
+        fresh, redial = self.arrival_rate, self.redial_probability
+        if redial == 0:
+            return fresh
+
+        def excess(rate):
+            return rate * (1 - redial * self._chain(positions, death_rates, rate)[2]) - fresh
+
+        low, high = fresh, fresh / (1 - redial)
+        low_excess, high_excess = excess(low), excess(high)
+        if low_excess >= 0:
+            return low
+        if high_excess <= 0:
+            return high
+
+        rate, side = low, 0
+        for _ in range(_MAX_RETRIAL_ITERATIONS):
+            rate = (low * high_excess - high * low_excess) / (high_excess - low_excess)
+            rate_excess = excess(rate)
+            if abs(rate_excess) <= _RETRIAL_TOLERANCE * fresh or high - low <= _RETRIAL_TOLERANCE * high:
+                break
+            if rate_excess < 0:
+                low, low_excess = rate, rate_excess
+                if side == -1:
+                    high_excess /= 2
+                side = -1
+            else:
+                high, high_excess = rate, rate_excess
+                if side == 1:
+                    low_excess /= 2
+                side = 1
+        return rate
+
+    def _metrics(self, positions):
+        """Core stationary metrics for ``positions`` servers, cached per instance."""
+        return _lru_get(self._metrics_cache, positions, lambda: self._compute_metrics(positions))
+
+    def _compute_metrics(self, positions):
+        c = positions
+        death_rates = self._death_rates(c)
+        arrival_rate = self._retrial_arrival_rate(c, death_rates)
+        probs, queue_length, _ = self._chain(c, death_rates, arrival_rate)
+
+        blocking_probability = float(probs[-1])
+        admitted_rate = arrival_rate * (1 - blocking_probability)
+        abandonment_probability = self.abandonment_rate * queue_length / arrival_rate
+        throughput = admitted_rate - self.abandonment_rate * queue_length
+
+        return {
+            "probs": probs,
+            "arrival_rate": arrival_rate,
+            "blocking_probability": blocking_probability,
+            "waiting_probability": float(probs[c:-1].sum()),
+            "abandonment_probability": abandonment_probability,
+            "occupancy": throughput / (c * self.service_rate),
+            "average_queue_length": queue_length,
+            "average_speed_of_answer": queue_length / admitted_rate,
+        }
+
+    def total_transactions(self, positions: int):
+        """Transactions arriving in the interval, fresh and redialed.
+
+        Parameters
+        ----------
+        positions: int,
+            Number of available positions (servers).
+        """
+        self._check_positions(positions)
+        return self._metrics(positions)["arrival_rate"] * self.interval
+
+    def blocking_probability(self, positions: int):
+        """Probability that an arriving transaction finds no free position or waiting place.
+
+        Parameters
+        ----------
+        positions: int,
+            Number of available positions (servers).
+        """
+        self._check_positions(positions)
+        return self._metrics(positions)["blocking_probability"]
+
+    def waiting_probability(self, positions: int):
+        """Probability that an arriving transaction is admitted to the queue and waits.
+
+        Parameters
+        ----------
+        positions: int,
+            Number of available positions (servers).
+        """
+        self._check_positions(positions)
+        return self._metrics(positions)["waiting_probability"]
+
+    def abandonment_probability(self, positions: int):
+        """Probability that an arriving transaction abandons the queue.
+
+        Parameters
+        ----------
+        positions: int,
+            Number of available positions (servers).
+        """
+        self._check_positions(positions)
+        return self._metrics(positions)["abandonment_probability"]
+
+    def achieved_occupancy(self, positions: int):
+        """Expected fraction of busy positions (server utilization).
+
+        Parameters
+        ----------
+        positions: int,
+            Number of available positions (servers).
+        """
+        self._check_positions(positions)
+        return self._metrics(positions)["occupancy"]
+
+    def average_speed_of_answer(self, positions: int):
+        """Expected waiting time (minutes) of the transactions admitted to the queue.
+
+        Parameters
+        ----------
+        positions: int,
+            Number of available positions (servers).
+        """
+        self._check_positions(positions)
+        return self._metrics(positions)["average_speed_of_answer"]
+
+    def service_level(self, positions: int, asa: float = None):
+        """Fraction of arriving transactions answered within ``asa`` minutes.
+
+        Admitted transactions that wait are served in time with the
+        closed-form probability of :class:`ErlangA`; blocked transactions are
+        never answered.
+
+        Parameters
+        ----------
+        positions: int,
+            Number of available positions (servers).
+        asa: float, optional
+            Target answer time in minutes. Defaults to the ``asa`` given at
+            construction time.
+        """
+        self._check_positions(positions)
+        if asa is None:
+            asa = self.asa
+        check_positive_float("asa", asa)
+        return self._service_level(positions, asa)
+
+    def _service_level(self, positions, asa):
+        return _lru_get(self._service_level_cache, (positions, asa),
+                        lambda: self._compute_service_level(positions, asa))
+
+    def _compute_service_level(self, c, asa):
+        probs = self._metrics(c)["probs"]
+        served = probs[:c].sum()
+        if self.queue_capacity:
+            # An admitted customer has between 0 and queue_capacity - 1 customers ahead.
+            served += probs[c:-1] @ _served_within(c * self.service_rate, self.abandonment_rate,
+                                                   self.queue_capacity - 1, asa)
+        return min(1.0, float(served))
+
+    def evaluate(self, positions: int, asa: float = None):
+        """All performance metrics for ``positions`` from a single distribution.
+
+        Returns
+        -------
+        dict
+            Keys: ``service_level``, ``occupancy``, ``blocking_probability``,
+            ``abandonment_probability``, ``waiting_probability``,
+            ``average_speed_of_answer``, ``average_queue_length`` and
+            ``total_transactions``.
+        """
+        service_level = self.service_level(positions, asa=asa)
+        metrics = self._metrics(positions)
+        return {
+            "service_level": service_level,
+            "occupancy": metrics["occupancy"],
+            "blocking_probability": metrics["blocking_probability"],
+            "abandonment_probability": metrics["abandonment_probability"],
+            "waiting_probability": metrics["waiting_probability"],
+            "average_speed_of_answer": metrics["average_speed_of_answer"],
+            "average_queue_length": metrics["average_queue_length"],
+            "total_transactions": metrics["arrival_rate"] * self.interval,
+        }
+
+    def required_positions(self, service_level: float, max_occupancy: float = 1.0,
+                           max_abandonment: float = 1.0, max_blocking: float = 1.0, asa: float = None):
+        """Smallest number of positions meeting every target.
+
+        Parameters
+        ----------
+        service_level: float,
+            Target fraction of transactions answered within ``asa``, in ``[0, 1]``.
+        max_occupancy: float, default=1.0
+            Maximum allowed server occupancy, in ``(0, 1]``.
+        max_abandonment: float, default=1.0
+            Maximum allowed abandonment probability, in ``[0, 1]``.
+        max_blocking: float, default=1.0
+            Maximum allowed blocking probability, in ``[0, 1]``.
+        asa: float, optional
+            Target answer time in minutes. Defaults to the construction ``asa``.
+
+        Returns
+        -------
+        dict
+            Keys: ``raw_positions`` (before shrinkage), ``positions`` (after
+            shrinkage), ``service_level``, ``occupancy``,
+            ``abandonment_probability``, ``waiting_probability``,
+            ``average_speed_of_answer``, ``blocking_probability`` and
+            ``total_transactions``.
+        """
+        check_in_range("service_level", service_level, 0, 1)
+        check_in_range("max_occupancy", max_occupancy, 0, 1, include_low=False)
+        check_in_range("max_abandonment", max_abandonment, 0, 1)
+        check_in_range("max_blocking", max_blocking, 0, 1)
+        if asa is None:
+            asa = self.asa
+        check_positive_float("asa", asa)
+
+        def meets_targets(positions):
+            metrics = self._metrics(positions)
+            return (self._service_level(positions, asa) >= service_level
+                    and metrics["occupancy"] <= max_occupancy
+                    and metrics["abandonment_probability"] <= max_abandonment
+                    and metrics["blocking_probability"] <= max_blocking)
+
+        raw_positions = _smallest_feasible_positions(meets_targets, self.intensity, self.transactions, self.aht,
+                                                     asa, self.interval, service_level, max_occupancy)
+        metrics = self._metrics(raw_positions)
+
+        return {
+            "raw_positions": raw_positions,
+            "positions": int(ceil(raw_positions / (1 - self.shrinkage))),
+            "service_level": self._service_level(raw_positions, asa),
+            "occupancy": metrics["occupancy"],
+            "abandonment_probability": metrics["abandonment_probability"],
+            "waiting_probability": metrics["waiting_probability"],
+            "average_speed_of_answer": metrics["average_speed_of_answer"],
+            "blocking_probability": metrics["blocking_probability"],
+            "total_transactions": metrics["arrival_rate"] * self.interval,
+        }
+
+    @staticmethod
+    def _check_positions(positions):
+        if isinstance(positions, bool) or not isinstance(positions, int) or positions <= 0:
+            raise ValueError(f"positions must be a positive integer, got {positions!r}")
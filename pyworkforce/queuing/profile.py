@@ -0,0 +1,181 @@
+"""Erlang C staffing for a whole day of intervals with time-varying arrivals.
+
+Sizing each interval with its own :class:`ErlangC` assumes the queue reaches
+steady state within every interval (the pointwise-stationary approximation).
+When arrivals change quickly relative to the handling time, the load actually
+in the system lags behind the arrivals. :class:`StaffingProfile` offers the
+pointwise-stationary approximation and two corrections for that lag, and sizes
+every interval in a single vectorized pass of the Erlang B recursion.
+"""
+
+import numpy as np
+
+from pyworkforce.base import BaseWorkforce
+from pyworkforce.queuing import _kernels
+from pyworkforce.utils.validation import check_array, check_in_range, check_positive_float
+
+
+class StaffingProfile(BaseWorkforce):
+    """
+    Erlang C staffing requirements for a sequence of intervals.
+
+    Parameters
+    ----------
+    transactions: array-like,
+        Transactions arriving in each interval, in order. Intervals without
+        arrivals are allowed.
+    aht: float or array-like,
+        Average handling time (minutes), for all intervals or one per interval.
+    asa: float or array-like,
+        Required average speed of answer (minutes).
+    interval: float,
+        Length of every interval, in minutes.
+    shrinkage: float or array-like, default=0.0
+        Fraction of time that an operator unit is not available, in ``[0, 1)``.
+    method: {"psa", "lagged", "offered_load"}, default="psa"
+        Offered load used to size each interval:
+
+        - ``"psa"``: pointwise-stationary approximation, the arrival rate of
+          the interval times ``aht``. Identical to one :class:`ErlangC` per
+          interval.
+        - ``"lagged"``: lagged PSA, the average arrival rate over the interval
+          shifted back by ``aht``, since calls in service arrived about one
+          handling time earlier.
+        - ``"offered_load"``: the mean number of busy servers in an infinite
+          server system fed by the piecewise constant arrivals,
+          ``m(k+1) = m(k) exp(-interval / aht) + rate(k) aht (1 - exp(-interval / aht))``,
+          averaged over each interval. It carries load over from busy
+          intervals into the following ones.
+    periodic: bool, default=False
+        Treat the profile as a repeating cycle, such as a day that starts where
+        the previous one ended, so the lag wraps around from the last
+        intervals. Otherwise the system is assumed to be in steady state with
+        the first interval's arrivals before the profile starts.
+
+    Attributes
+    ----------
+    intensity: numpy.ndarray,
+        Offered load in Erlangs used for each interval.
+
+    Examples
+    --------
+    >>> from pyworkforce.queuing import StaffingProfile
+    >>> profile = StaffingProfile(transactions=[20, 100, 300, 100], aht=10, asa=20 / 60, interval=15,
+    ...                           method="offered_load")
+    >>> profile.required_positions(service_level=0.8)["raw_positions"].tolist()
+    [18, 46, 135, 129]
+    """
+
+    _methods = ("psa", "lagged", "offered_load")
+
+    def __init__(self, transactions, aht, asa, interval, shrinkage=0.0, method="psa", periodic=False):
+        transactions = check_array("transactions", transactions, check_in_range, 0, np.inf)
+        if transactions.ndim != 1 or not len(transactions):
+            raise ValueError(f"transactions must be a non-empty one-dimensional array, got shape "
+                             f"{transactions.shape}")
+        check_positive_float("interval", interval)
+        if method not in self._methods:
+            raise ValueError(f"method must be one of {self._methods}, got {method!r}")
+
+        self.transactions = transactions
+        self.aht = aht
+        self.asa = asa
+        self.interval = interval
+        self.shrinkage = shrinkage
+        self.method = method
+        self.periodic = periodic
+
+        size = len(transactions)
+        self._aht = self._per_interval("aht", check_array("aht", aht, check_positive_float), size)
+        self._asa = self._per_interval("asa", check_array("asa", asa, check_positive_float), size)
+        self._shrinkage = self._per_interval(
+            "shrinkage", check_array("shrinkage", shrinkage, check_in_range, 0, 1, include_high=False), size)
+        self.intensity = self._offered_load()
+
+    @staticmethod
+    def _per_interval(name, values, size):
+        try:
+            return np.broadcast_to(values, (size,)).astype(float)
+        except ValueError:
+            raise ValueError(f"{name} must be a scalar or have one value per interval, got shape "
+                             f"{values.shape}") from None
+
+    def _offered_load(self):
+        rate = self.transactions / self.interval
+        if self.method == "psa":
+            return rate * self._aht
+        if self.method == "lagged":
+            start = np.arange(len(rate)) * self.interval - self._aht
+            return (self._cumulative_arrivals(start + self.interval)
+                    - self._cumulative_arrivals(start)) / self.interval * self._aht
+
+        # Infinite-server load at the start of each interval, then its average over the interval.
+        decay = np.exp(-self.interval / self._aht)
+        stationary = rate * self._aht
+        boundary = np.empty(len(rate))
+        load = 0.0 if self.periodic else stationary[0]
+        for k in range(len(rate)):
+            boundary[k] = load
+            load = load * decay[k] + stationary[k] * (1 - decay[k])
+        if self.periodic:
+            # The recursion is linear in its initial load; pick the one the cycle returns to.
+            boundary += np.cumprod(np.concatenate(([1.0], decay[:-1]))) * load / (1 - np.prod(decay))
+        return stationary + (boundary - stationary) * (1 - decay) * self._aht / self.interval
+
+    def _cumulative_arrivals(self, times):
+        """Arrivals since the start of the profile at ``times``; negative times count back."""
+        horizon = len(self.transactions) * self.interval
+        cumulative = np.concatenate(([0.0], np.cumsum(self.transactions)))
+        grid = np.arange(len(cumulative)) * self.interval
+        if not self.periodic:
+            return np.where(times < 0, times * self.transactions[0] / self.interval,
+                            np.interp(times, grid, cumulative))
+        cycles = np.floor(times / horizon)
+        return cycles * cumulative[-1] + np.interp(times - cycles * horizon, grid, cumulative)
+
+    def required_positions(self, service_level: float, max_occupancy: float = 1.0):
+        """
+        Computes the positions required in every interval.
+
+        Intervals with the same offered load and targets share one evaluation,
+        and all intervals advance through a single Erlang B recursion.
+
+        Parameters
+        ----------
+        service_level: float or array-like,
+            Target service level, for all intervals or one per interval.
+        max_occupancy: float or array-like, default=1.0
+            Maximum occupancy allowed.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per interval with ``transactions``, ``intensity`` and the
+            keys of :meth:`ErlangC.required_positions`. Intervals without load
+            need no positions.
+        """
+        import pandas as pd
+
+        size = len(self.transactions)
+        service_level = self._per_interval(
+            "service_level", check_array("service_level", service_level, check_in_range, 0, 1), size)
+        max_occupancy = self._per_interval(
+            "max_occupancy", check_array("max_occupancy", max_occupancy, check_in_range, 0, 1, include_low=False),
+            size)
+
+        scenarios = np.column_stack([self.intensity, self._asa / self._aht, service_level, max_occupancy,
+                                     self._shrinkage])
+        loaded = self.intensity > 0
+        results = {
+            "raw_positions": np.zeros(size, dtype=np.int64),
+            "positions": np.zeros(size, dtype=np.int64),
+            "service_level": np.ones(size),
+            "occupancy": np.zeros(size),
+            "waiting_probability": np.zeros(size),
+        }
+        if loaded.any():
+            unique, inverse = np.unique(scenarios[loaded], axis=0, return_inverse=True)
+            columns = _kernels.erlang_c_required_positions(*unique.T)
+            for key, values in results.items():
+                values[loaded] = columns[key][inverse.ravel()]
+        return pd.DataFrame({"transactions": self.transactions, "intensity": self.intensity, **results})
@@ -0,0 +1,272 @@
+"""Precomputed Erlang B / Erlang C lookup tables.
+
+Real-time dashboards evaluate the same queues thousands of times per second.
+:class:`ErlangTable` precomputes the Erlang B blocking probability on a dense,
+uniform grid of traffic intensities for every number of positions, and answers
+queries with an O(1) index lookup plus cubic Hermite interpolation. The slope
+of Erlang B is known in closed form, ``dB/dA = B * (c / A - 1 + B)``, so the
+interpolation needs no extra storage and its error shrinks with the fourth
+power of the grid step.
+
+Everything else follows exactly from the blocking probability: the Erlang C
+waiting probability is ``c * B / (c - A * (1 - B))`` and the service level is
+``1 - C * exp(-(c - A) * asa / aht)``. The ``asa / aht`` ratio therefore does
+not need a grid dimension of its own.
+
+Tables are stored as a single ``.npy`` array that can be memory-mapped, so
+several processes can share one copy.
+"""
+
+from math import ceil
+
+import numpy as np
+
+from pyworkforce.base import BaseWorkforce
+from pyworkforce.queuing import _kernels
+from pyworkforce.utils.validation import (
+    check_array,
+    check_in_range,
+    check_positive_float,
+    check_positive_integer,
+)
+
+
+class ErlangTable(BaseWorkforce):
+    """
+    Lookup table for Erlang B and Erlang C metrics.
+
+    Parameters
+    ----------
+    max_intensity: float,
+        Largest traffic intensity, in Erlangs, that the table answers.
+    max_positions: int,
+        Largest number of positions that the table answers.
+    resolution: int, default=20
+        Grid points per Erlang. The interpolation error decreases like
+        ``resolution ** -4``.
+    tolerance: float, default=1e-6
+        Maximum absolute interpolation error allowed for the blocking and
+        waiting probabilities. After building, the table is checked against
+        the exact recursion at the midpoint of every grid cell, where the
+        interpolation error is largest, and a ``ValueError`` is raised if
+        the tolerance is exceeded.
+
+    Attributes
+    ----------
+    table_: numpy.ndarray of shape (max_positions + 1, n_intensities),
+        Row 0 holds the intensity grid (``B(0, A) = 1`` needs no storage) and
+        row ``c`` holds ``B(c, A)`` over that grid.
+    max_error_: float or None,
+        Largest interpolation error found by the tolerance check. ``None`` for
+        tables read with :meth:`load`.
+
+    Examples
+    --------
+    >>> from pyworkforce.queuing import ErlangTable
+    >>> table = ErlangTable(max_intensity=50, max_positions=80)
+    >>> round(float(table.service_level(intensity=10, positions=14, asa=20 / 60, aht=3)), 3)
+    0.888
+    """
+
+    def __init__(self, max_intensity: float, max_positions: int, resolution: int = 20,
+                 tolerance: float = 1e-6):
+
+        check_positive_float("max_intensity", max_intensity)
+        check_positive_integer("max_positions", max_positions)
+        check_positive_integer("resolution", resolution)
+        check_positive_float("tolerance", tolerance)
+
+        self.max_intensity = max_intensity
+        self.max_positions = max_positions
+        self.resolution = resolution
+        self.tolerance = tolerance
+
+        grid = np.arange(ceil(max_intensity * resolution) + 1) / resolution
+        self.table_ = self._build(grid, max_positions)
+        self.max_error_ = self._check_tolerance()
+
+    @staticmethod
+    def _build(grid, max_positions):
+        """Run the Erlang B recursion over the whole intensity grid at once."""
+        table = np.empty((max_positions + 1, len(grid)))
+        table[0] = grid
+        blocking = np.ones(len(grid))
+        for position in range(1, max_positions + 1):
+            blocking = grid * blocking / (position + grid * blocking)
+            table[position] = blocking
+        return table
+
+    def _check_tolerance(self):
+        """Compare interpolated and exact values at every cell midpoint."""
+        grid = self.table_[0]
+        midpoints = (grid[:-1] + grid[1:]) / 2
+        exact = self._build(midpoints, self.max_positions)[1:]
+        positions = np.arange(1, self.max_positions + 1)[:, None]
+        interpolated = self._interpolate(midpoints[None, :], positions)
+
+        error = np.abs(interpolated - exact)
+        stable = positions > midpoints
+        error_c = np.abs(_kernels.erlang_c_from_b(midpoints, positions, interpolated)
+                         - _kernels.erlang_c_from_b(midpoints, positions, exact))[stable]
+        max_error = float(max(error.max(), error_c.max(initial=0.0)))
+
+        if max_error > self.tolerance:
+            raise ValueError(f"interpolation error {max_error:.3g} exceeds tolerance {self.tolerance}; "
+                             f"increase the resolution")
+        return max_error
+
+    def _slope(self, blocking, intensity, positions):
+        """Exact ``dB/dA``; at ``A = 0`` it is 1 for a single position and 0 otherwise."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = blocking * (positions / intensity - 1 + blocking)
+        return np.where(intensity > 0, slope, (positions == 1).astype(float))
+
+    def _interpolate(self, intensity, positions):
+        """Cubic Hermite interpolation of ``B(positions, intensity)`` on the grid."""
+        grid = self.table_[0]
+        step = 1 / self.resolution
+        cell = np.minimum((intensity * self.resolution).astype(np.int64), len(grid) - 2)
+        low, high = grid[cell], grid[cell + 1]
+        t = (intensity - low) / step
+
+        blocking_low = self.table_[positions, cell]
+        blocking_high = self.table_[positions, cell + 1]
+        slope_low = self._slope(blocking_low, low, positions)
+        slope_high = self._slope(blocking_high, high, positions)
+
+        t2, t3 = t * t, t * t * t
+        return ((2 * t3 - 3 * t2 + 1) * blocking_low
+                + (t3 - 2 * t2 + t) * step * slope_low
+                + (-2 * t3 + 3 * t2) * blocking_high
+                + (t3 - t2) * step * slope_high)
+
+    def _check_query(self, intensity, positions):
+        intensity = check_array("intensity", intensity, check_in_range, 0, self.max_intensity,
+                                include_low=False)
+        positions = np.asarray(positions)
+        if not np.issubdtype(positions.dtype, np.integer):
+            raise ValueError(f"positions must be integers, got values of dtype {positions.dtype}")
+        if positions.size and (positions.min() < 1 or positions.max() > self.max_positions):
+            raise ValueError(f"positions must be in the interval [1, {self.max_positions}]")
+        return np.broadcast_arrays(intensity, positions)
+
+    @staticmethod
+    def _output(values, *inputs):
+        """Return a float for scalar queries and an array otherwise."""
+        if all(np.ndim(value) == 0 for value in inputs):
+            return float(values)
+        return values
+
+    def blocking_probability(self, intensity, positions):
+        """
+        Erlang B blocking probability.
+
+        Parameters
+        ----------
+        intensity: float or array-like,
+            Offered traffic in Erlangs, in ``(0, max_intensity]``.
+        positions: int or array-like,
+            Number of positions, in ``[1, max_positions]``.
+
+        Returns
+        -------
+        float or numpy.ndarray
+            Interpolated blocking probability, broadcast over the inputs.
+        """
+        a, c = self._check_query(intensity, positions)
+        return self._output(self._interpolate(a, c), intensity, positions)
+
+    def waiting_probability(self, intensity, positions):
+        """
+        Erlang C probability that a transaction waits in queue.
+
+        Parameters
+        ----------
+        intensity: float or array-like,
+            Offered traffic in Erlangs, in ``(0, max_intensity]``.
+        positions: int or array-like,
+            Number of positions, in ``[1, max_positions]``. Must be greater than
+            the traffic intensity.
+
+        Returns
+        -------
+        float or numpy.ndarray
+            Interpolated waiting probability, broadcast over the inputs.
+        """
+        a, c = self._check_query(intensity, positions)
+        if (c <= a).any():
+            raise ValueError("positions must be greater than traffic intensity")
+        waiting_probability = _kernels.erlang_c_from_b(a, c, self._interpolate(a, c))
+        return self._output(waiting_probability, intensity, positions)
+
+    def service_level(self, intensity, positions, asa, aht):
+        """
+        Erlang C service level.
+
+        Parameters
+        ----------
+        intensity: float or array-like,
+            Offered traffic in Erlangs, in ``(0, max_intensity]``.
+        positions: int or array-like,
+            Number of positions, in ``[1, max_positions]``. Must be greater than
+            the traffic intensity.
+        asa: float or array-like,
+            The required average speed of answer.
+        aht: float or array-like,
+            Average handling time, in the same unit as ``asa``.
+
+        Returns
+        -------
+        float or numpy.ndarray
+            Fraction of transactions answered within ``asa``, broadcast over the inputs.
+        """
+        asa_aht = check_array("asa", asa, check_positive_float) / check_array("aht", aht, check_positive_float)
+        a, c = self._check_query(intensity, positions)
+        if (c <= a).any():
+            raise ValueError("positions must be greater than traffic intensity")
+        waiting_probability = _kernels.erlang_c_from_b(a, c, self._interpolate(a, c))
+        service_level = _kernels.erlang_c_service_level(a, c, waiting_probability, asa_aht)
+        return self._output(service_level, intensity, positions, asa, aht)
+
+    def save(self, path):
+        """
+        Write the table to ``path`` in NumPy ``.npy`` format.
+
+        Parameters
+        ----------
+        path: str or path-like,
+            Destination file. NumPy appends ``.npy`` when it is missing.
+        """
+        np.save(path, self.table_)
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        """
+        Read a table written by :meth:`save`.
+
+        Parameters
+        ----------
+        path: str or path-like,
+            File written by :meth:`save`.
+        mmap_mode: {None, "r", "r+", "c"}, default="r"
+            Memory-map the file instead of reading it into memory. See
+            :func:`numpy.load`.
+
+        Returns
+        -------
+        ErlangTable
+            The loaded table. The tolerance is not re-checked, so
+            ``tolerance`` and ``max_error_`` are ``None``.
+        """
+        table = np.load(path, mmap_mode=mmap_mode)
+        if table.ndim != 2 or table.shape[0] < 2 or table.shape[1] < 2:
+            raise ValueError(f"{path} does not contain an ErlangTable")
+
+        erlang_table = cls.__new__(cls)
+        erlang_table.table_ = table
+        erlang_table.max_intensity = float(table[0, -1])
+        erlang_table.max_positions = table.shape[0] - 1
+        erlang_table.resolution = round(1 / float(table[0, 1]))
+        erlang_table.tolerance = None
+        erlang_table.max_error_ = None
+        return erlang_table
@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 
 from pyworkforce.queuing import ErlangA, ErlangC
+from pyworkforce.queuing.abandonment import _served_within
 
 
 def make_erlang(**overrides):
@@ -127,3 +129,146 @@ def test_erlanga_required_positions_invalid_targets():
         erlang.required_positions(service_level=1.5)
     with pytest.raises(ValueError):
         erlang.required_positions(service_level=0.8, max_occupancy=0)
+
+
+@pytest.mark.parametrize("transactions, patience, positions", [
+    (100, 5, 14),          # stable system
+    (3000, 5, 250),        # overloaded: abandonment keeps the chain finite
+    (100, 1_000_000, 15),  # nearly Erlang C
+])
+def test_erlanga_stationary_distribution_truncation(transactions, patience, positions):
+
+    erlang = make_erlang(transactions=transactions, patience=patience)
+    probs = erlang._stationary_distribution(positions)
+
+    assert isinstance(probs, np.ndarray)
+    assert probs.sum() == pytest.approx(1.0)
+    assert probs[-1] < 1e-15
+
+    # Extending the chain well past the truncation point changes nothing.
+    lam, mu, theta = erlang.arrival_rate, erlang.service_rate, erlang.abandonment_rate
+    terms = [1.0]
+    for n in range(1, len(probs) + 200):
+        terms.append(terms[-1] * lam / (min(n, positions) * mu + max(n - positions, 0) * theta))
+        if terms[-1] > 1e250:
+            terms = [term / 1e250 for term in terms]
+    reference = np.array(terms) / sum(terms)
+    assert np.allclose(probs, reference[:len(probs)], rtol=1e-9, atol=1e-300)
+
+
+
+@pytest.mark.parametrize("transactions, aht, patience, positions", [
+    (5, 3, 0.5, 1),      # m = lam / theta = 1/12: very impatient, low traffic
+    (20, 3, 0.1, 2),     # m = 1/15
+    (60, 3, 1, 1),       # m = 2, overloaded single server
+])
+def test_erlanga_truncation_with_small_mean_queue(transactions, aht, patience, positions):
+    erlang = make_erlang(transactions=transactions, aht=aht, patience=patience)
+    results = erlang.evaluate(positions)
+
+    exact = make_erlang(transactions=transactions, aht=aht, patience=patience)
+    exact._queue_truncation = lambda positions: 500
+    expected = exact.evaluate(positions)
+    for key, value in expected.items():
+        assert results[key] == pytest.approx(value, rel=1e-12, abs=1e-300), key
+
+def test_erlanga_metrics_computed_once_per_positions(monkeypatch):
+    erlang = make_erlang()
+    calls = []
+    compute = erlang._compute_metrics
+    monkeypatch.setattr(erlang, "_compute_metrics", lambda c: calls.append(c) or compute(c))
+
+    result = erlang.required_positions(service_level=0.8)
+    erlang.waiting_probability(result["raw_positions"])
+    erlang.service_level(result["raw_positions"])
+
+    assert len(calls) == len(set(calls))
+
+
+def test_erlanga_evaluate_returns_every_metric():
+    erlang = make_erlang()
+    metrics = erlang.evaluate(16)
+
+    assert metrics == {
+        "service_level": erlang.service_level(16),
+        "occupancy": erlang.achieved_occupancy(16),
+        "abandonment_probability": erlang.abandonment_probability(16),
+        "waiting_probability": erlang.waiting_probability(16),
+        "average_speed_of_answer": erlang.average_speed_of_answer(16),
+        "average_queue_length": erlang.average_queue_length(16),
+    }
+    assert erlang.evaluate(16, asa=1)["service_level"] > metrics["service_level"]
+
+
+@pytest.mark.parametrize("positions, patience, asa", [(14, 5, 20 / 60), (12, 0.5, 2), (30, 20, 0.1)])
+def test_erlanga_served_within_matches_transient_chain(positions, patience, asa):
+    mu, theta, max_ahead = 1 / 3, 1 / patience, 40
+    # Tagged customer chain: states 0..max_ahead are queue positions, then served and abandoned.
+    size = max_ahead + 3
+    generator = np.zeros((size, size))
+    for i in range(max_ahead + 1):
+        generator[i, i - 1 if i else max_ahead + 1] = positions * mu + i * theta
+        generator[i, max_ahead + 2] = theta
+        generator[i, i] = -(positions * mu + (i + 1) * theta)
+    # Matrix exponential by scaling and squaring of a truncated Taylor series.
+    scaled = generator * asa / 2 ** 10
+    transition, term = np.eye(size), np.eye(size)
+    for k in range(1, 30):
+        term = term @ scaled / k
+        transition = transition + term
+    for _ in range(10):
+        transition = transition @ transition
+
+    reference = transition[:max_ahead + 1, max_ahead + 1]
+    served = _served_within(positions * mu, theta, max_ahead, asa)
+    assert np.allclose(served, reference, rtol=1e-9, atol=1e-14)
+
+
+@pytest.mark.parametrize("overrides, targets", [
+    ({}, dict(service_level=0.8)),
+    ({"transactions": 2000, "patience": 0.5}, dict(service_level=0.9)),
+    ({"transactions": 2000, "patience": 0.5}, dict(service_level=0.0, max_abandonment=0.01)),
+    ({"transactions": 20, "asa": 2}, dict(service_level=0.5, max_occupancy=0.6)),
+])
+def test_erlanga_required_positions_matches_linear_search(overrides, targets):
+    erlang = make_erlang(**overrides)
+    targets = {"max_occupancy": 1.0, "max_abandonment": 1.0, **targets}
+
+    positions = max(1, int(np.ceil(erlang.intensity)))
+    while not (erlang.service_level(positions) >= targets["service_level"]
+               and erlang.achieved_occupancy(positions) <= targets["max_occupancy"]
+               and erlang.abandonment_probability(positions) <= targets["max_abandonment"]):
+        positions += 1
+
+    assert make_erlang(**overrides).required_positions(**targets)["raw_positions"] == positions
+
+
+def test_erlanga_required_positions_few_evaluations(monkeypatch):
+    erlang = make_erlang(transactions=5000, patience=2)
+    calls = []
+    compute = erlang._compute_metrics
+    monkeypatch.setattr(erlang, "_compute_metrics", lambda c: calls.append(c) or compute(c))
+
+    erlang.required_positions(service_level=0.8)
+
+    assert len(calls) <= 6
+
+
+@pytest.mark.parametrize("positions", [8, 12, 20])
+def test_sensitivity_matches_finite_differences(positions):
+    erlang = make_erlang(patience=2)
+    table = erlang.sensitivity(positions)
+
+    def metrics(c=positions, **overrides):
+        return np.array(list(make_erlang(patience=2, **overrides).evaluate(c).values()))
+
+    step = 1e-6
+    base = metrics()
+    assert list(table.index) == list(erlang.evaluate(positions))
+    np.testing.assert_allclose(table["value"], base)
+    np.testing.assert_allclose(table["positions"], metrics(positions + 1) - base)
+    np.testing.assert_allclose(table["intensity"],
+                               (metrics(transactions=100 * (1 + step)) - base) / (step * erlang.intensity),
+                               rtol=1e-4, atol=1e-8)
+    np.testing.assert_allclose(table["aht"], (metrics(aht=3 + step) - base) / step, rtol=1e-4, atol=1e-8)
+    np.testing.assert_allclose(table["asa"], (metrics(asa=20 / 60 + step) - base) / step, rtol=1e-4, atol=1e-8)
@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from pyworkforce.queuing import MultiErlangA, MultiErlangC
+from pyworkforce.queuing.distributed import DistributedSweep
+from pyworkforce.utils import results_to_dataframe
+
+PARAM_GRID = {"transactions": list(range(100, 240, 10)), "aht": [3], "interval": [30],
+              "asa": [20 / 60], "patience": [2, 5]}
+ARGUMENTS_GRID = {"service_level": [0.8, 0.9]}
+
+
+def expected_frame(param_grid=PARAM_GRID):
+    multi = MultiErlangA(param_grid=param_grid, n_jobs=1)
+    return results_to_dataframe(multi.required_positions(ARGUMENTS_GRID), multi.required_positions_params)
+
+
+def test_distributed_sweep_matches_multi_estimator(tmp_path):
+    sweep = DistributedSweep(tmp_path)
+    assert sweep.prepare(MultiErlangA, PARAM_GRID, "required_positions", ARGUMENTS_GRID, shard_size=4,
+                         estimator_params={"n_jobs": 1}) == 7
+    assert sweep.status() == {"total": 7, "done": 0, "claimed": 0, "pending": 7}
+
+    assert sweep.run_worker(max_shards=3) == [0, 1, 2]
+    assert sweep.status()["done"] == 3
+    with pytest.raises(ValueError, match="4 of 7 are missing"):
+        sweep.merge()
+    assert sweep.run_worker() == [3, 4, 5, 6]
+
+    merged = sweep.merge()
+    expected = expected_frame()
+    assert merged[list(expected.columns)].astype(object).values.tolist() == expected.astype(object).values.tolist()
+
+
+def test_distributed_sweep_with_several_processes(tmp_path):
+    sweep = DistributedSweep(tmp_path)
+    sweep.prepare(MultiErlangA, PARAM_GRID, "required_positions", ARGUMENTS_GRID, shard_size=2,
+                  estimator_params={"n_jobs": 1}, file_format="pickle")
+
+    environment = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    workers = [subprocess.Popen([sys.executable, "-m", "pyworkforce.queuing.distributed", str(tmp_path)],
+                                stdout=subprocess.PIPE, env=environment, text=True)
+               for _ in range(3)]
+    outputs = [worker.communicate(timeout=120)[0] for worker in workers]
+
+    assert all(worker.returncode == 0 for worker in workers)
+    assert sum(int(output.split()[1]) for output in outputs) == 14
+    assert sweep.status() == {"total": 14, "done": 14, "claimed": 0, "pending": 0}
+    assert sweep.merge()["positions"].tolist() == expected_frame()["positions"].tolist()
+
+
+def test_distributed_sweep_resumes_expired_claims(tmp_path):
+    sweep = DistributedSweep(tmp_path)
+    sweep.prepare(MultiErlangC, {"transactions": [100, 200, 300], "aht": [3], "interval": [30],
+                                 "asa": [20 / 60]}, "service_level", {"positions": [40]}, shard_size=1)
+    # A live claim on shard 0 and a claim left behind by a crashed worker on shard 1.
+    assert sweep._claim(0, lease_timeout=60)
+    assert sweep._claim(1, lease_timeout=60)
+    an_hour_ago = time.time() - 3600
+    os.utime(sweep._lock_path(1), (an_hour_ago, an_hour_ago))
+
+    assert sweep.run_worker(lease_timeout=60) == [1, 2]
+    assert sweep.status() == {"total": 3, "done": 2, "claimed": 1, "pending": 0}
+    sweep._release(0)
+    assert sweep.run_worker(lease_timeout=60) == [0]
+    assert len(sweep.merge()) == 3
+
+
+def test_distributed_sweep_validation(tmp_path):
+    sweep = DistributedSweep(tmp_path)
+    with pytest.raises(ValueError, match="estimator must be a Multi"):
+        sweep.prepare(dict, PARAM_GRID, "required_positions", ARGUMENTS_GRID)
+    with pytest.raises(ValueError, match="has no method 'blocking_probability'"):
+        sweep.prepare(MultiErlangA, PARAM_GRID, "blocking_probability", ARGUMENTS_GRID)
+    with pytest.raises(ValueError, match="file_format must be one of"):
+        sweep.prepare(MultiErlangA, PARAM_GRID, "required_positions", ARGUMENTS_GRID, file_format="csv")
+
+    sweep.prepare(MultiErlangA, PARAM_GRID, "required_positions", ARGUMENTS_GRID)
+    with pytest.raises(FileExistsError):
+        sweep.prepare(MultiErlangA, PARAM_GRID, "required_positions", ARGUMENTS_GRID)
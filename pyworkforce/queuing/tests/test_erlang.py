@@ -127,3 +127,123 @@ def test_erlang_methods_require_stable_system():
     with pytest.raises(Exception) as excinfo:
         erlang.achieved_occupancy(positions=10)
     assert str(excinfo.value) == "positions must be greater than traffic intensity"
+
+
+def test_from_arrays_matches_required_positions():
+    transactions = [50, 100, 180, 400]
+    aht = [3, 3, 4, 5]
+    results = ErlangC.from_arrays(transactions=transactions, aht=aht, asa=0.33, interval=30,
+                                  shrinkage=0.3, service_level=0.8, max_occupancy=0.85)
+
+    assert len(results) == 4
+    for index, (volume, handle_time) in enumerate(zip(transactions, aht)):
+        expected = ErlangC(transactions=volume, asa=0.33, aht=handle_time, interval=30,
+                           shrinkage=0.3).required_positions(service_level=0.8, max_occupancy=0.85)
+        row = results.iloc[index]
+        assert row["raw_positions"] == expected["raw_positions"]
+        assert row["positions"] == expected["positions"]
+        assert row["service_level"] == pytest.approx(expected["service_level"])
+        assert row["occupancy"] == pytest.approx(expected["occupancy"])
+        assert row["waiting_probability"] == pytest.approx(expected["waiting_probability"])
+
+
+def test_from_arrays_metrics_for_positions():
+    erlang = ErlangC(transactions=100, asa=0.33, aht=3, interval=30, shrinkage=0.3)
+    results = ErlangC.from_arrays(transactions=100, aht=3, asa=0.33, interval=30, shrinkage=0.3,
+                                  positions=[20, 22], scale_positions=True)
+
+    assert list(results.columns) == ["waiting_probability", "service_level", "occupancy"]
+    for index, positions in enumerate([20, 22]):
+        row = results.iloc[index]
+        assert row["waiting_probability"] == pytest.approx(
+            erlang.waiting_probability(positions, scale_positions=True))
+        assert row["service_level"] == pytest.approx(erlang.service_level(positions, scale_positions=True))
+        assert row["occupancy"] == pytest.approx(erlang.achieved_occupancy(positions, scale_positions=True))
+
+
+def test_from_arrays_validation():
+    with pytest.raises(ValueError) as excinfo:
+        ErlangC.from_arrays(transactions=[100, -5], aht=3, asa=0.33, interval=30, service_level=0.8)
+    assert "transactions must be a positive number" in str(excinfo.value)
+
+    with pytest.raises(ValueError) as excinfo:
+        ErlangC.from_arrays(transactions=100, aht=3, asa=0.33, interval=30)
+    assert str(excinfo.value) == "exactly one of service_level or positions must be provided"
+
+    with pytest.raises(ValueError) as excinfo:
+        ErlangC.from_arrays(transactions=100, aht=3, asa=0.33, interval=30, positions=[10, 12])
+    assert str(excinfo.value) == "positions must be greater than traffic intensity"
+
+
+def test_required_positions_large_queue_is_minimal():
+    erlang = ErlangC(transactions=25000, asa=20 / 60, aht=3, interval=30)
+    results = erlang.required_positions(service_level=0.9)
+    positions = results["raw_positions"]
+
+    assert erlang.intensity == 2500
+    assert results["service_level"] == pytest.approx(erlang.service_level(positions))
+    assert results["waiting_probability"] == pytest.approx(erlang.waiting_probability(positions))
+    assert erlang.service_level(positions) >= 0.9
+    assert erlang.service_level(positions - 1) < 0.9
+
+
+@pytest.mark.parametrize("transactions", [100, 5000, 200000])
+def test_log_method_matches_exact(transactions):
+    exact = ErlangC(transactions=transactions, asa=0.33, aht=3, interval=30, shrinkage=0.3)
+    log_space = ErlangC(transactions=transactions, asa=0.33, aht=3, interval=30, shrinkage=0.3, method="log")
+    positions = exact.required_positions(service_level=0.8)["raw_positions"]
+
+    assert log_space.waiting_probability(positions) == pytest.approx(exact.waiting_probability(positions), rel=1e-9)
+    assert log_space.required_positions(service_level=0.8) == pytest.approx(
+        exact.required_positions(service_level=0.8), rel=1e-9)
+
+
+def test_qed_method_error_bound():
+    for transactions in (1000, 100000):
+        exact = ErlangC(transactions=transactions, asa=0.33, aht=3, interval=30)
+        qed = ErlangC(transactions=transactions, asa=0.33, aht=3, interval=30, method="qed")
+        bound = 0.15 / exact.intensity ** 0.5
+        for beta in (0.5, 1, 2):
+            positions = round(exact.intensity + beta * exact.intensity ** 0.5)
+            assert qed.waiting_probability(positions) == pytest.approx(
+                exact.waiting_probability(positions), abs=bound)
+
+
+def test_qed_method_very_large_queue():
+    erlang = ErlangC(transactions=10_000_000, asa=20 / 60, aht=3, interval=30, method="qed")
+    results = erlang.required_positions(service_level=0.9)
+    positions = results["raw_positions"]
+
+    assert results["service_level"] >= 0.9
+    assert erlang.service_level(positions - 1) < 0.9
+    # Far above the load the approximation underflows to zero instead of overflowing.
+    assert erlang.waiting_probability(positions + 50000) == 0
+
+
+def test_wrong_method_erlangc():
+    with pytest.raises(ValueError) as excinfo:
+        ErlangC(transactions=100, asa=0.33, aht=3, interval=30, method="fast")
+    assert "method must be one of" in str(excinfo.value)
+
+
+@pytest.mark.parametrize("method", ["exact", "log", "qed"])
+def test_sensitivity_matches_finite_differences(method):
+    params = dict(transactions=100, aht=3, asa=20 / 60, interval=30, method=method)
+    erlang = ErlangC(**params)
+    table = erlang.sensitivity(positions=14)
+
+    def metrics(positions=14, **overrides):
+        perturbed = ErlangC(**{**params, **overrides})
+        return [perturbed.waiting_probability(positions), perturbed.service_level(positions),
+                perturbed.achieved_occupancy(positions)]
+
+    step = 1e-6
+    base = metrics()
+    assert table["value"].tolist() == pytest.approx(base)
+    assert table["positions"].tolist() == pytest.approx([b - a for a, b in zip(base, metrics(15))])
+    by_intensity = [(b - a) / (step * erlang.intensity) for a, b in zip(base, metrics(transactions=100 * (1 + step)))]
+    assert table["intensity"].tolist() == pytest.approx(by_intensity, rel=1e-4, abs=1e-8)
+    by_aht = [(b - a) / step for a, b in zip(base, metrics(aht=3 + step))]
+    assert table["aht"].tolist() == pytest.approx(by_aht, rel=1e-4, abs=1e-8)
+    by_asa = [(b - a) / step for a, b in zip(base, metrics(asa=20 / 60 + step))]
+    assert table["asa"].tolist() == pytest.approx(by_asa, rel=1e-4, abs=1e-8)
@@ -202,6 +202,50 @@ def test_multi_erlang_b_params_stored():
     assert multi.achieved_occupancy_params is not None
 
 
+def test_multi_erlang_b_iter_required_positions():
+    param_grid = {"transactions": [60, 90], "aht": [3], "interval": [30]}
+    multi = MultiErlangB(param_grid=param_grid, n_jobs=1, batch_size=3)
+    arguments_grid = {"max_blocking": [0.02, 0.05]}
+
+    streamed = list(multi.iter_required_positions(arguments_grid))
+
+    assert [result for _, _, result in streamed] == multi.required_positions(arguments_grid)
+    assert streamed[-1][:2] == ({"aht": 3, "interval": 30, "transactions": 90}, {"max_blocking": 0.05})
+
+
+def test_multi_erlang_b_deduplicates_equivalent_scenarios():
+    param_grid = {"transactions": [60, 120], "aht": [3], "interval": [30, 60]}
+    multi = MultiErlangB(param_grid=param_grid, n_jobs=1, output="columns")
+    results = multi.blocking_probability({"positions": [10, 15]})
+
+    assert len(multi._unique_params([])[0]) == 3
+    assert results["result"].tolist() == MultiErlangB(param_grid=param_grid, n_jobs=1).blocking_probability(
+        {"positions": [10, 15]})
+
+
+def test_multi_erlang_b_merges_shrinkage_only_scenarios():
+    param_grid = {"transactions": [60], "aht": [3], "interval": [30], "shrinkage": [0.0, 0.2, 0.4]}
+    multi = MultiErlangB(param_grid=param_grid, n_jobs=1)
+    reference = MultiErlangB(param_grid=param_grid, n_jobs=1, deduplicate=False)
+    arguments_grid = {"max_blocking": [0.01, 0.05]}
+
+    assert len(multi._unique_params([])[0]) == 1
+    assert multi.required_positions(arguments_grid) == reference.required_positions(arguments_grid)
+    # Scaled positions depend on shrinkage, so those scenarios stay apart.
+    assert len(multi._unique_params([{"positions": 10, "scale_positions": True}])[0]) == 3
+    scaled = {"positions": [10], "scale_positions": [True]}
+    assert multi.blocking_probability(scaled) == reference.blocking_probability(scaled)
+
+
+def test_multi_erlang_b_shared_memory_backend():
+    param_grid = {"transactions": [60, 90, 120], "aht": [3], "interval": [30]}
+    multi = MultiErlangB(param_grid=param_grid, n_jobs=2, backend="shared_memory")
+    arguments_grid = {"max_blocking": [0.02, 0.05]}
+
+    assert multi.required_positions(arguments_grid) == \
+        MultiErlangB(param_grid=param_grid, n_jobs=1).required_positions(arguments_grid)
+
+
 def test_get_params_erlang_b():
     erlang = ErlangB(transactions=100, aht=3, interval=30, shrinkage=0.3)
     params = erlang.get_params()
@@ -209,3 +253,108 @@ def test_get_params_erlang_b():
     assert params["aht"] == 3
     assert params["interval"] == 30
     assert params["shrinkage"] == 0.3
+
+
+def test_blocking_table_shared_across_methods_and_instances():
+    from pyworkforce.queuing import erlang_b
+
+    erlang = ErlangB(transactions=123, aht=3, interval=30)
+    result = erlang.required_positions(max_blocking=0.01)
+    table = erlang_b._blocking_tables[erlang.intensity]
+
+    # A new instance with the same traffic reads the same table.
+    other = ErlangB(transactions=123, aht=3, interval=30, shrinkage=0.2)
+    assert other.blocking_probability(result["raw_positions"]) == result["blocking_probability"]
+    assert erlang_b._blocking_tables[other.intensity] is table
+    assert table[1] == pytest.approx(erlang.intensity / (1 + erlang.intensity))
+
+
+def test_blocking_table_cache_is_bounded():
+    from pyworkforce.queuing import erlang_b
+
+    for transactions in range(1, erlang_b._MAX_BLOCKING_TABLES + 20):
+        ErlangB(transactions=transactions, aht=1.5, interval=30).blocking_probability(5)
+    assert len(erlang_b._blocking_tables) == erlang_b._MAX_BLOCKING_TABLES
+
+
+def test_blocking_table_cache_is_bounded_in_elements(monkeypatch):
+    from pyworkforce.queuing import erlang_b
+
+    monkeypatch.setattr(erlang_b, "_MAX_BLOCKING_ELEMENTS", 1000)
+    monkeypatch.setattr(erlang_b, "_blocking_tables", type(erlang_b._blocking_tables)())
+    monkeypatch.setattr(erlang_b, "_blocking_elements", 0)
+
+    ErlangB(transactions=10, aht=3, interval=30).blocking_probability(400)
+    assert erlang_b._blocking_elements == 401
+    ErlangB(transactions=20, aht=3, interval=30).blocking_probability(700)
+    # The second table pushed the total over budget, so the first one was evicted.
+    assert list(erlang_b._blocking_tables) == [2.0]
+    assert erlang_b._blocking_elements == 701
+
+    # Tables larger than the whole budget are computed but never cached.
+    assert ErlangB(transactions=300, aht=3, interval=30).blocking_probability(2000) < 1e-300
+    assert 30.0 not in erlang_b._blocking_tables
+    assert sum(map(len, erlang_b._blocking_tables.values())) == erlang_b._blocking_elements <= 1000
+
+
+def test_max_intensity_inverts_blocking_probability():
+    intensity = ErlangB.max_intensity(10, max_blocking=0.01)
+    erlang = ErlangB(transactions=intensity, aht=1, interval=1)
+    assert erlang.blocking_probability(10) == pytest.approx(0.01, rel=1e-9)
+    # B(1, A) = A / (1 + A) has a closed-form inverse.
+    assert ErlangB.max_intensity(1, max_blocking=0.2) == pytest.approx(0.25)
+
+
+def test_max_intensity_capacity_table():
+    import numpy as np
+
+    positions = np.arange(1, 301)
+    intensities = ErlangB.max_intensity(positions, max_blocking=0.02)
+
+    assert intensities.shape == (300,)
+    assert np.all(np.diff(intensities) > 0)
+    for c in (1, 17, 150, 300):
+        erlang = ErlangB(transactions=float(intensities[c - 1]), aht=1, interval=1)
+        assert erlang.blocking_probability(c) == pytest.approx(0.02, rel=1e-9)
+
+
+def test_max_intensity_matches_required_positions():
+    intensity = ErlangB.max_intensity(17, max_blocking=0.02)
+    # Just below the limit 17 trunks suffice; just above it they do not.
+    assert ErlangB(transactions=intensity * 0.999, aht=1, interval=1).required_positions(0.02)["raw_positions"] == 17
+    assert ErlangB(transactions=intensity * 1.001, aht=1, interval=1).required_positions(0.02)["raw_positions"] == 18
+
+
+@pytest.mark.parametrize("positions, max_blocking", [(0, 0.01), (2.5, 0.01), ([3, -1], 0.01), (10, 0), (10, 1)])
+def test_max_intensity_validation(positions, max_blocking):
+    with pytest.raises(ValueError):
+        ErlangB.max_intensity(positions, max_blocking=max_blocking)
+
+
+def test_sensitivity_matches_finite_differences():
+    erlang = ErlangB(transactions=100, aht=3, interval=30)
+    table = erlang.sensitivity(positions=17)
+
+    def metrics(positions=17, **overrides):
+        perturbed = ErlangB(**{**dict(transactions=100, aht=3, interval=30), **overrides})
+        return [perturbed.blocking_probability(positions), perturbed.achieved_occupancy(positions)]
+
+    step = 1e-6
+    base = metrics()
+    assert table["value"].tolist() == pytest.approx(base)
+    assert table["positions"].tolist() == pytest.approx([b - a for a, b in zip(base, metrics(18))])
+    by_intensity = [(b - a) / (step * erlang.intensity) for a, b in zip(base, metrics(transactions=100 * (1 + step)))]
+    assert table["intensity"].tolist() == pytest.approx(by_intensity, rel=1e-4)
+    assert table["aht"].tolist() == pytest.approx([(b - a) / step for a, b in zip(base, metrics(aht=3 + step))],
+                                                  rel=1e-4)
+
+
+@pytest.mark.parametrize("backend", ["joblib", "shared_memory"])
+def test_multi_erlang_b_required_positions_resumes_across_sorted_targets(backend):
+    param_grid = {"transactions": [100, 1000], "aht": [3], "interval": [30]}
+    arguments_grid = {"max_blocking": [0.001, 0.2, 0.01, 0.05], "max_occupancy": [1.0, 0.7]}
+    multi = MultiErlangB(param_grid=param_grid, n_jobs=1, backend=backend)
+    results = multi.required_positions(arguments_grid)
+
+    for result, (erlang_params, method_params) in zip(results, multi.required_positions_params):
+        assert result == ErlangB(**erlang_params).required_positions(**method_params)
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from pyworkforce.queuing import ErlangA, ErlangB, ErlangX
+
+
+def make_erlang(**overrides):
+    params = dict(transactions=100, aht=3, asa=20 / 60, interval=30, patience=5,
+                  queue_capacity=10, redial_probability=0.5, shrinkage=0.0)
+    params.update(overrides)
+    return ErlangX(**params)
+
+
+def test_erlangx_matches_erlanga_without_redials_and_limit():
+    erlang_x = make_erlang(queue_capacity=300, redial_probability=0.0)
+    erlang_a = ErlangA(transactions=100, aht=3, asa=20 / 60, interval=30, patience=5)
+
+    for positions in (12, 14, 18):
+        metrics = erlang_x.evaluate(positions)
+        for key, value in erlang_a.evaluate(positions).items():
+            assert metrics[key] == pytest.approx(value, rel=1e-9, abs=1e-15)
+        assert metrics["blocking_probability"] < 1e-15
+        assert metrics["total_transactions"] == 100
+
+
+def test_erlangx_without_waiting_room_is_erlangb():
+    erlang_x = make_erlang(queue_capacity=0, redial_probability=0.0)
+    erlang_b = ErlangB(transactions=100, aht=3, interval=30)
+
+    for positions in (8, 10, 14):
+        assert erlang_x.blocking_probability(positions) == pytest.approx(erlang_b.blocking_probability(positions))
+        assert erlang_x.waiting_probability(positions) == 0
+        assert erlang_x.service_level(positions) == pytest.approx(1 - erlang_b.blocking_probability(positions))
+
+
+@pytest.mark.parametrize("transactions, positions", [(100, 12), (100, 8), (400, 30)])
+def test_erlangx_solves_retrial_fixed_point(transactions, positions):
+    erlang = make_erlang(transactions=transactions, redial_probability=0.7)
+    metrics = erlang.evaluate(positions)
+
+    # Plain successive substitution, as when stitching ErlangB and ErlangA together by hand.
+    fresh_rate, rate = erlang.arrival_rate, erlang.arrival_rate
+    for _ in range(2000):
+        lost = make_erlang(transactions=rate * 30, redial_probability=0.0).evaluate(positions)
+        rate = fresh_rate + 0.7 * rate * (lost["blocking_probability"] + lost["abandonment_probability"])
+
+    assert metrics["total_transactions"] == pytest.approx(rate * 30, rel=1e-9)
+    lost_fraction = metrics["blocking_probability"] + metrics["abandonment_probability"]
+    assert metrics["total_transactions"] == pytest.approx(transactions + 0.7 * metrics["total_transactions"]
+                                                          * lost_fraction, rel=1e-10)
+
+
+def test_erlangx_redials_add_load():
+    loads = [make_erlang(redial_probability=redial).total_transactions(11) for redial in (0.0, 0.3, 0.6, 0.9)]
+    assert loads[0] == 100
+    assert all(np.diff(loads) > 0)
+
+    positions = [make_erlang(redial_probability=redial).required_positions(0.9)["raw_positions"]
+                 for redial in (0.0, 0.9)]
+    assert positions[0] <= positions[1]
+
+
+@pytest.mark.parametrize("overrides, targets", [
+    ({}, dict(service_level=0.8)),
+    ({"transactions": 600, "queue_capacity": 3}, dict(service_level=0.5, max_blocking=0.01)),
+    ({"patience": 0.5, "redial_probability": 0.9}, dict(service_level=0.0, max_abandonment=0.02)),
+    ({"queue_capacity": 0}, dict(service_level=0.95, max_occupancy=0.8)),
+])
+def test_erlangx_required_positions_matches_linear_search(overrides, targets):
+    erlang = make_erlang(**overrides)
+    targets = {"max_occupancy": 1.0, "max_abandonment": 1.0, "max_blocking": 1.0, **targets}
+
+    positions = max(1, int(np.ceil(erlang.intensity)))
+    while not (erlang.service_level(positions) >= targets["service_level"]
+               and erlang.achieved_occupancy(positions) <= targets["max_occupancy"]
+               and erlang.abandonment_probability(positions) <= targets["max_abandonment"]
+               and erlang.blocking_probability(positions) <= targets["max_blocking"]):
+        positions += 1
+
+    result = make_erlang(**overrides).required_positions(**targets)
+    assert result["raw_positions"] == positions
+    assert result["service_level"] == erlang.service_level(positions)
+
+
+def test_erlangx_required_positions_shrinkage():
+    result = make_erlang(shrinkage=0.3).required_positions(service_level=0.8)
+    assert result["positions"] == int(np.ceil(result["raw_positions"] / 0.7))
+
+
+@pytest.mark.parametrize("bad_kwargs, message", [
+    ({"queue_capacity": -1}, "queue_capacity must be a non-negative integer"),
+    ({"queue_capacity": 2.5}, "queue_capacity must be a non-negative integer"),
+    ({"redial_probability": 1}, "redial_probability must be in the interval [0, 1)"),
+    ({"patience": 0}, "patience must be a positive number"),
+])
+def test_erlangx_invalid_construction(bad_kwargs, message):
+    with pytest.raises(ValueError) as excinfo:
+        make_erlang(**bad_kwargs)
+    assert message in str(excinfo.value)
+
+
+def test_erlangx_invalid_arguments():
+    erlang = make_erlang()
+    with pytest.raises(ValueError):
+        erlang.service_level(0)
+    with pytest.raises(ValueError):
+        erlang.required_positions(service_level=0.8, max_blocking=2)
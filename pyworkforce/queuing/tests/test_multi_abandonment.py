@@ -1,6 +1,7 @@
 import pytest
 
 from pyworkforce.queuing import ErlangA, MultiErlangA
+from pyworkforce.utils import ParameterGrid
 
 BASE_GRID = {"transactions": [100], "aht": [3], "interval": [30],
              "asa": [20 / 60], "patience": [5], "shrinkage": [0.3]}
@@ -80,3 +81,93 @@ def test_multierlanga_check_solutions_empty():
 def test_multierlanga_repr():
     multi = MultiErlangA(param_grid=BASE_GRID)
     assert repr(multi).startswith("MultiErlangA(")
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 100, "auto"])
+def test_multierlanga_batch_size_keeps_results_and_order(batch_size):
+    grid = {"transactions": [100, 120, 140], "aht": [3], "interval": [30],
+            "asa": [20 / 60], "patience": [2, 5], "shrinkage": [0.0]}
+    arguments_grid = {"positions": [14, 16]}
+    expected = [ErlangA(**params).service_level(positions)
+                for params in ParameterGrid(grid) for positions in arguments_grid["positions"]]
+
+    multi = MultiErlangA(param_grid=grid, n_jobs=2, batch_size=batch_size)
+    assert multi.service_level(arguments_grid) == expected
+
+
+def test_multierlanga_invalid_batch_size():
+    with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+        MultiErlangA(param_grid=BASE_GRID, batch_size=0)
+
+
+def test_multierlanga_iter_matches_list_results():
+    grid = {"transactions": [100, 120], "aht": [3], "interval": [30],
+            "asa": [20 / 60], "patience": [5], "shrinkage": [0.0]}
+    multi = MultiErlangA(param_grid=grid, n_jobs=2, batch_size=1)
+    arguments_grid = {"positions": [14, 16]}
+
+    streamed = list(multi.iter_abandonment_probability(arguments_grid))
+
+    assert [result for _, _, result in streamed] == multi.abandonment_probability(arguments_grid)
+    assert [params[:2] for params in streamed] == multi.abandonment_probability_params
+
+
+def test_multierlanga_deduplicates_equivalent_scenarios():
+    grid = {"transactions": [100, 200], "aht": [3], "interval": [30, 60],
+            "asa": [20 / 60], "patience": [5]}
+    multi = MultiErlangA(param_grid=grid, n_jobs=1)
+
+    assert len(multi._unique_params([])[0]) == 3
+    assert multi.service_level({"positions": [14]}) == \
+        MultiErlangA(param_grid=grid, n_jobs=1, deduplicate=False).service_level({"positions": [14]})
+
+
+def test_multierlanga_merges_shrinkage_only_scenarios():
+    grid = {"transactions": [100], "aht": [3], "interval": [30], "asa": [20 / 60], "patience": [5],
+            "shrinkage": [0.0, 0.15, 0.3]}
+    arguments_grid = {"service_level": [0.8, 0.9]}
+    multi = MultiErlangA(param_grid=grid, n_jobs=1)
+
+    assert len(multi._unique_params([])[0]) == 1
+    results = multi.required_positions(arguments_grid)
+    assert results == MultiErlangA(param_grid=grid, n_jobs=1, deduplicate=False).required_positions(arguments_grid)
+    assert [result["positions"] for result in results[::2]] == [13, 16, 19]
+
+
+def test_multierlanga_shared_memory_backend_matches_joblib():
+    grid = {"transactions": [100, 120, 140], "aht": [3], "interval": [30],
+            "asa": [20 / 60], "patience": [2, 5], "shrinkage": [0.0, 0.3]}
+    arguments_grid = {"service_level": [0.8], "max_abandonment": [0.05, 1.0]}
+    shared = MultiErlangA(param_grid=grid, n_jobs=2, batch_size=4, backend="shared_memory")
+
+    assert shared.required_positions(arguments_grid) == \
+        MultiErlangA(param_grid=grid, n_jobs=1).required_positions(arguments_grid)
+    assert shared.service_level({"positions": [14, 16]}) == \
+        MultiErlangA(param_grid=grid, n_jobs=1).service_level({"positions": [14, 16]})
+
+
+def test_multierlanga_invalid_backend():
+    with pytest.raises(ValueError, match="backend must be one of"):
+        MultiErlangA(param_grid=BASE_GRID, backend="vectorized")
+
+
+
+def test_multierlanga_required_positions_resumes_across_sorted_targets(monkeypatch):
+    targets = [0.95, 0.6, 0.9, 0.75, 0.8, 0.7, 0.85]
+    arguments_grid = {"service_level": targets, "max_abandonment": [1.0, 0.02]}
+    multi = MultiErlangA(param_grid={**BASE_GRID, "transactions": [100, 1000]}, n_jobs=1)
+    results = multi.required_positions(arguments_grid)
+    for result, (erlang_params, method_params) in zip(results, multi.required_positions_params):
+        assert result == ErlangA(**erlang_params).required_positions(**method_params)
+
+    evaluated = []
+    compute_metrics = ErlangA._compute_metrics
+    monkeypatch.setattr(ErlangA, "_compute_metrics",
+                        lambda self, positions: evaluated.append(positions) or compute_metrics(self, positions))
+    erlang = ErlangA(**{key: values[0] for key, values in BASE_GRID.items()})
+    erlang._required_positions_batch([{"service_level": target} for target in targets])
+    curve = len(evaluated)
+    evaluated.clear()
+    for target in targets:
+        ErlangA(**{key: values[0] for key, values in BASE_GRID.items()}).required_positions(target)
+    assert curve < len(evaluated) / 2
@@ -1,6 +1,6 @@
 import pytest
 
-from pyworkforce.queuing.erlang import MultiErlangC
+from pyworkforce.queuing.erlang import ErlangC, MultiErlangC
 
 
 def test_expected_multierlangc_results():
@@ -142,3 +142,232 @@ def test_multierlangc_params_align_with_results():
     }
     assert occ_by_transactions[200] > occ_by_transactions[100]
 
+
+
+@pytest.mark.parametrize("method_name, arguments_grid", [
+    ("required_positions", {"service_level": [0.7, 0.9], "max_occupancy": [0.8, 1.0]}),
+    ("service_level", {"positions": [35, 45], "scale_positions": [False, True]}),
+    ("waiting_probability", {"positions": [35, 45]}),
+    ("achieved_occupancy", {"positions": [35, 45], "scale_positions": [True]}),
+])
+def test_multierlangc_vectorized_backend_matches_joblib(method_name, arguments_grid):
+    param_grid = {"transactions": [100, 150, 250], "asa": [0.33, 0.5], "aht": [3],
+                  "interval": [30], "shrinkage": [0.0, 0.2]}
+    vectorized = MultiErlangC(param_grid=param_grid, backend="vectorized")
+    joblib = MultiErlangC(param_grid=param_grid, n_jobs=1, backend="joblib")
+
+    expected = getattr(joblib, method_name)(arguments_grid)
+    results = getattr(vectorized, method_name)(arguments_grid)
+
+    assert len(results) == len(expected)
+    for result, expected_result in zip(results, expected):
+        assert result == pytest.approx(expected_result, rel=1e-12)
+    assert getattr(vectorized, f"{method_name}_params") == getattr(joblib, f"{method_name}_params")
+    if method_name == "required_positions":
+        assert all(type(result["positions"]) is int for result in results)
+    else:
+        assert all(type(result) is float for result in results)
+
+
+def test_multierlangc_vectorized_backend_validates_inputs():
+    param_grid = {"transactions": [100, 300], "asa": [0.33], "aht": [3], "interval": [30]}
+    erlang = MultiErlangC(param_grid=param_grid, backend="vectorized")
+
+    with pytest.raises(ValueError, match="positions must be greater than traffic intensity"):
+        erlang.service_level({"positions": [20]})
+    with pytest.raises(ValueError, match="service_level must be"):
+        erlang.required_positions({"service_level": [1.5]})
+
+
+def test_multierlangc_backend_selection():
+    param_grid = {"transactions": [100], "asa": [0.33], "aht": [3], "interval": [30], "method": ["log"]}
+    arguments_grid = {"service_level": [0.8]}
+
+    auto = MultiErlangC(param_grid=param_grid, n_jobs=1).required_positions(arguments_grid)
+    assert auto[0]["raw_positions"] == 14
+
+    with pytest.raises(ValueError, match="vectorized backend requires"):
+        MultiErlangC(param_grid=param_grid, backend="vectorized").required_positions(arguments_grid)
+    with pytest.raises(ValueError, match="backend must be one of"):
+        MultiErlangC(param_grid=param_grid, backend="dask")
+
+
+def test_multierlangc_block_builds_each_estimator_once(monkeypatch):
+    from pyworkforce.queuing import base
+
+    built = []
+
+    class CountingErlangC(base.BaseWorkforce):
+        def __init__(self, **params):
+            built.append(params)
+
+        def achieved_occupancy(self, positions):
+            return positions
+
+    param_grid = {"transactions": [100, 120], "asa": [0.33], "aht": [3], "interval": [30]}
+    erlang = MultiErlangC(param_grid=param_grid, n_jobs=1, batch_size=3, backend="joblib",
+                          deduplicate=False)
+    monkeypatch.setattr(erlang, "_estimator", CountingErlangC)
+
+    assert erlang.achieved_occupancy({"positions": [20, 25, 30]}) == [20, 25, 30] * 2
+    # Blocks of 3 match the 3 arguments per estimator, so each is built once.
+    assert len(built) == 2
+
+
+@pytest.mark.parametrize("backend", ["vectorized", "joblib", "shared_memory"])
+def test_multierlangc_iter_matches_list_results(backend, monkeypatch):
+    from pyworkforce.queuing import base
+
+    monkeypatch.setattr(base, "_VECTORIZED_BLOCK_SIZE", 3)
+    param_grid = {"transactions": [100, 150, 200], "asa": [0.33], "aht": [3], "interval": [30]}
+    arguments_grid = {"service_level": [0.8, 0.9], "max_occupancy": [0.85]}
+    erlang = MultiErlangC(param_grid=param_grid, n_jobs=1, batch_size=4, backend=backend)
+
+    streamed = list(erlang.iter_required_positions(arguments_grid))
+    results = erlang.required_positions(arguments_grid)
+
+    assert [result for _, _, result in streamed] == results
+    assert [(params, arguments) for params, arguments, _ in streamed] == erlang.required_positions_params
+
+
+def test_multierlangc_iter_is_lazy(monkeypatch):
+    from pyworkforce.queuing import base
+
+    built = []
+
+    class CountingErlangC(base.BaseWorkforce):
+        def __init__(self, **params):
+            built.append(params)
+
+        def achieved_occupancy(self, positions):
+            return positions
+
+    param_grid = {"transactions": list(range(100, 200)), "asa": [0.33], "aht": [3], "interval": [30]}
+    erlang = MultiErlangC(param_grid=param_grid, n_jobs=1, batch_size=2, backend="joblib")
+    monkeypatch.setattr(erlang, "_estimator", CountingErlangC)
+
+    stream = erlang.iter_achieved_occupancy({"positions": [20, 25]})
+    assert built == []
+    assert next(stream) == ({"aht": 3, "asa": 0.33, "interval": 30, "transactions": 100}, {"positions": 20}, 20)
+    assert len(built) < len(param_grid["transactions"])
+    assert erlang.achieved_occupancy_params is None
+
+
+@pytest.mark.parametrize("backend, output", [("vectorized", "list"), ("joblib", "list"), ("joblib", "columns")])
+def test_multierlangc_deduplicates_equivalent_scenarios(backend, output, monkeypatch):
+    param_grid = {"transactions": [100, 200], "interval": [30, 60], "asa": [0.33], "aht": [3],
+                  "shrinkage": [0.0, 0.3]}
+    arguments_grid = {"service_level": [0.8, 0.9]}
+    erlang = MultiErlangC(param_grid=param_grid, n_jobs=1, backend=backend, output=output)
+    reference = MultiErlangC(param_grid=param_grid, n_jobs=1, backend=backend, output=output,
+                             deduplicate=False)
+
+    evaluated = []
+    evaluate_blocks = erlang._evaluate_blocks
+    monkeypatch.setattr(erlang, "_evaluate_blocks", lambda *args, **kwargs: evaluated.append(
+        kwargs["param_list"]) or evaluate_blocks(*args, **kwargs))
+    results = erlang.required_positions(arguments_grid)
+    expected = reference.required_positions(arguments_grid)
+
+    # 100 / 30 and 200 / 60 offer the same traffic, and shrinkage only rescales
+    # positions: 8 parameter sets, 3 distinct queues.
+    assert len(evaluated[0]) == 3
+    if output == "columns":
+        for key in expected.keys():
+            assert (results[key] == expected[key]).all()
+    else:
+        assert results == expected
+        assert len({id(result) for result in results}) == len(results)
+        assert erlang.required_positions_params == reference.required_positions_params
+
+
+@pytest.mark.parametrize("backend, output", [("vectorized", "list"), ("vectorized", "columns"),
+                                             ("joblib", "list"), ("shared_memory", "columns")])
+def test_multierlangc_shrinkage_only_grid_is_evaluated_once(backend, output, monkeypatch):
+    param_grid = {"transactions": [100, 200], "interval": [30, 60], "asa": [0.33], "aht": [3],
+                  "shrinkage": [0.0, 0.1, 0.2, 0.3]}
+    param_grid = [dict(param_grid, transactions=[100], interval=[30]),
+                  dict(param_grid, transactions=[200], interval=[60])]
+    arguments_grid = {"service_level": [0.8, 0.9]}
+    erlang = MultiErlangC(param_grid=param_grid, n_jobs=1, backend=backend, output=output)
+    reference = MultiErlangC(param_grid=param_grid, n_jobs=1, backend=backend, output=output,
+                             deduplicate=False)
+
+    evaluated = []
+    evaluate_blocks = erlang._evaluate_blocks
+    monkeypatch.setattr(erlang, "_evaluate_blocks", lambda *args, **kwargs: evaluated.append(
+        kwargs["param_list"]) or evaluate_blocks(*args, **kwargs))
+    results = erlang.required_positions(arguments_grid)
+    expected = reference.required_positions(arguments_grid)
+
+    # 8 scenarios, one queue: only the final shrinkage scaling differs.
+    assert len(evaluated[0]) == 1
+    if output == "columns":
+        for key in expected.keys():
+            assert (results[key] == expected[key]).all()
+        assert results["positions"].dtype.kind == "i"
+    else:
+        assert results == expected
+        assert len({result["positions"] for result in results}) > 2
+
+    # Scaled positions read shrinkage, so those scenarios are kept apart.
+    scaled = {"positions": [20, 25], "scale_positions": [True]}
+    evaluated.clear()
+    results = erlang.service_level(scaled)
+    expected = reference.service_level(scaled)
+    assert len(evaluated[0]) == 4
+    if output == "columns":
+        assert (results["result"] == expected["result"]).all()
+    else:
+        assert results == expected
+
+
+@pytest.mark.parametrize("output", ["list", "columns"])
+def test_multierlangc_shared_memory_backend_matches_joblib(output):
+    param_grid = {"transactions": [100, 150, 200], "asa": [0.33], "aht": [3], "interval": [30],
+                  "method": ["exact", "log"]}
+    arguments_grid = {"service_level": [0.8, 0.9], "max_occupancy": [0.85]}
+    shared = MultiErlangC(param_grid=param_grid, n_jobs=2, batch_size=5, backend="shared_memory",
+                          output=output, deduplicate=False)
+    joblib = MultiErlangC(param_grid=param_grid, n_jobs=1, backend="joblib", output=output,
+                          deduplicate=False)
+
+    shared_results = shared.required_positions(arguments_grid)
+    joblib_results = joblib.required_positions(arguments_grid)
+
+    if output == "list":
+        assert shared_results == joblib_results
+        assert shared.required_positions_params == joblib.required_positions_params
+    else:
+        for key in joblib_results.keys():
+            assert shared_results[key].tolist() == joblib_results[key].tolist()
+            assert shared_results[key].dtype == joblib_results[key].dtype
+
+
+
+@pytest.mark.parametrize("backend", ["joblib", "shared_memory"])
+@pytest.mark.parametrize("method", ["exact", "log", "qed"])
+def test_multierlangc_required_positions_resumes_across_sorted_targets(backend, method):
+    param_grid = {"transactions": [100, 1000], "aht": [3], "interval": [30], "asa": [20 / 60],
+                  "method": [method]}
+    arguments_grid = {"service_level": [0.95, 0.5, 0.8, 0.7, 0.9], "max_occupancy": [1.0, 0.85]}
+    multi = MultiErlangC(param_grid=param_grid, n_jobs=1, backend=backend)
+    results = multi.required_positions(arguments_grid)
+
+    for result, (erlang_params, method_params) in zip(results, multi.required_positions_params):
+        assert result == pytest.approx(ErlangC(**erlang_params).required_positions(**method_params))
+
+
+def test_erlangc_target_curve_costs_one_scan(monkeypatch):
+    steps = []
+    next_erlang_b = ErlangC._next_erlang_b
+    monkeypatch.setattr(ErlangC, "_next_erlang_b",
+                        lambda self, *args: steps.append(args[0]) or next_erlang_b(self, *args))
+    erlang = ErlangC(transactions=1000, aht=3, asa=20 / 60, interval=30)
+    targets = [0.97 - 0.025 * index for index in range(20)]
+
+    erlang._required_positions_batch([{"service_level": target} for target in targets])
+    curve = len(steps)
+    steps.clear()
+    erlang.required_positions(service_level=max(targets))
+    assert curve == len(steps)
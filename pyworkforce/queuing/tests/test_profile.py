@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from pyworkforce.queuing import ErlangC, StaffingProfile, _kernels
+
+TRANSACTIONS = [20, 60, 150, 300, 240, 120, 0, 0, 40]
+
+
+def test_psa_matches_one_erlangc_per_interval():
+    profile = StaffingProfile(TRANSACTIONS, aht=4, asa=20 / 60, interval=30, shrinkage=0.2)
+    result = profile.required_positions(service_level=0.8, max_occupancy=0.85)
+
+    for transactions, row in zip(TRANSACTIONS, result.to_dict("records")):
+        if transactions == 0:
+            assert (row["raw_positions"], row["positions"], row["service_level"]) == (0, 0, 1.0)
+            continue
+        expected = ErlangC(transactions=transactions, aht=4, asa=20 / 60, interval=30,
+                           shrinkage=0.2).required_positions(service_level=0.8, max_occupancy=0.85)
+        assert row["raw_positions"] == expected["raw_positions"]
+        assert row["positions"] == expected["positions"]
+        assert row["service_level"] == pytest.approx(expected["service_level"], rel=1e-12)
+
+
+@pytest.mark.parametrize("method", ["lagged", "offered_load"])
+@pytest.mark.parametrize("periodic", [False, True])
+def test_constant_arrivals_reduce_to_psa(method, periodic):
+    profile = StaffingProfile([90] * 6, aht=4, asa=0.5, interval=15, method=method, periodic=periodic)
+
+    assert profile.intensity == pytest.approx(np.full(6, 24.0))
+
+
+def test_lagged_shifts_arrivals_by_aht():
+    profile = StaffingProfile([30, 90, 60], aht=10, asa=0.5, interval=30, method="lagged")
+    # Interval 1 spans minutes 30-60, so its lagged window 20-50 holds 10 minutes of interval 0.
+    assert profile.intensity == pytest.approx([10, (10 * 1 + 20 * 3) / 30 * 10, (10 * 3 + 20 * 2) / 30 * 10])
+
+
+@pytest.mark.parametrize("periodic", [False, True])
+def test_offered_load_matches_infinite_server_integration(periodic):
+    rate = np.array(TRANSACTIONS, dtype=float) / 30
+    aht, steps = 7.0, 3000
+    profile = StaffingProfile(TRANSACTIONS, aht=aht, asa=0.5, interval=30, method="offered_load",
+                              periodic=periodic)
+
+    # Integrate dm/dt = rate - m / aht exactly on a fine grid, over many cycles when periodic.
+    dt = 30 / steps
+    load = 0.0 if periodic else rate[0] * aht
+    for _ in range(20 if periodic else 1):
+        averages = []
+        for interval_rate in rate:
+            path = interval_rate * aht + (load - interval_rate * aht) * np.exp(-np.arange(1, steps + 1) * dt / aht)
+            averages.append(((load + path[-1]) / 2 + path[:-1].sum()) / steps)
+            load = path[-1]
+    assert profile.intensity == pytest.approx(averages, rel=1e-6)
+
+
+def test_equal_intervals_are_sized_once(monkeypatch):
+    sizes = []
+    kernel = _kernels.erlang_c_required_positions
+    monkeypatch.setattr(_kernels, "erlang_c_required_positions",
+                        lambda intensity, *args: sizes.append(len(intensity)) or kernel(intensity, *args))
+    profile = StaffingProfile([100, 200, 100, 200, 0, 100], aht=3, asa=0.5, interval=30)
+
+    result = profile.required_positions(service_level=[0.8, 0.8, 0.8, 0.9, 0.8, 0.8])
+
+    assert sizes == [3]
+    assert result["raw_positions"][0] == result["raw_positions"][2] == result["raw_positions"][5]
+
+
+@pytest.mark.parametrize("kwargs, message", [
+    ({"transactions": []}, "transactions must be a non-empty one-dimensional array"),
+    ({"transactions": [10, -1]}, "transactions must be in the interval"),
+    ({"aht": [3, 4]}, "aht must be a scalar or have one value per interval"),
+    ({"interval": 0}, "interval must be"),
+    ({"method": "exact"}, "method must be one of"),
+])
+def test_staffing_profile_invalid_arguments(kwargs, message):
+    arguments = {"transactions": [10, 20, 30], "aht": 3, "asa": 0.5, "interval": 30, **kwargs}
+    with pytest.raises(ValueError) as excinfo:
+        StaffingProfile(**arguments)
+    assert message in str(excinfo.value)
@@ -0,0 +1,88 @@
+import os
+from math import ceil
+
+import numpy as np
+import pytest
+
+from pyworkforce.queuing import ErlangC
+from pyworkforce.queuing._shared_memory import (
+    _decode_row,
+    _encode_table,
+    _output_column,
+    _result_spec,
+    solve_shared_memory,
+)
+
+
+def test_encode_table_round_trips_parameters():
+    dicts = [{"transactions": 100, "aht": 3.5, "method": "exact", "flag": True},
+             {"transactions": 200, "aht": 4.0, "method": "log", "flag": False},
+             {"transactions": 300, "aht": 2.0, "flag": True}]
+    table, spec = _encode_table(dicts)
+
+    assert table.shape == (4, 3)
+    for row, params in enumerate(dicts):
+        decoded = _decode_row(table, spec, row)
+        assert decoded == params
+        assert [type(value) for value in decoded.values()] == [type(value) for value in params.values()]
+
+
+def test_result_spec_requires_numeric_results():
+    assert _result_spec(0.5) == (None, ["float"])
+    assert _result_spec({"raw_positions": 14, "service_level": 0.8}) == (["raw_positions", "service_level"],
+                                                                         ["int", "float"])
+    with pytest.raises(ValueError, match="requires numeric results"):
+        _result_spec({"status": "optimal"})
+
+
+class Backlog:
+    """Returns an integer for an empty backlog and a float otherwise."""
+
+    def __init__(self, load):
+        self.load = load
+
+    def excess(self, positions):
+        return max(0, self.load - positions)
+
+    def flags(self, positions):
+        return {"staffed": self.load <= positions, "spare": max(0, positions - ceil(self.load))}
+
+
+def test_output_kind_follows_every_result():
+    param_list = [{"load": 5.0}, {"load": 12.5}, {"load": 20.0}]
+    results = solve_shared_memory(Backlog, "excess", [{"load": 5.0}, {"load": 12.5}], [{"positions": 10}],
+                                  batch_size=1, n_jobs=1)
+    assert results.dtype == float
+    assert results.tolist() == [0.0, 2.5]
+
+    results = solve_shared_memory(Backlog, "flags", param_list, [{"positions": 10}], batch_size=2, n_jobs=1)
+    assert results["staffed"].dtype == bool
+    assert results["staffed"].tolist() == [True, False, False]
+    assert results["spare"].dtype == np.int64
+
+    assert _output_column(np.array([0.0, 2.0]), "bool").dtype == np.int64
+    assert _output_column(np.array([1.0, np.nan]), "int").dtype == float
+
+
+def shared_memory_segments():
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")}
+
+
+@pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="needs a POSIX shared memory mount")
+def test_solve_shared_memory_releases_segments():
+    before = shared_memory_segments()
+    param_list = [{"transactions": transactions, "aht": 3, "asa": 0.33, "interval": 30}
+                  for transactions in (100, 200)]
+    arguments_list = [{"positions": 25}, {"positions": 30}]
+
+    results = solve_shared_memory(ErlangC, "service_level", param_list, arguments_list, batch_size=3, n_jobs=2)
+
+    expected = [ErlangC(**params).service_level(**arguments)
+                for params in param_list for arguments in arguments_list]
+    assert np.array_equal(results, expected)
+    assert shared_memory_segments() == before
+
+    with pytest.raises(ValueError):
+        solve_shared_memory(ErlangC, "service_level", param_list, [{"positions": 25}, {"positions": -1}],
+                            batch_size=1, n_jobs=1)
+    assert shared_memory_segments() == before
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from pyworkforce.queuing import ErlangB, ErlangC, ErlangTable
+
+
+@pytest.fixture(scope="module")
+def table():
+    return ErlangTable(max_intensity=40, max_positions=60, resolution=20, tolerance=1e-6)
+
+
+def test_table_matches_exact_classes(table):
+    rng = np.random.default_rng(0)
+    for transactions in rng.uniform(1, 390, size=20):
+        erlang_b = ErlangB(transactions=transactions, aht=3, interval=30)
+        erlang_c = ErlangC(transactions=transactions, aht=3, asa=20 / 60, interval=30)
+        for positions in (int(erlang_c.intensity) + 1, int(erlang_c.intensity) + 5):
+            assert table.blocking_probability(erlang_b.intensity, positions) == pytest.approx(
+                erlang_b.blocking_probability(positions), abs=1e-6)
+            assert table.waiting_probability(erlang_c.intensity, positions) == pytest.approx(
+                erlang_c.waiting_probability(positions), abs=1e-6)
+            assert table.service_level(erlang_c.intensity, positions, asa=20 / 60, aht=3) == pytest.approx(
+                erlang_c.service_level(positions), abs=1e-6)
+
+
+def test_table_vectorized_queries(table):
+    intensity = np.array([5.0, 10.0, 20.5])
+    positions = np.array([8, 14, 25])
+    values = table.waiting_probability(intensity, positions)
+
+    assert isinstance(values, np.ndarray)
+    assert values.shape == (3,)
+    assert isinstance(table.waiting_probability(10.0, 14), float)
+
+
+def test_table_reports_max_error(table):
+    assert 0 < table.max_error_ <= 1e-6
+
+
+def test_table_tolerance_violation():
+    with pytest.raises(ValueError) as excinfo:
+        ErlangTable(max_intensity=10, max_positions=20, resolution=2, tolerance=1e-9)
+    assert "exceeds tolerance" in str(excinfo.value)
+
+
+def test_table_save_and_memory_mapped_load(table, tmp_path):
+    path = tmp_path / "erlang.npy"
+    table.save(path)
+    loaded = ErlangTable.load(path)
+
+    assert isinstance(loaded.table_, np.memmap)
+    assert loaded.get_params() == {"max_intensity": 40.0, "max_positions": 60,
+                                   "resolution": 20, "tolerance": None}
+    assert loaded.blocking_probability(12.34, 15) == table.blocking_probability(12.34, 15)
+
+
+@pytest.mark.parametrize("intensity, positions", [(0, 5), (41, 50), (10, 0), (10, 61), (10, 12.5)])
+def test_table_query_validation(table, intensity, positions):
+    with pytest.raises(ValueError):
+        table.blocking_probability(intensity, positions)
+
+
+def test_table_requires_stable_system(table):
+    with pytest.raises(ValueError) as excinfo:
+        table.waiting_probability(10, 10)
+    assert str(excinfo.value) == "positions must be greater than traffic intensity"
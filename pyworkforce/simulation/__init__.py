@@ -0,0 +1,3 @@
+from .simulator import QueueSimulator
+
+__all__ = ["QueueSimulator"]
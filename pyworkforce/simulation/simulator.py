@@ -0,0 +1,465 @@
+"""Discrete-event simulation of multi-server queues with abandonment.
+
+The analytic queues of :mod:`pyworkforce.queuing` assume Poisson arrivals and
+exponential handling times. :class:`QueueSimulator` drops the exponential
+assumption for handling times and lets the arrival rate change from interval
+to interval, so their results can be checked before they are trusted.
+
+Customers are served first come, first served. Under that discipline the
+answer time of a customer only depends on the customers ahead of it, so the
+event queue reduces to a heap of the times at which each position becomes
+free: a customer takes the earliest free position, or abandons when that
+position frees up after its patience runs out. Each replication samples every
+arrival, handling time and patience up front and writes the answer time and
+outcome of every customer into preallocated NumPy buffers, from which the
+metrics are computed in a few vectorized passes.
+"""
+
+from heapq import heappop, heappush, heapreplace
+from math import ceil, sqrt
+from statistics import NormalDist
+
+import numpy as np
+from joblib import Parallel, delayed
+
+from pyworkforce.base import BaseWorkforce
+from pyworkforce.queuing import ErlangA, ErlangC, ErlangX
+from pyworkforce.utils.validation import check_array, check_in_range, check_positive_float, check_positive_integer
+
+# Outcomes in the event log.
+_SERVED, _ABANDONED, _BLOCKED = 0, 1, 2
+
+_AHT_DISTRIBUTIONS = ("exponential", "deterministic", "lognormal", "gamma")
+
+# Metrics reported by QueueSimulator.required_positions.
+_METRICS = ("service_level", "occupancy", "abandonment_probability", "waiting_probability",
+            "average_speed_of_answer", "blocking_probability")
+
+
+def _sample_arrivals(rng, rates, interval, warmup):
+    """Poisson arrival times with a piecewise constant rate per interval.
+
+    The warm-up period runs at the rate of the first interval and ends at
+    time ``warmup``, where the first interval starts.
+    """
+    starts = warmup + np.arange(len(rates)) * interval
+    counts = rng.poisson(np.concatenate(([rates[0] * warmup], rates * interval)))
+    lows = np.repeat(np.concatenate(([0.0], starts)), counts)
+    widths = np.repeat(np.concatenate(([warmup], np.full(len(rates), interval))), counts)
+    return np.sort(lows + rng.random(counts.sum()) * widths)
+
+
+def _sample_handling_times(rng, size, aht, distribution, cv):
+    if callable(distribution):
+        return np.asarray(distribution(rng, size), dtype=float)
+    if distribution == "exponential":
+        return rng.exponential(aht, size)
+    if distribution == "deterministic":
+        return np.full(size, float(aht))
+    if distribution == "lognormal":
+        sigma2 = np.log1p(cv ** 2)
+        return rng.lognormal(np.log(aht) - sigma2 / 2, np.sqrt(sigma2), size)
+    shape = 1 / cv ** 2
+    return rng.gamma(shape, aht / shape, size)
+
+
+def _sample_customers(rng, config):
+    """Arrival, handling and patience times of every customer of a replication."""
+    arrival = _sample_arrivals(rng, config["rates"], config["interval"], config["warmup"])
+    handling = _sample_handling_times(rng, len(arrival), config["aht"], config["aht_distribution"],
+                                      config["aht_cv"])
+    if config["patience"] is None:
+        patience = np.full(len(arrival), np.inf)
+    else:
+        patience = rng.exponential(config["patience"], len(arrival))
+    return arrival, handling, patience
+
+
+def _run_queue(arrival, handling, patience, positions, queue_capacity):
+    """First come, first served pass over the customers in arrival order.
+
+    Returns
+    -------
+    tuple(numpy.ndarray, numpy.ndarray)
+        For every customer, the time it leaves the queue (answered or
+        abandoned; ``nan`` when blocked) and its outcome.
+    """
+    size = len(arrival)
+    leave = np.empty(size)
+    outcome = np.empty(size, dtype=np.int8)
+    free = [0.0] * positions
+    # Times at which the customers currently waiting leave the queue, only
+    # needed to enforce a finite waiting room.
+    waiting = []
+    customers = zip(arrival.tolist(), handling.tolist(), patience.tolist(), strict=True)
+    for index, (now, service, limit) in enumerate(customers):
+        earliest = free[0]
+        if earliest <= now:
+            heapreplace(free, now + service)
+            leave[index], outcome[index] = now, _SERVED
+            continue
+        if queue_capacity is not None:
+            while waiting and waiting[0] <= now:
+                heappop(waiting)
+            if len(waiting) >= queue_capacity:
+                leave[index], outcome[index] = np.nan, _BLOCKED
+                continue
+        if earliest - now > limit:
+            leave[index], outcome[index] = now + limit, _ABANDONED
+        else:
+            heapreplace(free, earliest + service)
+            leave[index], outcome[index] = earliest, _SERVED
+        if queue_capacity is not None:
+            heappush(waiting, leave[index])
+    return leave, outcome
+
+
+def _summarize(arrival, handling, leave, outcome, positions, start, stop, asa):
+    """Metrics of the customers arriving in ``[start, stop)``."""
+    counted = (arrival >= start) & (arrival < stop)
+    served = outcome == _SERVED
+    # Work done inside the window, including customers that arrived before it.
+    busy = (np.clip(leave[served] + handling[served], start, stop) - np.clip(leave[served], start, stop)).sum()
+    occupancy = busy / (positions * (stop - start))
+
+    arrivals = int(counted.sum())
+    if not arrivals:
+        return {"service_level": 1.0, "occupancy": occupancy, "waiting_probability": 0.0,
+                "abandonment_probability": 0.0, "blocking_probability": 0.0, "average_speed_of_answer": 0.0,
+                "average_queue_length": 0.0, "transactions": 0}
+
+    outcome, wait = outcome[counted], leave[counted] - arrival[counted]
+    admitted = outcome != _BLOCKED
+    waits = wait[admitted]
+    queued = np.clip(leave, start, stop) - np.clip(arrival, start, stop)
+    return {
+        "service_level": np.count_nonzero((outcome == _SERVED) & (wait <= asa)) / arrivals,
+        "occupancy": occupancy,
+        "waiting_probability": np.count_nonzero(waits > 0) / arrivals,
+        "abandonment_probability": np.count_nonzero(outcome == _ABANDONED) / arrivals,
+        "blocking_probability": np.count_nonzero(~admitted) / arrivals,
+        "average_speed_of_answer": waits.mean() if len(waits) else 0.0,
+        "average_queue_length": np.nansum(queued) / (stop - start),
+        "transactions": arrivals,
+    }
+
+
+def _replicate(seed, config, positions_list):
+    """One replication evaluated for every staffing level of ``positions_list``.
+
+    All staffing levels see the same customers (common random numbers), so
+    differences between them are not blurred by sampling noise.
+    """
+    arrival, handling, patience = _sample_customers(np.random.default_rng(seed), config)
+    start = config["warmup"]
+    stop = start + len(config["rates"]) * config["interval"]
+    results = []
+    for positions in positions_list:
+        leave, outcome = _run_queue(arrival, handling, patience, positions, config["queue_capacity"])
+        results.append(_summarize(arrival, handling, leave, outcome, positions, start, stop, config["asa"]))
+    return results
+
+
+def _target_status(runs, targets, z):
+    """Whether the replications ``runs`` of a staffing level meet ``targets``.
+
+    Returns ``1`` when the confidence interval of every metric lies on the
+    right side of its bound, ``-1`` when one lies on the wrong side and ``0``
+    when more replications are needed to tell.
+    """
+    status = 1
+    for key, bound, is_maximum in targets:
+        values = np.array([run[key] for run in runs])
+        if not z:
+            half_width = 0.0
+        elif len(values) > 1:
+            half_width = z * values.std(ddof=1) / sqrt(len(values))
+        else:
+            half_width = np.inf
+        low, high = values.mean() - half_width, values.mean() + half_width
+        met, missed = (high <= bound, low > bound) if is_maximum else (low >= bound, high < bound)
+        if missed:
+            return -1
+        if not met:
+            status = 0
+    return status
+
+
+class QueueSimulator(BaseWorkforce):
+    """
+    Discrete-event simulator of a multi-server, first come, first served queue.
+
+    Arrivals are Poisson with a rate that is constant within each interval and
+    may change between intervals. Handling times follow any distribution with
+    mean ``aht``, customers abandon after an exponential patience, and the
+    waiting room may be finite. The queue starts empty and is warmed up at the
+    rate of the first interval before metrics are collected.
+
+    Parameters
+    ----------
+    transactions: float or array-like,
+        Transactions arriving in the interval, or in each of a sequence of
+        intervals.
+    aht: float,
+        Average handling time of a transaction (minutes).
+    asa: float,
+        Answer time (minutes) used for the service level.
+    interval: float,
+        Length of every interval, in minutes.
+    patience: float, default=None
+        Average time (minutes) a customer waits before abandoning. ``None``
+        means customers never abandon.
+    queue_capacity: int, default=None
+        Number of waiting places; customers finding them all taken are blocked.
+        ``None`` means an unlimited queue and ``0`` gives a loss system.
+    shrinkage: float, default=0.0
+        Fraction of time that an operator unit is not available, in ``[0, 1)``.
+        Only used to turn raw positions into positions in
+        :meth:`required_positions`.
+    aht_distribution: str or callable, default="exponential"
+        Distribution of the handling times: ``"exponential"``,
+        ``"deterministic"``, ``"lognormal"`` or ``"gamma"``, all with mean
+        ``aht``, or a callable ``f(rng, size)`` returning ``size`` handling
+        times drawn with the :class:`numpy.random.Generator` ``rng``. The
+        callable must be picklable to run replications in parallel.
+    aht_cv: float, default=1.0
+        Coefficient of variation of the ``"lognormal"`` and ``"gamma"``
+        handling times.
+    warmup: float, default=None
+        Minutes simulated before the first interval to let the queue fill up.
+        Defaults to ten times ``aht``.
+    n_replications: int, default=20
+        Number of independent replications averaged by :meth:`evaluate`, and
+        the number added at each step of :meth:`required_positions`.
+    n_jobs: int, default=1
+        Number of processes running replications; ``-1`` uses every CPU.
+    random_state: int, default=None
+        Seed of the replications. The streams of every replication derive from
+        it, so results do not depend on ``n_jobs``.
+
+    Examples
+    --------
+    >>> from pyworkforce.simulation import QueueSimulator
+    >>> simulator = QueueSimulator(transactions=[100] * 8, aht=3, asa=20 / 60, interval=30, random_state=0)
+    >>> round(simulator.evaluate(positions=14)["service_level"], 2)
+    0.87
+    """
+
+    def __init__(self, transactions, aht, asa, interval, patience=None, queue_capacity=None, shrinkage=0.0,
+                 aht_distribution="exponential", aht_cv=1.0, warmup=None, n_replications=20, n_jobs=1,
+                 random_state=None):
+        transactions = check_array("transactions", transactions, check_in_range, 0, np.inf)
+        if transactions.ndim > 1 or not transactions.size:
+            raise ValueError(f"transactions must be a number or a non-empty one-dimensional array, got shape "
+                             f"{transactions.shape}")
+        check_positive_float("aht", aht)
+        check_positive_float("asa", asa)
+        check_positive_float("interval", interval)
+        if patience is not None:
+            check_positive_float("patience", patience)
+        if queue_capacity is not None:
+            check_in_range("queue_capacity", queue_capacity, 0, np.inf)
+            if int(queue_capacity) != queue_capacity:
+                raise ValueError(f"queue_capacity must be an integer, got {queue_capacity}")
+        check_in_range("shrinkage", shrinkage, 0, 1, include_high=False)
+        if not callable(aht_distribution) and aht_distribution not in _AHT_DISTRIBUTIONS:
+            raise ValueError(f"aht_distribution must be one of {_AHT_DISTRIBUTIONS} or a callable, "
+                             f"got {aht_distribution!r}")
+        check_positive_float("aht_cv", aht_cv)
+        if warmup is not None:
+            check_in_range("warmup", warmup, 0, np.inf)
+        check_positive_integer("n_replications", n_replications)
+
+        self.transactions = transactions
+        self.aht = aht
+        self.asa = asa
+        self.interval = interval
+        self.patience = patience
+        self.queue_capacity = queue_capacity
+        self.shrinkage = shrinkage
+        self.aht_distribution = aht_distribution
+        self.aht_cv = aht_cv
+        self.warmup = warmup
+        self.n_replications = n_replications
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def _config(self):
+        return {
+            "rates": np.atleast_1d(self.transactions).astype(float) / self.interval,
+            "interval": float(self.interval),
+            "warmup": float(10 * self.aht if self.warmup is None else self.warmup),
+            "aht": float(self.aht),
+            "aht_distribution": self.aht_distribution,
+            "aht_cv": float(self.aht_cv),
+            "patience": self.patience,
+            "queue_capacity": None if self.queue_capacity is None else int(self.queue_capacity),
+            "asa": float(self.asa),
+        }
+
+    def _simulate(self, positions_list, n_replications, offset=0, entropy=None):
+        """Replications ``offset:offset + n_replications`` for every staffing level.
+
+        Replication ``i`` is seeded with the ``i``-th child of the seed
+        sequence of ``random_state``, or of ``entropy`` when given, so later
+        calls can add replications or staffing levels to earlier ones.
+
+        Returns
+        -------
+        list of list of dict
+            One list per replication, with the metrics of each staffing level.
+        """
+        root = np.random.SeedSequence(self.random_state if entropy is None else entropy)
+        seeds = [np.random.SeedSequence(root.entropy, spawn_key=root.spawn_key + (index,))
+                 for index in range(offset, offset + n_replications)]
+        config = self._config()
+        return Parallel(n_jobs=self.n_jobs)(delayed(_replicate)(seed, config, positions_list) for seed in seeds)
+
+    def replicate(self, positions: int):
+        """Metrics of every replication for ``positions``.
+
+        Parameters
+        ----------
+        positions: int,
+            Number of available positions (servers).
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per replication with the keys of :meth:`evaluate` and the
+            number of ``transactions`` that arrived.
+        """
+        import pandas as pd
+
+        check_positive_integer("positions", positions)
+        return pd.DataFrame([results[0] for results in self._simulate([int(positions)], self.n_replications)])
+
+    def evaluate(self, positions: int):
+        """Average metrics over the replications for ``positions``.
+
+        Parameters
+        ----------
+        positions: int,
+            Number of available positions (servers).
+
+        Returns
+        -------
+        dict
+            Keys: ``service_level``, ``occupancy``, ``waiting_probability``,
+            ``abandonment_probability``, ``blocking_probability``,
+            ``average_speed_of_answer`` and ``average_queue_length``, with the
+            meaning they have in :class:`~pyworkforce.queuing.ErlangX`.
+        """
+        replications = self.replicate(positions).drop(columns="transactions")
+        return {key: float(value) for key, value in replications.mean().items()}
+
+    def _analytic_positions(self, service_level, max_occupancy, max_abandonment, max_blocking):
+        """Raw positions of the closest analytic queue at the average arrival rate."""
+        common = {"transactions": float(np.mean(self.transactions)), "aht": self.aht, "asa": self.asa,
+                  "interval": self.interval}
+        if self.patience is not None and self.queue_capacity is not None:
+            erlang = ErlangX(**common, patience=self.patience, queue_capacity=int(self.queue_capacity))
+            result = erlang.required_positions(service_level, max_occupancy, max_abandonment, max_blocking)
+        elif self.patience is not None:
+            erlang = ErlangA(**common, patience=self.patience)
+            result = erlang.required_positions(service_level, max_occupancy, max_abandonment)
+        else:
+            result = ErlangC(**common).required_positions(service_level, max_occupancy)
+        return result["raw_positions"]
+
+    def required_positions(self, service_level: float, max_occupancy: float = 1.0, max_abandonment: float = 1.0,
+                           max_blocking: float = 1.0, confidence: float = 0.95, max_replications: int = None):
+        """Smallest number of positions meeting every target in simulation.
+
+        The search starts around the positions of the analytic queue with the
+        same patience and waiting room (:class:`~pyworkforce.queuing.ErlangC`,
+        :class:`~pyworkforce.queuing.ErlangA` or
+        :class:`~pyworkforce.queuing.ErlangX`) at the average arrival rate, and
+        moves one position at a time while the evaluated staffing levels all
+        meet, or all miss, the targets. Every staffing level is simulated on
+        the same replications (common random numbers), and batches of
+        ``n_replications`` are added until the confidence interval of every
+        metric is on one side of its target, so usually only a few staffing
+        levels and batches are simulated.
+
+        Parameters
+        ----------
+        service_level: float,
+            Target fraction of transactions answered within ``asa``, in ``[0, 1]``.
+        max_occupancy: float, default=1.0
+            Maximum allowed occupancy, in ``(0, 1]``.
+        max_abandonment: float, default=1.0
+            Maximum allowed abandonment probability, in ``[0, 1]``.
+        max_blocking: float, default=1.0
+            Maximum allowed blocking probability, in ``[0, 1]``.
+        confidence: float, default=0.95
+            Confidence level of the intervals compared with the targets.
+        max_replications: int, default=None
+            Replications after which the search decides on the averages alone.
+            Defaults to ten times ``n_replications``.
+
+        Returns
+        -------
+        dict
+            Keys: ``raw_positions`` (before shrinkage), ``positions`` (after
+            shrinkage), the averages over the replications of
+            ``service_level``, ``occupancy``, ``abandonment_probability``,
+            ``waiting_probability``, ``average_speed_of_answer`` and
+            ``blocking_probability``, and the number of ``replications`` used.
+        """
+        check_in_range("service_level", service_level, 0, 1)
+        check_in_range("max_occupancy", max_occupancy, 0, 1, include_low=False)
+        check_in_range("max_abandonment", max_abandonment, 0, 1)
+        check_in_range("max_blocking", max_blocking, 0, 1)
+        check_in_range("confidence", confidence, 0, 1, include_low=False, include_high=False)
+        if max_replications is None:
+            max_replications = 10 * self.n_replications
+        check_positive_integer("max_replications", max_replications)
+
+        if not np.any(self.transactions):
+            return {"raw_positions": 0, "positions": 0, "service_level": 1.0, "occupancy": 0.0,
+                    "abandonment_probability": 0.0, "waiting_probability": 0.0, "average_speed_of_answer": 0.0,
+                    "blocking_probability": 0.0, "replications": 0}
+
+        targets = [("service_level", service_level, False)]
+        targets += [(key, bound, True) for key, bound in (("occupancy", max_occupancy),
+                                                           ("abandonment_probability", max_abandonment),
+                                                           ("blocking_probability", max_blocking)) if bound < 1]
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        # Fixed once, so staffing levels added later see the same replications.
+        entropy = np.random.SeedSequence(self.random_state).entropy
+
+        runs = {}
+
+        def simulate(positions_list, offset, count):
+            for replication in self._simulate(positions_list, count, offset, entropy):
+                for positions, metrics in zip(positions_list, replication, strict=True):
+                    runs.setdefault(positions, []).append(metrics)
+
+        start = max(1, self._analytic_positions(service_level, max_occupancy, max_abandonment, max_blocking))
+        replications = min(self.n_replications, max_replications)
+        simulate([positions for positions in (start - 1, start, start + 1) if positions > 0], 0, replications)
+        while True:
+            decisive = z if replications < max_replications else 0.0
+            status = {positions: _target_status(metrics, targets, decisive) for positions, metrics in runs.items()}
+            lowest, highest = min(runs), max(runs)
+            if status[highest] < 0:
+                simulate([highest + 1], 0, replications)
+                continue
+            if status[lowest] > 0 and lowest > 1:
+                simulate([lowest - 1], 0, replications)
+                continue
+            raw_positions = min(positions for positions in runs if status[positions] >= 0)
+            if status[raw_positions] > 0:
+                break
+            batch = min(self.n_replications, max_replications - replications)
+            simulate(sorted(runs), replications, batch)
+            replications += batch
+
+        metrics = runs[raw_positions]
+        return {
+            "raw_positions": raw_positions,
+            "positions": int(ceil(raw_positions / (1 - self.shrinkage))),
+            **{key: float(np.mean([run[key] for run in metrics])) for key in _METRICS},
+            "replications": replications,
+        }
@@ -0,0 +1,174 @@
+import numpy as np
+import pytest
+
+from pyworkforce.queuing import ErlangA, ErlangB, ErlangC
+from pyworkforce.simulation import QueueSimulator
+from pyworkforce.simulation.simulator import _ABANDONED, _BLOCKED, _SERVED, _run_queue, _sample_handling_times
+
+
+def test_simulator_matches_erlang_c():
+    simulator = QueueSimulator(transactions=[100] * 8, aht=3, asa=20 / 60, interval=30, random_state=0)
+    erlang = ErlangC(transactions=100, aht=3, asa=20 / 60, interval=30)
+    results = simulator.evaluate(positions=14)
+
+    assert results["service_level"] == pytest.approx(erlang.service_level(14), abs=0.03)
+    assert results["waiting_probability"] == pytest.approx(erlang.waiting_probability(14), abs=0.03)
+    assert results["occupancy"] == pytest.approx(erlang.achieved_occupancy(14), abs=0.02)
+    assert results["abandonment_probability"] == results["blocking_probability"] == 0
+
+
+def test_simulator_matches_erlang_a():
+    simulator = QueueSimulator(transactions=[100] * 8, aht=3, asa=20 / 60, interval=30, patience=2,
+                               random_state=1)
+    expected = ErlangA(transactions=100, aht=3, asa=20 / 60, interval=30, patience=2).evaluate(9)
+    results = simulator.evaluate(positions=9)
+
+    for key in ("service_level", "occupancy", "abandonment_probability", "waiting_probability"):
+        assert results[key] == pytest.approx(expected[key], abs=0.02)
+    assert results["average_speed_of_answer"] == pytest.approx(expected["average_speed_of_answer"], rel=0.05)
+    assert results["average_queue_length"] == pytest.approx(expected["average_queue_length"], rel=0.05)
+
+
+def test_loss_system_matches_erlang_b():
+    simulator = QueueSimulator(transactions=[100] * 8, aht=3, asa=20 / 60, interval=30, queue_capacity=0,
+                               random_state=2)
+    results = simulator.evaluate(positions=12)
+
+    expected = ErlangB(transactions=100, aht=3, interval=30).blocking_probability(12)
+    assert results["blocking_probability"] == pytest.approx(expected, abs=0.02)
+    assert results["waiting_probability"] == 0
+    assert results["service_level"] == pytest.approx(1 - results["blocking_probability"])
+
+
+def test_run_queue_event_log():
+    arrival = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+    handling = np.array([5.0, 5.0, 5.0, 5.0, 5.0])
+    patience = np.array([np.inf, np.inf, 2.0, np.inf, np.inf])
+
+    leave, outcome = _run_queue(arrival, handling, patience, positions=2, queue_capacity=None)
+    assert leave.tolist() == [0.0, 1.0, 4.0, 5.0, 6.0]
+    assert outcome.tolist() == [_SERVED, _SERVED, _ABANDONED, _SERVED, _SERVED]
+
+    leave, outcome = _run_queue(arrival, handling, patience, positions=2, queue_capacity=1)
+    assert outcome.tolist() == [_SERVED, _SERVED, _ABANDONED, _BLOCKED, _SERVED]
+    assert np.isnan(leave[3])
+
+
+def test_replications_are_reproducible_and_independent_of_n_jobs():
+    params = dict(transactions=[80, 120, 60], aht=4, asa=0.5, interval=30, patience=3,
+                  aht_distribution="lognormal", aht_cv=1.5, n_replications=4, random_state=7)
+    sequential = QueueSimulator(**params).replicate(positions=12)
+    parallel = QueueSimulator(**params, n_jobs=2).replicate(positions=12)
+
+    assert len(sequential) == 4
+    assert sequential.equals(parallel)
+    assert sequential["service_level"].nunique() == 4
+
+
+def test_handling_time_distributions():
+    aht = 4.0
+    rng = np.random.default_rng(0)
+    simulator = QueueSimulator(transactions=100, aht=aht, asa=0.5, interval=30)
+    assert simulator.get_params()["aht_distribution"] == "exponential"
+
+    for distribution in ("exponential", "lognormal", "gamma"):
+        samples = _sample_handling_times(rng, 200_000, aht, distribution, cv=2.0)
+        assert samples.mean() == pytest.approx(aht, rel=0.05)
+    assert _sample_handling_times(rng, 3, aht, "deterministic", 1.0).tolist() == [aht] * 3
+    samples = _sample_handling_times(rng, 200_000, aht, "lognormal", cv=2.0)
+    assert samples.std() / samples.mean() == pytest.approx(2.0, rel=0.15)
+
+    uniform = QueueSimulator(transactions=[100] * 4, aht=3, asa=0.5, interval=30, random_state=0, n_replications=2,
+                             aht_distribution=lambda rng, size: rng.uniform(2, 4, size))
+    assert 0 < uniform.evaluate(12)["occupancy"] < 1
+
+
+def test_time_varying_arrivals():
+    simulator = QueueSimulator(transactions=[0, 200, 0], aht=3, asa=0.5, interval=30, n_replications=5,
+                               random_state=3)
+    replications = simulator.replicate(positions=15)
+
+    assert replications["transactions"].between(150, 250).all()
+    # Arrivals only come in the middle interval, so the busy time is at most
+    # that interval's load plus the work carried into the last one.
+    assert replications["occupancy"].lt(0.5).all()
+
+
+def test_simulator_validation():
+    with pytest.raises(ValueError, match="transactions"):
+        QueueSimulator(transactions=[], aht=3, asa=0.5, interval=30)
+    with pytest.raises(ValueError, match="aht_distribution"):
+        QueueSimulator(transactions=100, aht=3, asa=0.5, interval=30, aht_distribution="weibull")
+    with pytest.raises(ValueError, match="queue_capacity"):
+        QueueSimulator(transactions=100, aht=3, asa=0.5, interval=30, queue_capacity=1.5)
+    with pytest.raises(ValueError, match="patience"):
+        QueueSimulator(transactions=100, aht=3, asa=0.5, interval=30, patience=0)
+    with pytest.raises(ValueError, match="positions"):
+        QueueSimulator(transactions=100, aht=3, asa=0.5, interval=30).evaluate(0)
+
+
+def test_required_positions_matches_erlang_c_for_exponential_handling_times():
+    simulator = QueueSimulator(transactions=[100] * 8, aht=3, asa=20 / 60, interval=30, shrinkage=0.3,
+                               random_state=0)
+    results = simulator.required_positions(service_level=0.8)
+
+    assert results["raw_positions"] == ErlangC(transactions=100, aht=3, asa=20 / 60,
+                                               interval=30).required_positions(0.8)["raw_positions"]
+    assert results["positions"] == 20
+    assert results["service_level"] >= 0.8
+    assert set(results) == {"raw_positions", "positions", "service_level", "occupancy", "abandonment_probability",
+                            "waiting_probability", "average_speed_of_answer", "blocking_probability",
+                            "replications"}
+
+
+def test_required_positions_follows_the_handling_time_variability():
+    params = dict(transactions=[300] * 8, aht=3, asa=1, interval=30, warmup=120, random_state=0)
+    analytic = ErlangC(transactions=300, aht=3, asa=1, interval=30).required_positions(0.9)["raw_positions"]
+
+    deterministic = QueueSimulator(**params, aht_distribution="deterministic").required_positions(0.9)
+    heavy_tailed = QueueSimulator(**params, aht_distribution="lognormal", aht_cv=3).required_positions(0.9)
+    assert deterministic["raw_positions"] < analytic < heavy_tailed["raw_positions"]
+
+
+def test_required_positions_simulates_a_handful_of_staffing_levels(monkeypatch):
+    simulator = QueueSimulator(transactions=[300] * 8, aht=3, asa=1, interval=30, warmup=120,
+                               aht_distribution="lognormal", aht_cv=3, random_state=0)
+    calls = []
+    simulate = simulator._simulate
+
+    def spy(positions_list, n_replications, offset=0, entropy=None):
+        calls.append((list(positions_list), offset, n_replications))
+        return simulate(positions_list, n_replications, offset, entropy)
+
+    monkeypatch.setattr(simulator, "_simulate", spy)
+    results = simulator.required_positions(service_level=0.9)
+
+    staffing_levels = set()
+    for positions_list, offset, _ in calls:
+        # New staffing levels replay the replications simulated so far.
+        if not staffing_levels.issuperset(positions_list):
+            assert offset == 0
+        staffing_levels.update(positions_list)
+    assert len(staffing_levels) <= 5
+    assert results["raw_positions"] in staffing_levels
+
+
+def test_required_positions_stops_once_the_targets_are_clear():
+    simulator = QueueSimulator(transactions=[100] * 8, aht=3, asa=20 / 60, interval=30, random_state=0)
+    assert simulator.required_positions(service_level=0.5)["replications"] == 20
+    assert simulator.required_positions(service_level=0.5, max_replications=5)["replications"] == 5
+
+
+def test_required_positions_with_abandonment_and_blocking():
+    simulator = QueueSimulator(transactions=[100] * 8, aht=3, asa=20 / 60, interval=30, patience=2,
+                               queue_capacity=5, random_state=0)
+    results = simulator.required_positions(service_level=0.8, max_abandonment=0.05, max_blocking=0.01)
+
+    assert results["abandonment_probability"] <= 0.05
+    assert results["blocking_probability"] <= 0.01
+    assert results["service_level"] >= 0.8
+
+    idle = QueueSimulator(transactions=[0, 0], aht=3, asa=20 / 60, interval=30)
+    assert idle.required_positions(service_level=0.8)["raw_positions"] == 0
+    with pytest.raises(ValueError, match="confidence"):
+        simulator.required_positions(service_level=0.8, confidence=1)
@@ -20,6 +20,7 @@ def test_get_params_roundtrip():
         "asa": 20 / 60,
         "interval": 30,
         "shrinkage": 0.3,
+        "method": "exact",
     }
     # The params can rebuild an equivalent estimator.
     clone = ErlangC(**params)
@@ -1,6 +1,7 @@
-from pyworkforce.utils.frames import results_to_dataframe
-from pyworkforce.utils.grid import ParameterGrid
+from pyworkforce.utils.frames import ColumnarResults, results_to_dataframe
+from pyworkforce.utils.grid import ParameterGrid, ParameterSampler
 from pyworkforce.utils.validation import (
+    check_array,
     check_in_range,
     check_positive_float,
     check_positive_integer,
@@ -8,8 +9,11 @@ from pyworkforce.utils.validation import (
 
 __all__ = [
     "ParameterGrid",
+    "ParameterSampler",
     "results_to_dataframe",
+    "ColumnarResults",
     "check_positive_integer",
     "check_positive_float",
     "check_in_range",
+    "check_array",
 ]
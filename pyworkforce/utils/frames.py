@@ -1,5 +1,69 @@
 """Helpers to turn solver results into tidy :class:`pandas.DataFrame` objects."""
 
+import numpy as np
+
+
+class ColumnarResults:
+    """Column-oriented results of a ``Multi*`` method.
+
+    Returned instead of a list of dictionaries when a ``Multi*`` estimator is
+    built with ``output="columns"``. Every result key is one NumPy array, and
+    each parameter is stored once as integer codes into its distinct values,
+    so a million scenarios take a few arrays instead of a million
+    dictionaries. Pass it to :func:`results_to_dataframe` to get a
+    :class:`pandas.DataFrame` without copying the columns.
+
+    Parameters
+    ----------
+    codes : dict of str to numpy.ndarray
+        For each estimator and method parameter, the index of its value in
+        ``categories`` for every scenario; ``-1`` marks a scenario that does
+        not define the parameter.
+    categories : dict of str to list
+        Distinct values of each parameter.
+    columns : dict of str to numpy.ndarray
+        Result values for every scenario. Scalar results are stored under
+        ``result``; result keys that collide with a parameter name are
+        suffixed with ``_result``.
+
+    Examples
+    --------
+    >>> from pyworkforce.queuing import MultiErlangC
+    >>> grid = {"transactions": [100, 200], "aht": [3], "interval": [30], "asa": [20 / 60]}
+    >>> multi = MultiErlangC(param_grid=grid, n_jobs=1, output="columns")
+    >>> results = multi.required_positions({"service_level": [0.8, 0.9]})
+    >>> results["raw_positions"].tolist()
+    [14, 15, 24, 26]
+    >>> results["transactions"].tolist()
+    [100, 100, 200, 200]
+    """
+
+    def __init__(self, codes, categories, columns):
+        self.codes = codes
+        self.categories = categories
+        self.columns = columns
+
+    def __len__(self):
+        for values in (*self.columns.values(), *self.codes.values()):
+            return len(values)
+        return 0
+
+    def keys(self):
+        """Parameter names followed by result names."""
+        return [*self.codes, *self.columns]
+
+    def __getitem__(self, name):
+        """Values of a parameter or result column, one per scenario."""
+        if name in self.columns:
+            return self.columns[name]
+        codes = self.codes[name]
+        if (codes < 0).any():
+            return np.array(self.categories[name] + [None], dtype=object)[codes]
+        return np.asarray(self.categories[name])[codes]
+
+    def __repr__(self):
+        return f"{type(self).__name__}(n_results={len(self)}, keys={self.keys()!r})"
+
 
 def results_to_dataframe(results, params=None):
     """Combine grid results (and the parameters that produced them) into a frame.
@@ -11,13 +75,17 @@ def results_to_dataframe(results, params=None):
 
     Parameters
     ----------
-    results : list
+    results : list or ColumnarResults
         The list returned by a ``Multi*`` method. Each element may be a
         dictionary (e.g. ``required_positions``) or a scalar (e.g.
         ``service_level``); scalars are placed in a ``result`` column.
+        :class:`ColumnarResults` are wrapped directly: parameters become
+        categorical columns built from the stored codes and result columns
+        are not copied.
     params : list, optional
         The matching ``*_params`` list of ``(estimator_params, method_params)``
-        tuples. When provided, those parameters become leading columns.
+        tuples. When provided, those parameters become leading columns. Not
+        used with :class:`ColumnarResults`, which already hold the parameters.
 
     Returns
     -------
@@ -42,6 +110,14 @@ def results_to_dataframe(results, params=None):
     """
     import pandas as pd
 
+    if isinstance(results, ColumnarResults):
+        if params is not None:
+            raise ValueError("params must be None for ColumnarResults, which already hold the parameters")
+        data = {name: pd.Categorical.from_codes(codes, categories=results.categories[name])
+                for name, codes in results.codes.items()}
+        data.update(results.columns)
+        return pd.DataFrame(data, copy=False)
+
     rows = []
     if params is not None and len(params) != len(results):
         raise ValueError(
@@ -1,10 +1,12 @@
-import operator
+from bisect import bisect_right
 from collections.abc import Iterable, Mapping
-from functools import partial, reduce
 from itertools import product
+from numbers import Integral, Real
 
 import numpy as np
 
+from pyworkforce.utils.validation import check_positive_integer
+
 
 class ParameterGrid:
     """
@@ -48,6 +50,24 @@ class ParameterGrid:
 
         self.param_grid = param_grid
 
+        # Sorted keys, value lists and strides of every sub-grid, computed once
+        # so that indexing is O(number of keys). The last key cycles fastest.
+        self._sub_grids = []
+        self._starts = []
+        size = 0
+        for grid in param_grid:
+            keys = sorted(grid)
+            values = [list(grid[key]) for key in keys]
+            strides = []
+            stride = 1
+            for value_list in reversed(values):
+                strides.append(stride)
+                stride *= len(value_list)
+            self._sub_grids.append((keys, values, strides[::-1], stride))
+            self._starts.append(size)
+            size += stride
+        self._size = size
+
     def __iter__(self):
         """Iterate over the points in the grid.
         Returns
@@ -69,46 +89,210 @@ class ParameterGrid:
 
     def __len__(self):
         """Number of points on the grid."""
-        # Product function that can handle iterables (np.product can't).
-        product = partial(reduce, operator.mul)
-        return sum(product(len(v) for v in p.values()) if p else 1
-                   for p in self.param_grid)
+        return self._size
 
     def __getitem__(self, ind):
         """Get the parameters that would be ``ind``th in iteration
         Parameters
         ----------
-        ind : int
-            The iteration index
+        ind : int, slice or array-like of int
+            The iteration index. Negative indices count from the end.
         Returns
         -------
-        params : dict of str to any
-            Equal to list(self)[ind]
+        params : dict of str to any, or list of such
+            Equal to ``list(self)[ind]``. Slices and index arrays return a
+            list with one dictionary per selected point.
         """
-        # This is used to make discrete sampling without replacement memory
-        # efficient.
-        for sub_grid in self.param_grid:
-            # XXX: could memoize information used here
-            if not sub_grid:
-                if ind == 0:
-                    return {}
+        if isinstance(ind, slice):
+            return [self._point(i) for i in range(*ind.indices(self._size))]
+        if isinstance(ind, Integral) and not isinstance(ind, bool):
+            return self._point(self._check_index(ind))
+
+        indices = np.asarray(ind)
+        if indices.ndim != 1 or not np.issubdtype(indices.dtype, np.integer):
+            raise TypeError(f"ParameterGrid indices must be integers, slices or 1-d integer arrays, "
+                            f"got {ind!r}")
+        return [self._point(self._check_index(int(i))) for i in indices]
+
+    def _check_index(self, ind):
+        if ind < 0:
+            ind += self._size
+        if not 0 <= ind < self._size:
+            raise IndexError('ParameterGrid index out of range')
+        return ind
+
+    def _point(self, ind):
+        # Sub-grids with no points share their start with the next one, so
+        # the rightmost start not after ``ind`` is always a non-empty grid.
+        grid = bisect_right(self._starts, ind) - 1
+        keys, values, strides, size = self._sub_grids[grid]
+        ind -= self._starts[grid]
+        return {key: value_list[(ind // stride) % len(value_list)]
+                for key, value_list, stride in zip(keys, values, strides)}
+
+    def as_columns(self):
+        """Every point of the grid as NumPy columns.
+
+        Returns
+        -------
+        dict of str to numpy.ndarray
+            One array of length ``len(self)`` per parameter, in iteration
+            order, so that ``{key: column[i] ...}`` equals ``self[i]``.
+            Parameters missing from some sub-grids hold ``None`` there.
+        """
+        names = list(dict.fromkeys(key for keys, _, _, _ in self._sub_grids for key in keys))
+        pieces = {name: [] for name in names}
+        for keys, values, strides, size in self._sub_grids:
+            for name in names:
+                if name in keys:
+                    position = keys.index(name)
+                    column = _as_array(values[position])
+                    repeats = strides[position]
+                    cycles = size // (repeats * len(column)) if len(column) else 0
+                    pieces[name].append(np.tile(np.repeat(column, repeats), cycles))
                 else:
-                    ind -= 1
-                    continue
+                    pieces[name].append(np.full(size, None, dtype=object))
+        return {name: np.concatenate(columns) for name, columns in pieces.items()}
 
-            # Reverse so most frequent cycling parameter comes first
-            keys, values_lists = zip(*sorted(sub_grid.items())[::-1])
-            sizes = [len(v_list) for v_list in values_lists]
-            total = np.prod(sizes)
 
-            if ind >= total:
-                # Try the next grid
-                ind -= total
-            else:
-                out = {}
-                for key, v_list, n in zip(keys, values_lists, sizes):
-                    ind, offset = divmod(ind, n)
-                    out[key] = v_list[offset]
-                return out
+def _as_array(values):
+    """1-d array of ``values``, falling back to ``object`` when NumPy would coerce them."""
+    array = np.asarray(values)
+    if array.ndim != 1 or (array.dtype.kind in "US" and not all(isinstance(v, str) for v in values)):
+        array = np.empty(len(values), dtype=object)
+        for position, value in enumerate(values):
+            array[position] = value
+    return array
+
+
+class ParameterSampler:
+    """
+    Random, Latin hypercube or Sobol samples of a parameter space.
+
+    A companion of :class:`ParameterGrid` for scenario spaces too large to
+    enumerate. Points are drawn directly from the distribution of each
+    parameter, so the underlying grid is never materialized. It can be passed
+    anywhere the ``Multi*`` estimators accept a ``param_grid``.
+
+    Parameters
+    ----------
+    param_distributions : dict or ParameterGrid
+        Dictionary mapping each parameter to:
+
+        - a list (or any non-tuple iterable) of discrete choices, drawn with
+          equal probability;
+        - a ``(low, high)`` tuple, drawn uniformly from the continuous range;
+        - an object with a ``ppf`` method, such as a frozen
+          ``scipy.stats`` distribution, sampled through its quantile function.
+
+        A :class:`ParameterGrid` samples whole grid points by index instead,
+        which also supports lists of grids.
+    n_iter : int
+        Number of points to draw.
+    method : {"random", "lhs", "sobol"}, default="random"
+        ``"random"`` draws independent uniform samples. ``"lhs"`` uses Latin
+        hypercube sampling: every parameter is split into ``n_iter`` strata of
+        equal probability and each stratum is drawn exactly once.
+        ``"sobol"`` uses a scrambled Sobol low-discrepancy sequence and
+        requires SciPy; use a power of two for ``n_iter`` to keep its balance
+        properties.
+    random_state : int, numpy.random.Generator or None, default=None
+        Seed of the sampling. With an int, every iteration yields the same
+        points.
+
+    Examples
+    --------
+    >>> from pyworkforce.utils import ParameterSampler
+    >>> sampler = ParameterSampler({"transactions": (100, 500), "aht": [3, 4],
+    ...                             "interval": [30], "asa": [20 / 60]},
+    ...                            n_iter=4, method="lhs", random_state=0)
+    >>> len(list(sampler))
+    4
+    """
+
+    _methods = ("random", "lhs", "sobol")
+
+    def __init__(self, param_distributions, n_iter, method="random", random_state=None):
+        check_positive_integer("n_iter", n_iter)
+        if method not in self._methods:
+            raise ValueError(f"method must be one of {self._methods}, got {method!r}")
+
+        if isinstance(param_distributions, ParameterGrid):
+            if not len(param_distributions):
+                raise ValueError("param_distributions must contain at least one grid point")
+        elif isinstance(param_distributions, Mapping):
+            for key, values in param_distributions.items():
+                _check_distribution(key, values)
+        else:
+            raise TypeError(f"param_distributions must be a dict or a ParameterGrid, "
+                            f"got {param_distributions!r}")
+
+        self.param_distributions = param_distributions
+        self.n_iter = n_iter
+        self.method = method
+        self.random_state = random_state
+
+    def __len__(self):
+        """Number of points that will be sampled."""
+        return self.n_iter
+
+    def __iter__(self):
+        """Yield ``n_iter`` dictionaries of sampled parameters."""
+        rng = np.random.default_rng(self.random_state)
+
+        if isinstance(self.param_distributions, ParameterGrid):
+            grid = self.param_distributions
+            unit = self._unit_samples(rng, 1)[:, 0]
+            indices = np.minimum((unit * len(grid)).astype(np.int64), len(grid) - 1)
+            yield from grid[indices]
+            return
+
+        # Always sort the keys of a dictionary, for reproducibility
+        items = sorted(self.param_distributions.items())
+        unit = self._unit_samples(rng, len(items))
+        columns = [_from_unit(values, unit[:, dimension]) for dimension, (_, values) in enumerate(items)]
+        keys = [key for key, _ in items]
+        for point in zip(*columns):
+            yield dict(zip(keys, point))
+
+    def _unit_samples(self, rng, dimensions):
+        """``n_iter`` points in the unit hypercube ``[0, 1) ** dimensions``."""
+        if self.method == "random":
+            return rng.random((self.n_iter, dimensions))
+        if self.method == "lhs":
+            strata = np.argsort(rng.random((self.n_iter, dimensions)), axis=0)
+            return (strata + rng.random((self.n_iter, dimensions))) / self.n_iter
+
+        try:
+            from scipy.stats import qmc
+        except ImportError as error:
+            raise ImportError("method='sobol' requires SciPy; install it with 'pip install scipy' "
+                              "or use method='lhs'") from error
+        return qmc.Sobol(d=max(dimensions, 1), scramble=True, seed=rng).random(self.n_iter)[:, :dimensions]
+
+
+def _check_distribution(key, values):
+    if isinstance(values, tuple):
+        if (len(values) != 2 or not all(isinstance(v, Real) and not isinstance(v, bool) for v in values)
+                or not values[0] < values[1]):
+            raise ValueError(f"range for {key!r} must be a (low, high) tuple with low < high, got {values!r}")
+    elif hasattr(values, "ppf"):
+        return True
+    elif not isinstance(values, Iterable) or isinstance(values, str):
+        raise TypeError(f"distribution for {key!r} must be a list, a (low, high) tuple or have a ppf "
+                        f"method, got {values!r}")
+    elif not len(list(values)):
+        raise ValueError(f"choices for {key!r} must not be empty")
+    return True
+
 
-        raise IndexError('ParameterGrid index out of range')
+def _from_unit(values, unit):
+    """Map uniform samples in ``[0, 1)`` to values of one parameter distribution."""
+    if isinstance(values, tuple):
+        low, high = values
+        return (low + unit * (high - low)).tolist()
+    if hasattr(values, "ppf"):
+        return np.asarray(values.ppf(unit), dtype=float).tolist()
+    choices = list(values)
+    indices = np.minimum((unit * len(choices)).astype(np.int64), len(choices) - 1)
+    return [choices[index] for index in indices]
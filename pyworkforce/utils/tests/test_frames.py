@@ -1,7 +1,9 @@
+import numpy as np
+import pandas as pd
 import pytest
 
 from pyworkforce.queuing import MultiErlangC
-from pyworkforce.utils import results_to_dataframe
+from pyworkforce.utils import ColumnarResults, results_to_dataframe
 
 
 def test_results_to_dataframe_without_params():
@@ -44,3 +46,46 @@ def test_results_to_dataframe_preserves_colliding_keys():
 def test_results_to_dataframe_length_mismatch_raises():
     with pytest.raises(ValueError):
         results_to_dataframe([{"a": 1}], params=[])
+
+
+@pytest.mark.parametrize("backend", ["vectorized", "joblib"])
+def test_columnar_results_match_list_results(backend):
+    grid = {"transactions": [100, 150], "aht": [3], "interval": [30],
+            "asa": [20 / 60], "shrinkage": [0.0, 0.3]}
+    arguments_grid = {"service_level": [0.8, 0.9], "max_occupancy": [0.85]}
+    rows = MultiErlangC(param_grid=grid, n_jobs=1, backend=backend)
+    columns = MultiErlangC(param_grid=grid, n_jobs=1, backend=backend, output="columns")
+
+    expected = results_to_dataframe(rows.required_positions(arguments_grid), rows.required_positions_params)
+    results = columns.required_positions(arguments_grid)
+    df = results_to_dataframe(results)
+
+    assert isinstance(results, ColumnarResults)
+    assert columns.required_positions_params is None
+    assert len(results) == 8
+    assert df["transactions"].dtype == "category"
+    pd.testing.assert_frame_equal(df.astype(expected.dtypes.to_dict()), expected[df.columns],
+                                  check_exact=False, rtol=1e-12)
+
+
+def test_columnar_results_scalar_results_and_access():
+    grid = {"transactions": [100, 150], "aht": [3], "interval": [30], "asa": [20 / 60]}
+    results = MultiErlangC(param_grid=grid, n_jobs=1, output="columns").service_level({"positions": [16, 18]})
+
+    assert results.keys() == ["aht", "asa", "interval", "transactions", "positions", "result"]
+    assert results["transactions"].tolist() == [100, 100, 150, 150]
+    assert results["positions"].tolist() == [16, 18, 16, 18]
+    assert results.codes["positions"].tolist() == [0, 1, 0, 1]
+    assert np.shares_memory(results_to_dataframe(results)["result"].to_numpy(), results["result"])
+
+
+def test_columnar_results_reject_params():
+    results = ColumnarResults({}, {}, {"result": np.array([0.5])})
+    with pytest.raises(ValueError, match="params must be None"):
+        results_to_dataframe(results, params=[({}, {})])
+
+
+def test_multi_estimators_reject_unknown_output():
+    with pytest.raises(ValueError, match="output must be one of"):
+        MultiErlangC(param_grid={"transactions": [100], "aht": [3], "interval": [30], "asa": [0.3]},
+                     output="arrow")
@@ -1,6 +1,7 @@
 from collections.abc import Iterable, Sized
 from itertools import chain, product
 
+import numpy as np
 import pytest
 
 from pyworkforce.utils import ParameterGrid
@@ -82,3 +83,48 @@ def test_wrong_parameter_grid():
         grid = ParameterGrid(params)
         for grid in params:
             assert str(excinfo.value) == f'Parameter grid is not a dict or a list ({params!r})'
+
+
+def test_parameter_grid_negative_slice_and_array_indexing():
+    grid = ParameterGrid([{"a": [1, 2], "b": [3, 4, 5]}, {}, {"c": ["x", "y"]}])
+    points = list(grid)
+
+    assert grid[-1] == points[-1] == {"c": "y"}
+    assert grid[1:8:3] == points[1:8:3]
+    assert grid[::-1] == points[::-1]
+    assert grid[[0, 6, -2]] == [points[0], points[6], points[-2]]
+    assert grid[np.array([7, 2])] == [points[7], points[2]]
+    with pytest.raises(IndexError):
+        grid[len(grid)]
+    with pytest.raises(IndexError):
+        grid[[0, -len(grid) - 1]]
+    with pytest.raises(TypeError):
+        grid[0.5]
+
+
+def test_parameter_grid_skips_sub_grids_without_points():
+    grid = ParameterGrid([{"a": []}, {"a": [1], "b": [2, 3]}])
+
+    assert len(grid) == 2
+    assert_grid_iter_equals_getitem(grid)
+
+
+def test_parameter_grid_as_columns():
+    grid = ParameterGrid([{"transactions": [100, 200], "aht": [3.0, 4.5], "method": ["exact"]},
+                          {"transactions": [300], "aht": [2.0]}])
+    columns = grid.as_columns()
+
+    assert list(columns) == ["aht", "method", "transactions"]
+    assert columns["transactions"].tolist() == [100, 200, 100, 200, 300]
+    assert columns["aht"].dtype == float
+    assert columns["method"].tolist() == ["exact"] * 4 + [None]
+    for index, point in enumerate(grid):
+        assert {key: column[index] for key, column in columns.items() if column[index] is not None} == point
+
+
+def test_parameter_grid_indexes_huge_grids():
+    grid = ParameterGrid({name: list(range(100)) for name in "abcde"})
+
+    assert len(grid) == 100 ** 5
+    assert grid[-1] == {name: 99 for name in "abcde"}
+    assert grid[123456789] == {"a": 1, "b": 23, "c": 45, "d": 67, "e": 89}
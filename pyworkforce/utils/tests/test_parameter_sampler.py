@@ -0,0 +1,100 @@
+import sys
+
+import numpy as np
+import pytest
+
+from pyworkforce.queuing import MultiErlangC
+from pyworkforce.utils import ParameterGrid, ParameterSampler
+
+
+class Exponential:
+    """Minimal stand-in for a frozen ``scipy.stats`` distribution."""
+
+    def __init__(self, scale):
+        self.scale = scale
+
+    def ppf(self, q):
+        return -self.scale * np.log1p(-np.asarray(q))
+
+
+def test_parameter_sampler_draws_from_each_distribution():
+    sampler = ParameterSampler({"transactions": (100, 500), "aht": [3, 4.5], "patience": Exponential(5)},
+                               n_iter=50, random_state=0)
+    points = list(sampler)
+
+    assert len(sampler) == len(points) == 50
+    assert all(sorted(point) == ["aht", "patience", "transactions"] for point in points)
+    assert all(100 <= point["transactions"] < 500 and type(point["transactions"]) is float for point in points)
+    assert {point["aht"] for point in points} == {3, 4.5}
+    assert all(point["patience"] >= 0 for point in points)
+
+
+def test_parameter_sampler_is_reproducible():
+    distributions = {"transactions": (100, 500), "aht": [3, 4]}
+    first = ParameterSampler(distributions, n_iter=5, method="lhs", random_state=3)
+
+    assert list(first) == list(first) == list(ParameterSampler(distributions, 5, method="lhs", random_state=3))
+    assert list(first) != list(ParameterSampler(distributions, 5, method="lhs", random_state=4))
+
+
+def test_parameter_sampler_lhs_stratifies_every_parameter():
+    n_iter = 40
+    points = list(ParameterSampler({"a": (0, 1), "b": (10, 20), "c": list(range(n_iter))},
+                                   n_iter=n_iter, method="lhs", random_state=0))
+
+    for name, low, high in (("a", 0, 1), ("b", 10, 20)):
+        strata = np.floor((np.array([point[name] for point in points]) - low) / (high - low) * n_iter)
+        assert sorted(strata.tolist()) == list(range(n_iter))
+    assert sorted(point["c"] for point in points) == list(range(n_iter))
+
+
+def test_parameter_sampler_samples_grid_points():
+    grid = ParameterGrid([{"a": list(range(1000)), "b": list(range(1000))}, {"c": ["x", "y"]}])
+    points = list(ParameterSampler(grid, n_iter=100, method="lhs", random_state=0))
+
+    assert len(points) == 100
+    for point in points:
+        index = point["a"] * 1000 + point["b"] if "a" in point else len(grid) - 2 + "xy".index(point["c"])
+        assert grid[index] == point
+
+
+def test_parameter_sampler_sobol():
+    pytest.importorskip("scipy")
+    points = list(ParameterSampler({"a": (0, 1), "b": [1, 2]}, n_iter=8, method="sobol", random_state=0))
+
+    assert len(points) == 8
+    assert sorted(np.floor(np.array([point["a"] for point in points]) * 8).tolist()) == list(range(8))
+
+
+def test_parameter_sampler_sobol_requires_scipy(monkeypatch):
+    monkeypatch.setitem(sys.modules, "scipy.stats", None)
+    sampler = ParameterSampler({"a": (0, 1)}, n_iter=4, method="sobol")
+
+    with pytest.raises(ImportError, match="requires SciPy"):
+        list(sampler)
+
+
+@pytest.mark.parametrize("kwargs, error, message", [
+    ({"n_iter": 0}, ValueError, "n_iter must be a positive integer"),
+    ({"method": "grid"}, ValueError, "method must be one of"),
+    ({"param_distributions": {"a": (1, 1)}}, ValueError, "range for 'a' must be a (low, high) tuple"),
+    ({"param_distributions": {"a": (0, 1, 2)}}, ValueError, "range for 'a'"),
+    ({"param_distributions": {"a": []}}, ValueError, "choices for 'a' must not be empty"),
+    ({"param_distributions": {"a": 4}}, TypeError, "distribution for 'a'"),
+    ({"param_distributions": [{"a": [1]}]}, TypeError, "param_distributions must be"),
+])
+def test_parameter_sampler_invalid_arguments(kwargs, error, message):
+    arguments = {"param_distributions": {"a": [1, 2]}, "n_iter": 3, **kwargs}
+    with pytest.raises(error) as excinfo:
+        ParameterSampler(**arguments)
+    assert message in str(excinfo.value)
+
+
+def test_multi_erlang_accepts_parameter_sampler():
+    sampler = ParameterSampler({"transactions": (100, 300), "aht": [3, 4], "interval": [30], "asa": [20 / 60]},
+                               n_iter=6, method="lhs", random_state=0)
+    multi = MultiErlangC(param_grid=sampler, n_jobs=1)
+    results = multi.required_positions({"service_level": [0.8]})
+
+    assert [params for params, _ in multi.required_positions_params] == list(sampler)
+    assert len(results) == 6
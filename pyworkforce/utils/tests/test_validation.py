@@ -1,6 +1,7 @@
 import pytest
 
 from pyworkforce.utils.validation import (
+    check_array,
     check_in_range,
     check_positive_float,
     check_positive_integer,
@@ -51,3 +52,16 @@ def test_error_message_includes_parameter_name():
     with pytest.raises(ValueError) as excinfo:
         check_positive_integer("num_days", -1)
     assert "num_days" in str(excinfo.value)
+
+
+def test_check_array_returns_float_array():
+    values = check_array("x", [1, 2, 3], check_positive_float)
+    assert values.dtype == float
+    assert values.tolist() == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.parametrize("values", [[1, -1], [0.5, float("nan")], ["a", "b"], [True, False]])
+def test_check_array_rejects_invalid(values):
+    with pytest.raises(ValueError) as excinfo:
+        check_array("x", values, check_in_range, 0, 1)
+    assert "x must be" in str(excinfo.value)
@@ -106,3 +106,47 @@ def check_in_range(name, value, low, high, include_low=True, include_high=True):
             f"{name} must be in the interval {left}{low}, {high}{right}, got {value!r}"
         )
     return True
+
+
+def check_array(name, values, check, *args, **kwargs):
+    """Apply a scalar ``check_*`` helper to every element of an array-like.
+
+    The scalar helpers only validate interval membership and finiteness, so it
+    is enough to check the non-finite entries and the extreme values; this keeps
+    validation of large arrays vectorized.
+
+    Parameters
+    ----------
+    name : str
+        Name of the parameter, used to build the error message.
+    values : array-like
+        Scalar or array of numbers to validate.
+    check : callable
+        One of :func:`check_positive_float` or :func:`check_in_range`.
+    *args, **kwargs
+        Extra arguments forwarded to ``check`` (e.g. interval bounds).
+
+    Returns
+    -------
+    numpy.ndarray
+        The validated values as a float array.
+
+    Raises
+    ------
+    ValueError
+        If ``values`` is not numeric or any element fails ``check``.
+    """
+    import numpy as np
+
+    array = np.asarray(values)
+    if array.dtype == bool or not np.issubdtype(array.dtype, np.number):
+        raise ValueError(f"{name} must be numeric, got values of dtype {array.dtype}")
+    array = array.astype(float)
+
+    non_finite = ~np.isfinite(array)
+    if non_finite.any():
+        check(name, float(array[non_finite].flat[0]), *args, **kwargs)
+    if array.size:
+        check(name, float(array.min()), *args, **kwargs)
+        check(name, float(array.max()), *args, **kwargs)
+    return array